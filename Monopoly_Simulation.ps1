@@ -31,25 +31,23 @@ function run_setup {
 }
 
 # Run the main.py script
-function run_main($mode) {
+function run_main($arguments) {
     Write-Host -ForegroundColor 'Green' "Running main.py`n"
     Start-Sleep -s 3
     Clear-Host
-    python.exe ./main.py $mode
+    python.exe ./main.py @arguments
 }
 
 # Run the whole project
 function run($arguments) {
     if($arguments.Count -lt 1){
-        Write-Host -ForegroundColor 'Red' "Missing Argument! Usage: .\Monopoly_Simulation.ps1 [Number of Rounds]`n"
-    } elseif ( $arguments.Count -eq 1 ){
+        Write-Host -ForegroundColor 'Red' "Missing Argument! Usage: .\Monopoly_Simulation.ps1 [Number of Rounds] [Options]`n"
+    } else {
         check_for_virtual_environment
         activate_virtual_environment
         get_virtual_environment
         run_setup
         run_main($arguments)
-    } else {
-        Write-Host -ForegroundColor 'Red' "Too many arguments! Usage: .\Monopoly_Simulation.ps1 [Number of Rounds]`n"
     }
 }
 
@@ -0,0 +1,228 @@
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from game_statistics.game_statistics import GameStatistics
+from game_statistics.plot_mode import PlotMode
+from monopoly.board.board import Board
+from monopoly.deck.cards.card import Card
+from monopoly.deck.cards.card_action_types import CardActionType
+from monopoly.deck.deck import Deck
+from monopoly.dice.dice import Dice
+from monopoly.events.verbosity import Verbosity
+from monopoly.history.round_history import RoundHistory
+from monopoly.player.player import Player
+from utils.setup import create_output_directory
+
+# Benchmark Result with name, parameters, seconds, rate and rate unit
+BenchmarkResult = Dict[str, Any]
+
+DATA_DIRECTORY: str = os.path.join(os.getcwd(), 'monopoly', 'data')
+BOARD_DATA: str = os.path.join(DATA_DIRECTORY, 'board_data.txt')
+CHANCES_DATA: str = os.path.join(DATA_DIRECTORY, 'chances_data.txt')
+COMMUNITY_CHESTS_DATA: str = os.path.join(
+    DATA_DIRECTORY, 'community_chest_data.txt'
+)
+
+
+def measure(
+    name: str,
+    parameters: Dict[str, Any],
+    function: Callable[[], int],
+    unit: str,
+    repeats: int = 3
+) -> BenchmarkResult:
+    """Time function and keep the fastest of repeated runs.
+
+    Args:
+        name (str): Benchmark name.
+        parameters (Dict[str, Any]): Benchmark parameters.
+        function (Callable[[], int]): Benchmarked function returning the
+        amount of work done.
+        unit (str): Unit of work done.
+        repeats (int, optional): Number of timed runs. Defaults to 3.
+
+    Returns:
+        BenchmarkResult: Fastest run.
+    """
+    best_seconds: float = float('inf')
+    work: int = 0
+
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        work = function()
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+
+    return {
+        'name': name,
+        'parameters': parameters,
+        'seconds': best_seconds,
+        'rate': work / best_seconds,
+        'unit': f'{unit}/s'
+    }
+
+
+def benchmark_player_rounds(rounds: int, seed: int = 0) -> BenchmarkResult:
+    """Benchmark turns of a single Player.
+
+    Args:
+        rounds (int): Number of rounds (Crossing the GO tile).
+        seed (int, optional): Seed of every run. Defaults to 0.
+
+    Returns:
+        BenchmarkResult: Turns per second of Player.execute_round.
+    """
+    board: Board = Board(file=BOARD_DATA)
+
+    def run() -> int:
+        seeds: List[np.random.SeedSequence] = (
+            np.random.SeedSequence(seed).spawn(3)
+        )
+        chances: Deck = Deck(CHANCES_DATA, np.random.default_rng(seeds[0]))
+        community_chests: Deck = Deck(
+            COMMUNITY_CHESTS_DATA, np.random.default_rng(seeds[1])
+        )
+        player: Player = Player(
+            dice=Dice(rng=np.random.default_rng(seeds[2]))
+        )
+        visits: np.ndarray = np.zeros(len(board.tiles), dtype=np.int64)
+        round_history: RoundHistory = RoundHistory(
+            columns=len(board.tiles),
+            group_ids=board.group_ids
+        )
+        turns: int = 0
+
+        while player.crossed_go_tile < rounds:
+            player.execute_round(
+                board=board,
+                chances=chances,
+                community_chests=community_chests,
+                visits=visits,
+                round_history=round_history
+            )
+            turns += 1
+
+        return turns
+
+    return measure(
+        'player_rounds', {'rounds': rounds}, run, 'turns', repeats=1
+    )
+
+
+def benchmark_deck_draws(draws: int) -> BenchmarkResult:
+    """Benchmark drawing Cards with reshuffles.
+
+    Args:
+        draws (int): Number of drawn Cards.
+
+    Returns:
+        BenchmarkResult: Draws per second of Deck.draw_card.
+    """
+    deck: Deck = Deck(CHANCES_DATA, np.random.default_rng(0))
+
+    def run() -> int:
+        for _ in range(draws):
+            card: Card = deck.draw_card()
+
+            # Held Cards are returned at once to keep the Deck full
+            if card.card_type == CardActionType.GET_OUT_OF_JAIL:
+                deck.discard_card(card)
+
+        return draws
+
+    return measure('deck_draws', {'draws': draws}, run, 'draws')
+
+
+def benchmark_board_construction(boards: int) -> BenchmarkResult:
+    """Benchmark Board construction from the data file.
+
+    Args:
+        boards (int): Number of constructed Boards.
+
+    Returns:
+        BenchmarkResult: Boards built per second.
+    """
+    def run() -> int:
+        for _ in range(boards):
+            Board(file=BOARD_DATA)
+
+        return boards
+
+    return measure(
+        'board_construction', {'boards': boards}, run, 'boards'
+    )
+
+
+def benchmark_cold_start(starts: int) -> BenchmarkResult:
+    """Benchmark startup of a simulate-only run in a fresh interpreter.
+
+    The run fails when starting the simulation imports pandas or plotly.
+
+    Args:
+        starts (int): Number of started interpreters.
+
+    Returns:
+        BenchmarkResult: Interpreter starts per second.
+    """
+    command: List[str] = [
+        sys.executable,
+        '-c',
+        'import sys\n'
+        'import game_statistics.game_statistics\n'
+        'import monopoly.engine.replicate_runner\n'
+        'sys.exit(any(module in sys.modules for module in '
+        '("pandas", "plotly")))'
+    ]
+
+    def run() -> int:
+        for _ in range(starts):
+            subprocess.run(command, check=True, cwd=os.getcwd())
+
+        return starts
+
+    return measure('cold_start', {'starts': starts}, run, 'starts')
+
+
+def benchmark_pipeline(
+    rounds: int,
+    plot_mode: PlotMode,
+    output_file: str
+) -> BenchmarkResult:
+    """Benchmark the whole Game Statistics pipeline.
+
+    Args:
+        rounds (int): Number of rounds (Crossing the GO tile).
+        plot_mode (PlotMode): Plot Mode, never interactive.
+        output_file (str): Game Statistics output file path.
+
+    Returns:
+        BenchmarkResult: Rounds per second of GameStatistics.__call__.
+    """
+    create_output_directory(os.path.join(os.getcwd(), 'output', 'plots'))
+
+    def run() -> int:
+        GameStatistics(
+            board_data=BOARD_DATA,
+            chances_data=CHANCES_DATA,
+            community_chests_data=COMMUNITY_CHESTS_DATA,
+            output_file=output_file,
+            timestamp='benchmark',
+            rounds=rounds,
+            verbosity=Verbosity.SILENT,
+            seed=0,
+            plot_mode=plot_mode
+        )()
+
+        return rounds
+
+    return measure(
+        'pipeline',
+        {'rounds': rounds, 'plots': plot_mode.name.lower()},
+        run,
+        'rounds',
+        repeats=1
+    )
@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.benchmarks import (
+    BenchmarkResult,
+    benchmark_board_construction,
+    benchmark_cold_start,
+    benchmark_deck_draws,
+    benchmark_pipeline,
+    benchmark_player_rounds
+)
+from game_statistics.plot_mode import PlotMode
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run_benchmarks',
+        description='Benchmark simulation and reporting hot paths.'
+    )
+
+    parser.add_argument(
+        '--rounds',
+        type=int,
+        nargs='+',
+        default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+        help='Round counts of the Player and pipeline benchmarks.'
+    )
+    parser.add_argument(
+        '--output',
+        default=os.path.join('output', 'benchmarks.json'),
+        help='JSON file the results are written to.'
+    )
+    parser.add_argument(
+        '--baseline',
+        default=os.path.join('benchmarks', 'baseline.json'),
+        help='JSON file with results to compare against.'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Allowed relative slowdown before a result is a regression.'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Store the results as the new baseline.'
+    )
+
+    return parser.parse_args()
+
+
+def run_benchmarks(rounds: List[int]) -> List[BenchmarkResult]:
+    """Run every benchmark.
+
+    Args:
+        rounds (List[int]): Round counts of the Player and pipeline
+        benchmarks.
+
+    Returns:
+        List[BenchmarkResult]: Benchmark Results.
+    """
+    results: List[BenchmarkResult] = [
+        benchmark_board_construction(boards=100),
+        benchmark_deck_draws(draws=100000),
+        benchmark_cold_start(starts=5)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        output_file: str = os.path.join(directory, 'output.txt')
+
+        # Warm up imports and caches, the result is discarded
+        benchmark_pipeline(
+            rounds=100,
+            plot_mode=PlotMode.HEADLESS,
+            output_file=output_file
+        )
+
+        for count in rounds:
+            results.append(benchmark_player_rounds(rounds=count))
+
+            for plot_mode in [PlotMode.NONE, PlotMode.HEADLESS]:
+                results.append(
+                    benchmark_pipeline(
+                        rounds=count,
+                        plot_mode=plot_mode,
+                        output_file=output_file
+                    )
+                )
+
+    return results
+
+
+def result_key(result: BenchmarkResult) -> Tuple[str, str]:
+    """Return key identifying a benchmark across runs.
+
+    Args:
+        result (BenchmarkResult): Benchmark Result.
+
+    Returns:
+        Tuple[str, str]: Benchmark name and parameters.
+    """
+    return result['name'], json.dumps(result['parameters'], sort_keys=True)
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: List[BenchmarkResult],
+    threshold: float
+) -> List[str]:
+    """Compare results against baseline.
+
+    Args:
+        results (List[BenchmarkResult]): Current Benchmark Results.
+        baseline (List[BenchmarkResult]): Baseline Benchmark Results.
+        threshold (float): Allowed relative slowdown.
+
+    Returns:
+        List[str]: Description of every regression.
+    """
+    baseline_rates: Dict[Tuple[str, str], float] = {
+        result_key(result): result['rate'] for result in baseline
+    }
+    regressions: List[str] = []
+
+    for result in results:
+        key: Tuple[str, str] = result_key(result)
+
+        if key not in baseline_rates:
+            continue
+
+        change: float = result['rate'] / baseline_rates[key] - 1
+
+        print(f'{key[0]:<20} {key[1]:<40} {change:+8.1%}')
+
+        if change < -threshold:
+            regressions.append(f'{key[0]} {key[1]}: {change:+.1%}')
+
+    return regressions
+
+
+if __name__ == '__main__':
+
+    arguments: argparse.Namespace = parse_arguments()
+
+    report: Dict[str, Any] = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run_benchmarks(arguments.rounds)
+    }
+
+    os.makedirs(os.path.dirname(arguments.output) or '.', exist_ok=True)
+
+    with open(arguments.output, 'w') as fp:
+        json.dump(report, fp, indent=4)
+
+    for result in report['results']:
+        print(
+            f"{result['name']:<20} "
+            f"{json.dumps(result['parameters']):<40} "
+            f"{result['rate']:>14.1f} {result['unit']}"
+        )
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as fp:
+            json.dump(report, fp, indent=4)
+
+    elif os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as fp:
+            baseline: Dict[str, Any] = json.load(fp)
+
+        regressions: List[str] = compare(
+            report['results'], baseline['results'], arguments.threshold
+        )
+
+        if regressions:
+            print('Regressions:\n' + '\n'.join(regressions))
+            sys.exit(1)
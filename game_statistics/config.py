@@ -12,4 +12,13 @@ line_chart_labels: Dict[str, str] = {
     'variable': 'Group'
 }
 
+# Maximum number of points per line chart series
+line_chart_points: int = 2000
+
+# Number of rounds between convergence checks
+check_interval: int = 1000
+
+# Size limit of the Result Cache in bytes
+cache_size: int = 512 * 2 ** 20
+
 top_10_columns: List[str] = ['Tile', number_of_visits]
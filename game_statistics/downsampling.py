@@ -0,0 +1,153 @@
+from typing import Callable, Iterable, Iterator, Tuple
+
+import numpy as np
+
+# First, last and at least one inner point
+MIN_POINTS: int = 3
+
+
+def bucket_blocks(
+    chunks: Iterable[np.ndarray],
+    edges: np.ndarray
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """Split consecutive blocks of rows at bucket edges.
+
+    Args:
+        chunks (Iterable[np.ndarray]): Consecutive blocks of rows.
+        edges (np.ndarray): Increasing row indices, bucket 'i' holds the rows
+        from edges[i] up to edges[i + 1].
+
+    Yields:
+        Iterator[Tuple[int, int, np.ndarray]]: Bucket, index of the first
+        row and the rows of the bucket found in one block.
+    """
+    bucket: int = 0
+    offset: int = 0
+
+    for chunk in chunks:
+        stop: int = offset + len(chunk)
+        start: int = max(offset, int(edges[0]))
+
+        while bucket < len(edges) - 1 and start < stop:
+            end: int = min(int(edges[bucket + 1]), stop)
+
+            yield bucket, start, chunk[start - offset:end - offset]
+
+            if end == edges[bucket + 1]:
+                bucket += 1
+
+            start = end
+
+        offset = stop
+
+
+def largest_triangle_three_buckets(
+    chunks: Callable[[], Iterable[np.ndarray]],
+    length: int,
+    points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Select points keeping the visual shape of many series (LTTB).
+
+    The first and last points are always kept. Every other point is picked
+    from its own bucket of consecutive points, as the one forming the
+    largest triangle with the previously picked point and the average of the
+    next bucket. Every series is a column of the rows, all of them are
+    downsampled at once in two passes over the blocks, the first one
+    averaging the buckets. Only the rows of a single block are converted to
+    floating point at a time.
+
+    Args:
+        chunks (Callable[[], Iterable[np.ndarray]]): Returns consecutive
+        blocks of rows with shape (block, series), called once per pass.
+        length (int): Total number of rows.
+        points (int): Number of points to keep per series.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Sorted row indices of kept points and
+        their values, both with shape (points, series).
+
+    Raises:
+        ValueError: Fewer than 3 points, the first, last and an inner one.
+    """
+    if points < MIN_POINTS:
+        raise ValueError(
+            f'At least {MIN_POINTS} points must be kept: {points}'
+        )
+
+    # Short series are kept whole
+    if points >= length:
+        values: np.ndarray = np.concatenate(list(chunks()))
+
+        return (
+            np.broadcast_to(np.arange(length)[:, np.newaxis], values.shape),
+            values
+        )
+
+    # First and last rows are buckets of their own around 'points - 2'
+    # buckets of inner rows
+    inner: np.ndarray = np.linspace(1, length - 1, points - 1)
+    edges: np.ndarray = np.concatenate(
+        [[0], inner.astype(np.int64), [length]]
+    )
+
+    sums: np.ndarray = np.empty(0)
+    dtype: np.dtype = np.dtype(np.int64)
+
+    for bucket, _, rows in bucket_blocks(chunks(), edges):
+        if bucket == 0:
+            sums = np.zeros((points, rows.shape[1]))
+            dtype = rows.dtype
+
+        sums[bucket] += rows.sum(axis=0)
+
+    means: np.ndarray = sums / np.diff(edges)[:, np.newaxis]
+    centers: np.ndarray = (edges[:-1] + edges[1:] - 1) / 2
+    series: np.ndarray = np.arange(sums.shape[1])
+
+    indices: np.ndarray = np.empty(sums.shape, dtype=np.int64)
+    kept: np.ndarray = np.empty(sums.shape, dtype=dtype)
+
+    previous: np.ndarray = np.zeros(len(series), dtype=np.int64)
+    previous_y: np.ndarray = means[0]
+
+    # Largest triangle of the current bucket so far
+    best_area: np.ndarray = np.full(len(series), -1.0)
+    best_index: np.ndarray = np.zeros(len(series), dtype=np.int64)
+    best_value: np.ndarray = np.zeros(len(series), dtype=dtype)
+
+    for bucket, start, rows in bucket_blocks(chunks(), edges):
+
+        # First and last points are always kept
+        if bucket in (0, points - 1):
+            indices[bucket] = start
+            kept[bucket] = rows[0]
+            continue
+
+        # Average of the next bucket, the last point after the last bucket
+        next_x: float = centers[bucket + 1]
+        next_y: np.ndarray = means[bucket + 1]
+
+        x: np.ndarray = np.arange(start, start + len(rows))[:, np.newaxis]
+        area: np.ndarray = np.abs(
+            (previous - next_x) * (rows.astype(np.float64) - previous_y)
+            - (previous - x) * (next_y - previous_y)
+        )
+
+        # Earlier points win ties, as within a block
+        top: np.ndarray = area.argmax(axis=0)
+        better: np.ndarray = area[top, series] > best_area
+
+        best_area[better] = area[top, series][better]
+        best_index[better] = start + top[better]
+        best_value[better] = rows[top, series][better]
+
+        # Bucket is complete
+        if start + len(rows) == edges[bucket + 1]:
+            indices[bucket] = best_index
+            kept[bucket] = best_value
+
+            previous = best_index.copy()
+            previous_y = best_value.astype(np.float64)
+            best_area[:] = -1.0
+
+    return indices, kept
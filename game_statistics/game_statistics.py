@@ -1,20 +1,54 @@
+import cProfile
+import json
 import os
-from typing import Any, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-import plotly.express as px
-import plotly.figure_factory as ff
+from termcolor import colored
 
 from game_statistics.config import (
+    check_interval,
     group_drop_columns,
-    line_chart_labels,
-    number_of_visits,
-    top_10_columns
+    line_chart_points
 )
+from game_statistics.downsampling import (
+    MIN_POINTS,
+    largest_triangle_three_buckets
+)
+from game_statistics.phase_profiler import PhaseProfiler
+from game_statistics.plot_mode import PlotMode
+from game_statistics.report import (
+    board_grids,
+    format_statistics,
+    load_tile_grid,
+    rank_tiles,
+    top_tiles
+)
+from game_statistics.result_cache import ResultCache
+from monopoly.analysis.convergence_criterion import ConvergenceCriterion
+from monopoly.analysis.convergence_monitor import ConvergenceMonitor
+from monopoly.analysis.markov_chain import MarkovChain
 from monopoly.board.board import Board
 from monopoly.deck.deck import Deck
+from monopoly.dice.dice import MAX_ROLL, Dice
+from monopoly.engine.engine_type import EngineType
+from monopoly.engine.replicate_runner import ReplicateRunner
+from monopoly.engine.simulation_result import SimulationResult
+from monopoly.engine.vectorized_engine import VectorizedEngine
+from monopoly.events.sinks.console_event_sink import ConsoleEventSink
+from monopoly.events.sinks.event_sink import EventSink
+from monopoly.events.verbosity import Verbosity
+from monopoly.history.disk_round_history import DiskRoundHistory
+from monopoly.history.round_history import RoundHistory
 from monopoly.player.player import Player
+from monopoly.scenario.scenario_bundle import load_scenario
+
+# pandas and plotly are imported when reporting, not at startup
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from game_statistics.plots import PlotJob
 
 
 class GameStatistics:
@@ -28,7 +62,26 @@ class GameStatistics:
         community_chests_data: str,
         output_file: str,
         timestamp: str,
-        rounds: int = 10000
+        rounds: int = 10000,
+        verbosity: Verbosity = Verbosity.SUMMARY,
+        event_sink: Optional[EventSink] = None,
+        engine: EngineType = EngineType.PLAYER,
+        games: int = 1000,
+        players: int = 1,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        history_file: Optional[str] = None,
+        plot_mode: PlotMode = PlotMode.INTERACTIVE,
+        line_chart_points: int = line_chart_points,
+        profile: bool = False,
+        profile_run: bool = False,
+        tolerance: Optional[float] = None,
+        criterion: ConvergenceCriterion = (
+            ConvergenceCriterion.TOTAL_VARIATION
+        ),
+        check_interval: int = check_interval,
+        cache: Optional[ResultCache] = None,
+        bundle: Optional[str] = None
     ) -> None:
         """Initialize the Game Statistics Class.
 
@@ -39,286 +92,722 @@ class GameStatistics:
             output_file (str): Game Statistics output file path.
             rounds (int, optional): Number of rounds (Crossing the GO tile).
             Defaults to 10000.
+            verbosity (Verbosity, optional): Simulation Output Verbosity.
+            Defaults to Verbosity.SUMMARY.
+            event_sink (Optional[EventSink], optional): Receiver of Trace
+            Events. Defaults to the terminal when tracing.
+            engine (EngineType, optional): Simulation Engine. Defaults to
+            EngineType.PLAYER.
+            games (int, optional): Number of Games simulated at once by the
+            Vectorized Engine. Defaults to 1000.
+            players (int, optional): Number of Players sharing the Decks of
+            every Game simulated by the Vectorized Engine. Defaults to 1.
+            seed (Optional[int], optional): Seed of the whole run. Defaults
+            to fresh entropy.
+            workers (int, optional): Number of Worker processes running
+            independent Replicates. Defaults to 1.
+            history_file (Optional[str], optional): '.npy' file the Round
+            History is streamed to instead of being kept in memory. Defaults
+            to None.
+            plot_mode (PlotMode, optional): Show plots in the browser, only
+            save them from Worker processes, or skip them. Defaults to
+            PlotMode.INTERACTIVE.
+            line_chart_points (int, optional): Maximum number of points per
+            line chart series. Defaults to line_chart_points from config.
+            profile (bool, optional): Trace peak memory of every phase and
+            save the Profile next to the output file. Defaults to False.
+            profile_run (bool, optional): Capture cProfile statistics of the
+            Simulation next to the output file. Defaults to False.
+            tolerance (Optional[float], optional): Stop a single process
+            Simulation once the landing probabilities converged to this
+            precision, rounds is then the maximum. Defaults to None.
+            criterion (ConvergenceCriterion, optional): Convergence
+            Criterion. Defaults to ConvergenceCriterion.TOTAL_VARIATION.
+            check_interval (int, optional): Number of rounds between
+            convergence checks. Defaults to check_interval from config.
+            cache (Optional[ResultCache], optional): Result Cache of seeded
+            runs. Defaults to None.
+            bundle (Optional[str], optional): Scenario Bundle compiled from
+            the data files, loaded instead of parsing them. Defaults to None.
+
+        Raises:
+            ValueError: Rounds, Games, Players or Workers below one, several
+            Players without the Vectorized Engine, fewer than 3 line chart
+            points, or a tolerance with several Workers or the Markov Engine.
         """
+        for name, count in [
+            ('Rounds', rounds),
+            ('Games', games),
+            ('Players', players),
+            ('Workers', workers)
+        ]:
+            if count < 1:
+                raise ValueError(f'{name} must be at least 1: {count}')
+
+        # Only Vectorized Games seat several Players
+        if players > 1 and engine != EngineType.VECTORIZED:
+            raise ValueError(
+                f'{players} Players need the Vectorized Engine, not '
+                f'{engine.name.lower()}'
+            )
+
+        if line_chart_points < MIN_POINTS:
+            raise ValueError(
+                f'Line chart points must be at least {MIN_POINTS}: '
+                f'{line_chart_points}'
+            )
+
+        # Convergence is only monitored in a single simulating process
+        if tolerance is not None and (
+            workers > 1 or engine == EngineType.MARKOV
+        ):
+            raise ValueError(
+                'A tolerance needs a single Worker and a simulating Engine, '
+                f'not {workers} Workers and {engine.name.lower()}'
+            )
+
+        # Random Number Related Attributes
+        self.__seed: Optional[int] = seed
+        dice_seed, chances_seed, community_chests_seed = (
+            np.random.SeedSequence(seed).spawn(3)
+        )
+        self.__rng: np.random.Generator = np.random.default_rng(dice_seed)
+
         # Board Related Attributes
-        self.__board: Board = Board(file=board_data)
-        self.__chances: Deck = Deck(file=chances_data)
-        self.__community_chests: Deck = Deck(file=community_chests_data)
+        self.__board_data: str = board_data
+        self.__chances_data: str = chances_data
+        self.__community_chests_data: str = community_chests_data
+        self.__bundle: Optional[str] = bundle
+
+        if bundle is not None:
+            self.__board, self.__chances, self.__community_chests = (
+                load_scenario(
+                    file=bundle,
+                    chances_rng=np.random.default_rng(chances_seed),
+                    community_chests_rng=np.random.default_rng(
+                        community_chests_seed
+                    ),
+                    sources=[board_data, chances_data, community_chests_data]
+                )
+            )
+        else:
+            self.__board: Board = Board(file=board_data)
+            self.__chances: Deck = Deck(
+                file=chances_data,
+                rng=np.random.default_rng(chances_seed)
+            )
+            self.__community_chests: Deck = Deck(
+                file=community_chests_data,
+                rng=np.random.default_rng(community_chests_seed)
+            )
 
         # Statistics Related Attributes
-        self.__stats: Dict[str, int] = {}
-        self.__load_tile_names()
+        self.__labels: List[str] = [tile.label for tile in self.__board.tiles]
+        self.__order: np.ndarray = np.empty(0, dtype=np.int64)
+        self.__visits: np.ndarray = np.zeros(
+            len(self.__board.tiles), dtype=np.int64
+        )
+        self.__player_visits: np.ndarray = self.__visits[np.newaxis]
         self.__rounds: int = rounds
-        self.__data: pd.DataFrame = pd.DataFrame.from_dict(
-            self.__stats,
-            orient='index'
+        self.__history_file: Optional[str] = history_file
+        self.__round_history: RoundHistory = RoundHistory(
+            columns=len(self.__board.tiles),
+            group_ids=self.__board.group_ids
+        )
+
+        if history_file is not None:
+            self.__round_history = DiskRoundHistory(
+                file=history_file,
+                columns=len(self.__board.tiles),
+                group_ids=self.__board.group_ids
+            )
+        self.__roll_counts: np.ndarray = np.zeros(
+            MAX_ROLL + 1, dtype=np.int64
         )
-        self.__heatmap_label_mapping: pd.DataFrame = (
-            pd.DataFrame(np.empty((11, 11), dtype=np.str))
+        self.__data: Optional['pd.DataFrame'] = None
+
+        # Output Verbosity Related Attributes
+        self.__verbosity: Verbosity = verbosity
+        self.__event_sink: Optional[EventSink] = event_sink
+
+        if verbosity == Verbosity.TRACE and event_sink is None:
+            self.__event_sink = ConsoleEventSink(board=self.__board)
+
+        # Engine Related Attributes
+        self.__engine: EngineType = engine
+        self.__games: int = games
+        self.__players: int = players
+        self.__workers: int = workers
+        self.__subject: str = '1 Player'
+
+        match engine:
+            case EngineType.VECTORIZED if players > 1:
+                self.__subject = f'{games} Games of {players} Players'
+            case EngineType.VECTORIZED: self.__subject = f'{games} Games'
+            case EngineType.MARKOV: self.__subject = '1 Player (Expected)'
+
+        # Convergence Related Attributes
+        self.__tolerance: Optional[float] = tolerance
+        self.__criterion: ConvergenceCriterion = criterion
+        self.__check_interval: int = check_interval
+        self.__convergence: Optional[Dict[str, Any]] = None
+        self.__monitor: Optional[ConvergenceMonitor] = (
+            ConvergenceMonitor(tolerance=tolerance, criterion=criterion)
+            if tolerance is not None
+            else None
         )
 
         # Player Related Attributes
-        self.__player: Player = Player()
+        self.__player: Player = Player(
+            verbosity=self.__verbosity,
+            sink=self.__event_sink,
+            dice=Dice(rng=self.__rng)
+        )
 
         # Output Related Attributes
+        self.__plot_mode: PlotMode = plot_mode
+        self.__line_chart_points: int = line_chart_points
         self.__output_file: str = output_file
         self.__timestamp: str = timestamp
 
-    def __load_tile_names(self) -> None:
-        """Load Tile Names to Statistics Dictionary."""
-        for tile in self.__board.tiles:
-            self.__stats[tile.label] = 0
+        # Cache Related Attributes
+        self.__cache: Optional[ResultCache] = cache
+        self.__cached: bool = False
 
-    def __run(self) -> None:
-        """Simulate the Game of Monopoly."""
+        # Profiling Related Attributes
+        self.__profile: bool = profile
+        self.__profile_run: bool = profile_run
+        self.__profiler: PhaseProfiler = PhaseProfiler(trace_memory=profile)
+        self.__output_stem: str = os.path.splitext(output_file)[0]
 
-        while self.__player.crossed_go_tile < self.__rounds:
+    @property
+    def player_statistics(self) -> 'pd.DataFrame':
+        """Return Tile visit counts of every seat and combined.
 
-            self.__data = self.__player.execute_round(
-                board=self.__board,
-                chances=self.__chances,
-                community_chests=self.__community_chests,
-                stats=self.__stats,
-                round_data=self.__data
-            )
+        Returns:
+            pd.DataFrame: Visit counts indexed by Tile label, with a column
+            per Player and a 'Total' column.
+        """
+        import pandas as pd
 
-    def __load_data_to_numpy_array(self) -> np.ndarray:
-        """Load Statistic Data to NumPy Array for Heatmap.
+        data: pd.DataFrame = pd.DataFrame(
+            self.__player_visits.T,
+            index=[tile.label for tile in self.__board.tiles],
+            columns=[
+                f'Player {seat + 1}'
+                for seat in range(len(self.__player_visits))
+            ]
+        )
+        data['Total'] = self.__visits
+
+        return data
+
+    @property
+    def convergence(self) -> Optional[Dict[str, Any]]:
+        """Return achieved precision and number of rounds used.
 
         Returns:
-            np.ndarray: Loaded Statistic Data.
+            Optional[Dict[str, Any]]: Convergence summary, None without a
+            tolerance.
         """
-        heatmap_data: np.ndarray = np.zeros((11, 11))
-        tile_mapping: pd.DataFrame = pd.read_csv(
-            os.path.join(
-                os.getcwd(), 'game_statistics', 'data', 'tile_mapping.csv'
-            ),
-            delimiter=';'
-        )
+        return self.__convergence
 
-        for _, row in tile_mapping.iterrows():
-            heatmap_data[row[1], row[2]] = (
-                self.__stats[self.__board.tiles[row[0]].label]
-            )
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """Return wall time, CPU time and peak memory of every phase.
 
-            self.__heatmap_label_mapping.at[
-                row[1], row[2]
-            ] = self.__board.tiles[row[0]].label
+        CPU time covers the main process only, so plots rendered by Worker
+        processes are counted in wall time alone.
 
-        return heatmap_data.astype(int)
+        Returns:
+            Dict[str, Any]: Run parameters, measured phases and the cProfile
+            statistics file path (None when not captured).
+        """
+        return {
+            'engine': self.__engine.name.lower(),
+            'rounds': self.__rounds,
+            'workers': self.__workers,
+            'plots': self.__plot_mode.name.lower(),
+            'cached': self.__cached,
+            'phases': self.__profiler.phases,
+            'cprofile_file': (
+                f'{self.__output_stem}_run.prof'
+                if self.__profile_run else None
+            )
+        }
 
-    def __generate_line_chart(self) -> None:
-        """Generate and Save 'Group Visit' line chart."""
-        self.__process_round_data()
+    def __cache_key(self) -> Optional[str]:
+        """Return Result Cache key of the run.
 
-        fig: px.Figure= px.line(
-            self.__data,
-            x=self.__data.index,
-            y=self.__data.columns,
-            title=f'Visit by Group - {self.__rounds} Rounds',
-            labels=line_chart_labels,
+        Returns:
+            Optional[str]: Result Cache key, None when the run is not
+            cached (no cache, fresh entropy, traced turns or a History File,
+            which cached Group totals cannot fill).
+        """
+        if (
+            self.__cache is None
+            or self.__seed is None
+            or self.__verbosity == Verbosity.TRACE
+            or self.__history_file is not None
+        ):
+            return None
+
+        return self.__cache.key(
+            files=[
+                self.__board_data,
+                self.__chances_data,
+                self.__community_chests_data
+            ],
+            parameters={
+                'engine': self.__engine.name,
+                'rounds': self.__rounds,
+                'seed': self.__seed,
+                'games': self.__games,
+                'players': self.__players,
+                'workers': self.__workers,
+                'tolerance': self.__tolerance,
+                'criterion': self.__criterion.name,
+                'check_interval': self.__check_interval
+            }
         )
 
-        fig.update_traces(mode='lines', hovertemplate=None)
-        fig.update_layout(hovermode='x unified')
+    def __cache_entry(self) -> Dict[str, np.ndarray]:
+        """Return arrays stored in the Result Cache.
 
-        fig.show()
+        Only Group totals of the Round History are stored, they are all the
+        line chart reads.
 
-        fig.write_html(
-            os.path.join(
-                os.getcwd(),
-                'output',
-                'plots',
-                'line_charts',
-                f'monopoly_game_category_visit_{self.__rounds}_rounds_'
-                f'{self.__timestamp}.html'
-            )
+        Returns:
+            Dict[str, np.ndarray]: Simulation Result arrays.
+        """
+        group_history: Optional[RoundHistory] = (
+            self.__round_history.group_history
         )
 
-    def __generate_roll_barplot(self) -> None:
-        """Generate and Save 'Roll Distribution' barplot."""
-        data: pd.DataFrame = pd.DataFrame(
-            self.__player.roll_history,
-            columns=['Rolls']
-        ).sort_values(by='Rolls')
+        return {
+            'visits': self.__visits,
+            'player_visits': self.__player_visits,
+            'roll_counts': self.__roll_counts,
+            'group_history': (
+                group_history.to_array() if group_history is not None
+                else np.empty((0, len(self.__board.groups)), dtype=np.int64)
+            ),
+            'rounds': np.array(self.__rounds),
+            'convergence': np.array(json.dumps(self.__convergence))
+        }
 
-        fig: px.Figure = px.histogram(
-            data,
-            x='Rolls',
-            color='Rolls',
-            title=f'Rolls of 1 Player - {self.__rounds} Rounds',
-            text_auto=True,
+    def __load_cache_entry(self, entry: Dict[str, np.ndarray]) -> None:
+        """Load Simulation Result arrays from the Result Cache.
 
+        Args:
+            entry (Dict[str, np.ndarray]): Simulation Result arrays.
+        """
+        self.__visits = entry['visits']
+        self.__player_visits = entry['player_visits']
+        self.__roll_counts = entry['roll_counts']
+        self.__round_history.group_history.extend(entry['group_history'])
+        self.__rounds = int(entry['rounds'])
+        self.__convergence = json.loads(str(entry['convergence']))
+
+    def __simulate(self) -> None:
+        """Load Simulation Result from the Result Cache or simulate it."""
+        key: Optional[str] = self.__cache_key()
+        entry: Optional[Dict[str, np.ndarray]] = (
+            self.__cache.load(key) if key is not None else None
         )
-        fig.update_layout(bargap=0.2, legend_traceorder='normal')
-
-        fig.show()
-
-        fig.write_html(
-            os.path.join(
-                os.getcwd(),
-                'output',
-                'plots',
-                'barplots',
-                f'monopoly_game_rolls_barplot_{self.__rounds}_rounds_'
-                f'{self.__timestamp}.html'
-            )
-        )
 
-    def __generate_top_10_tiles_barplot(self) -> None:
-        """Generate and Save 'TOP 10 Visited Tiles' barplot."""
-        data: pd.DataFrame = pd.DataFrame.from_dict(
-            self.__stats,
-            orient='index',
+        if entry is not None:
+            self.__load_cache_entry(entry)
+            self.__round_history.flush()
+            self.__cached = True
+
+            if self.__verbosity != Verbosity.SILENT:
+                self.__display_summary()
+
+            return
+
+        self.__run_profiled()
+
+        if key is not None:
+            self.__cache.store(key, self.__cache_entry())
+
+    def __run_profiled(self) -> None:
+        """Simulate the Game of Monopoly, under cProfile if requested."""
+        if not self.__profile_run:
+            self.__run()
+            return
+
+        profiler: cProfile.Profile = cProfile.Profile()
+        profiler.runcall(self.__run)
+        profiler.dump_stats(self.profile['cprofile_file'])
+
+    def __save_profile(self) -> None:
+        """Save Profile as JSON next to the output file."""
+        with open(f'{self.__output_stem}_profile.json', 'w') as fp:
+            json.dump(self.profile, fp, indent=4)
+
+    def __run(self) -> None:
+        """Simulate the Game of Monopoly."""
+        # Expected values need no Replicates
+        if self.__engine == EngineType.MARKOV:
+            self.__run_markov()
+
+        elif self.__workers > 1:
+            self.__run_replicates()
+
+        else:
+            match self.__engine:
+                case EngineType.PLAYER:
+                    self.__run_player()
+                case EngineType.VECTORIZED:
+                    self.__run_vectorized()
+
+        # Rounds left in the buffer of a streamed Round History
+        self.__round_history.flush()
+
+        if self.__monitor is not None:
+            self.__convergence = self.__monitor.summary
+
+        if self.__event_sink is not None:
+            self.__event_sink.flush()
+
+        if self.__verbosity != Verbosity.SILENT:
+            self.__display_summary()
+
+    def __run_checkpoints(self, advance: Callable[[int], np.ndarray]) -> None:
+        """Advance Simulation through checkpoints until it converged.
+
+        Args:
+            advance (Callable[[int], np.ndarray]): Simulates up to given
+            number of rounds and returns the cumulative Tile visit counts.
+        """
+        if self.__monitor is None:
+            advance(self.__rounds)
+            return
+
+        for checkpoint in range(
+            self.__check_interval,
+            self.__rounds + self.__check_interval,
+            self.__check_interval
+        ):
+            checkpoint = min(checkpoint, self.__rounds)
+
+            if self.__monitor.update(advance(checkpoint), checkpoint):
+                break
+
+        self.__rounds = self.__monitor.rounds
+
+    def __run_player(self) -> None:
+        """Simulate the Game of Monopoly with a single Player."""
+
+        def advance(rounds: int) -> np.ndarray:
+            while self.__player.crossed_go_tile < rounds:
+
+                self.__player.execute_round(
+                    board=self.__board,
+                    chances=self.__chances,
+                    community_chests=self.__community_chests,
+                    visits=self.__visits,
+                    round_history=self.__round_history
+                )
+
+            return self.__visits
+
+        self.__run_checkpoints(advance)
+
+        self.__roll_counts = self.__player.roll_counts
+
+    def __run_vectorized(self) -> None:
+        """Simulate many Games of Monopoly at once."""
+        engine: VectorizedEngine = VectorizedEngine(
+            board=self.__board,
+            chances=self.__chances,
+            community_chests=self.__community_chests,
+            games=self.__games,
+            rng=self.__rng,
+            round_history=self.__round_history,
+            players=self.__players
         )
 
-        data.reset_index(inplace=True)
+        def advance(rounds: int) -> np.ndarray:
+            engine.run(rounds=rounds)
 
-        data.columns = top_10_columns
+            return engine.visits
 
-        data.sort_values(by=number_of_visits, ascending=False, inplace=True)
+        self.__run_checkpoints(advance)
 
-        fig = px.histogram(
-            data.head(10),
-            x='Tile',
-            y=number_of_visits,
-            title=f'Top 10 Tiles Visited by 1 Player - {self.__rounds} Rounds',
-            color=number_of_visits,
-            text_auto=True
+        self.__load_result(engine.result)
+
+    def __run_markov(self) -> None:
+        """Compute expected Statistics from the Markov Chain."""
+        chain: MarkovChain = MarkovChain(
+            board=self.__board,
+            chances=self.__chances,
+            community_chests=self.__community_chests
         )
 
-        fig.update_layout(bargap=0.2, yaxis_title=number_of_visits)
+        self.__load_result(chain.expected_result(rounds=self.__rounds))
+
+    def __run_replicates(self) -> None:
+        """Simulate independent Replicates in a Process Pool."""
+        runner: ReplicateRunner = ReplicateRunner(
+            board_data=self.__board_data,
+            chances_data=self.__chances_data,
+            community_chests_data=self.__community_chests_data,
+            engine=self.__engine,
+            games=self.__games,
+            players=self.__players,
+            workers=self.__workers,
+            bundle=self.__bundle,
+            seed=self.__seed
+        )
 
-        fig.update_traces(
-            hovertemplate=(
-                'Tile: %{x} <br>'
-                'Number of Visits: %{y}<extra></extra>'
+        self.__load_result(
+            runner.run(
+                rounds=self.__rounds,
+                round_history=self.__round_history
             )
         )
 
-        fig.show()
+    def __load_result(self, result: SimulationResult) -> None:
+        """Load counts of finished Simulation.
 
-        fig.write_html(
-            os.path.join(
-                os.getcwd(),
-                'output',
-                'plots',
-                'barplots',
-                f'monopoly_top_10_barplot_{self.__rounds}_rounds_'
-                f'{self.__timestamp}.html'
+        Args:
+            result (SimulationResult): Simulation Result.
+        """
+        self.__visits = result.visits
+        self.__player_visits = result.player_visits
+        self.__roll_counts = result.roll_counts
+        self.__round_history = result.round_history
+
+    def __display_summary(self) -> None:
+        """Display Simulation summary."""
+        print(
+            colored(
+                f'Simulation finished - {self.__subject}, '
+                f'Rounds: {self.__rounds}, '
+                f'Rolls: {self.__roll_counts.sum()}',
+                'green'
             )
         )
 
-    def __generate_barplots(self) -> None:
-        """Generate and Save different barplots based on Game Statistics."""
-        self.__generate_roll_barplot()
-        self.__generate_top_10_tiles_barplot()
+        if self.__convergence is not None:
+            print(
+                colored(
+                    f"Converged: {self.__convergence['converged']}, "
+                    f"Criterion: {self.__convergence['criterion']}, "
+                    f"Precision: {self.__convergence['precision']}, "
+                    f"Tolerance: {self.__convergence['tolerance']}",
+                    'green' if self.__convergence['converged'] else 'yellow'
+                )
+            )
 
-    def __generate_heatmap(self) -> None:
-        """Generate and Save Monopoly Board Heatmap."""
-        data: np.ndarray = self.__load_data_to_numpy_array()
-        data = data[::-1]
+    def __save_convergence(self) -> None:
+        """Save convergence summary as JSON next to the output file."""
+        with open(f'{self.__output_stem}_convergence.json', 'w') as fp:
+            json.dump(self.convergence, fp, indent=4)
 
-        annotations: np.ndarray = data.copy()
-        annotations = np.where(annotations == 0, '', annotations)
+    def __board_grids(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Lay Tile visit counts and labels out as the Board for the Heatmap.
 
-        fig: ff.Figure = ff.create_annotated_heatmap(
-            data,
-            annotation_text=annotations,
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Visit count and label grids.
+        """
+        return board_grids(
+            self.__visits,
+            self.__labels,
+            *load_tile_grid(
+                os.path.join(
+                    os.getcwd(), 'game_statistics', 'data', 'tile_mapping.csv'
+                )
+            )
         )
 
-        fig.update(
-            data=[{
-                'customdata': self.__heatmap_label_mapping.to_numpy()[::-1],
-                'hovertemplate': (
-                    'Tile: %{customdata}<br>'
-                    'Number of Visits: %{z}<extra></extra>'
-                )
-            }]
+    def __plot_path(self, folder: str, name: str) -> str:
+        """Return output HTML file path of a plot.
+
+        Args:
+            folder (str): Plot folder in the output directory.
+            name (str): Plot name.
+
+        Returns:
+            str: Output HTML file path.
+        """
+        return os.path.join(
+            os.getcwd(),
+            'output',
+            'plots',
+            folder,
+            f'monopoly_{name}_{self.__rounds}_rounds_{self.__timestamp}.html'
         )
-        fig.update_layout(
-            xaxis_visible=False,
-            xaxis_showticklabels=False,
-            yaxis_visible=False,
-            yaxis_showticklabels=False,
-            title=(
-                f'Monopoly Board Heatmap of 1 Player - {self.__rounds} Rounds'
+
+    def __plot_jobs(self) -> List['PlotJob']:
+        """Prepare data of every plot.
+
+        Returns:
+            List[PlotJob]: Figure builders, their arguments and output paths.
+        """
+        from game_statistics.plots import (
+            build_heatmap,
+            build_line_chart,
+            build_roll_barplot,
+            build_top_10_tiles_barplot
+        )
+
+        top: np.ndarray = top_tiles(self.__visits, 10)
+        heatmap, heatmap_labels = self.__board_grids()
+
+        jobs: List['PlotJob'] = [
+            (
+                build_roll_barplot,
+                {
+                    'roll_counts': self.__roll_counts,
+                    'subject': self.__subject,
+                    'rounds': self.__rounds
+                },
+                self.__plot_path('barplots', 'game_rolls_barplot')
+            ),
+            (
+                build_top_10_tiles_barplot,
+                {
+                    'labels': [self.__labels[index] for index in top],
+                    'visits': self.__visits[top],
+                    'subject': self.__subject,
+                    'rounds': self.__rounds
+                },
+                self.__plot_path('barplots', 'top_10_barplot')
             )
+        ]
+
+        group_history: Optional[RoundHistory] = (
+            self.__round_history.group_history
         )
 
-        fig.show()
+        # Expected Statistics have no Round History
+        if group_history is not None and group_history.rounds > 0:
+            self.__process_round_data()
 
-        fig.write_html(
-            os.path.join(
-                os.getcwd(),
-                'output',
-                'plots',
-                'heatmaps',
-                f'monopoly_board_heatmap_{self.__rounds}_rounds_'
-                f'{self.__timestamp}.html'
+            jobs.append(
+                (
+                    build_line_chart,
+                    {'data': self.__data, 'rounds': self.__rounds},
+                    self.__plot_path('line_charts', 'game_category_visit')
+                )
+            )
+
+        jobs.append(
+            (
+                build_heatmap,
+                {
+                    'data': heatmap,
+                    'labels': heatmap_labels,
+                    'subject': self.__subject,
+                    'rounds': self.__rounds
+                },
+                self.__plot_path('heatmaps', 'board_heatmap')
             )
         )
 
-    def __process_round_data(self) -> None:
-        """Process accumulated round visit Data."""
-        # Defragmenting DataFrame
-        self.__data = self.__data.copy()
+        return jobs
 
-        groups: List[str] = [x.split('#')[0].strip() for x in self.__data.index.values]
+    def __generate_plots(self) -> List[str]:
+        """Generate and Save every plot based on Game Statistics.
 
-        self.__data['Group'] = groups
+        Returns:
+            List[str]: Output HTML file paths.
+        """
+        if self.__plot_mode == PlotMode.NONE:
+            return []
 
-        self.__data.reset_index(inplace=True)
+        from game_statistics.plots import render_plot
 
-        self.__data = (
-            self.__data.groupby('Group').transform('sum')
-        )
+        jobs: List['PlotJob'] = self.__plot_jobs()
+        show: bool = self.__plot_mode == PlotMode.INTERACTIVE
+        workers: int = min(len(jobs), os.cpu_count() or 1)
 
-        self.__data.drop_duplicates(inplace=True)
+        # Shown Figures are opened one after another
+        if show or workers == 1:
+            return [
+                render_plot(builder, arguments, path, show=show)
+                for builder, arguments, path in jobs
+            ]
 
-        self.__data['index'] = [
-            x.split('#')[0].strip() for x in self.__data['index'].values
-        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(render_plot, *zip(*jobs)))
+
+    def __process_round_data(self) -> None:
+        """Downsample accumulated Group visit totals for the line chart."""
+        import pandas as pd
+
+        group_history: RoundHistory = self.__round_history.group_history
 
-        self.__data = self.__data.transpose().reset_index(drop=True)
-        self.__data.columns = self.__data.iloc[0].values
-        self.__data.drop(labels=0, axis=0, inplace=True)
-        self.__data.drop(
-            labels=group_drop_columns,
-            axis=1,
-            inplace=True
+        # Every Group is downsampled from the same passes over the blocks
+        rounds, group_totals = largest_triangle_three_buckets(
+            group_history.iter_chunks,
+            group_history.rounds,
+            self.__line_chart_points
         )
+        series: List[pd.DataFrame] = []
+
+        for index, group in enumerate(self.__board.groups):
+            if group in group_drop_columns:
+                continue
+
+            series.append(
+                pd.DataFrame(
+                    {
+                        'index': rounds[:, index],
+                        'variable': group,
+                        'value': group_totals[:, index]
+                    }
+                )
+            )
 
-        self.__data = self.__data.reindex(sorted(self.__data.columns), axis=1)
-        self.__data = self.__data.reset_index(drop=True)
+        self.__data = pd.concat(series, ignore_index=True)
 
     def __process_statistics(self) -> None:
-        """Sort Statistics."""
-        self.__stats = {
-            k: v for k, v in reversed(
-                sorted(self.__stats.items(), key=lambda item: item[1])
-            )
-        }
+        """Rank Tiles by visit count."""
+        self.__order = rank_tiles(self.__visits)
 
     def __save_statistics(self) -> None:
         """Save Game Statistics to File."""
 
         with open(self.__output_file, 'a') as fp:
-            fp.write(f"{'Name':<20} {'Number':<8}\n")
+            fp.write(
+                format_statistics(self.__visits, self.__labels, self.__order)
+            )
 
-            for k, v in self.__stats.items():
-                fp.write(f'{k:<20} {v:<8}\n')
+        # Visit counts of every seat next to the combined ones
+        if len(self.__player_visits) > 1:
+            self.player_statistics.to_csv(
+                f'{self.__output_stem}_players.csv', sep=';'
+            )
 
-    def __call__(self, *args: Any, **kwds: Any) -> None:
-        """Make Game Statistics Class callable."""
+    def __call__(self, *args: Any, **kwds: Any) -> List[str]:
+        """Make Game Statistics Class callable.
+
+        Returns:
+            List[str]: Output HTML file paths of generated plots.
+        """
         # Simulate the Game
-        self.__run()
+        with self.__profiler.phase('simulate'):
+            self.__simulate()
 
         # Process Statistics
-        self.__process_statistics()
-        self.__save_statistics()
+        with self.__profiler.phase('process'):
+            self.__process_statistics()
+
+        with self.__profiler.phase('save'):
+            self.__save_statistics()
 
         # Generate Plots
-        self.__generate_barplots()
-        self.__generate_line_chart()
-        self.__generate_heatmap()
+        with self.__profiler.phase('plot'):
+            paths: List[str] = self.__generate_plots()
+
+        if self.__convergence is not None:
+            self.__save_convergence()
+
+        if self.__profile:
+            self.__save_profile()
+
+        return paths
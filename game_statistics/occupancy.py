@@ -0,0 +1,132 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from game_statistics.report import board_grids
+from monopoly.analysis.markov_chain import MarkovChain
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+from monopoly.engine.vectorized_engine import VectorizedEngine
+from monopoly.rules.rules import Rules
+
+# pandas is imported when the occupancy table is built
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def transient_occupancy(
+    board: Board,
+    chances: Deck,
+    community_chests: Deck,
+    turns: int,
+    games: int = 10000,
+    players: int = 1,
+    rng: Optional[np.random.Generator] = None,
+    rules: Optional[Rules] = None
+) -> Dict[str, np.ndarray]:
+    """Return Tile occupancy after every one of the first turns.
+
+    The exact occupancy of a single Player is propagated through the Markov
+    Chain, the simulated occupancy is the share of Players of many Games
+    simulated by the Vectorized Engine.
+
+    Args:
+        board (Board): Monopoly Board.
+        chances (Deck): Chance Cards Deck.
+        community_chests (Deck): Community Chest Cards Deck.
+        turns (int): Number of turns.
+        games (int, optional): Number of simulated Games. Defaults to 10000.
+        players (int, optional): Number of Players sharing the Decks of
+        every simulated Game. Defaults to 1.
+        rng (Optional[np.random.Generator], optional): Random Number
+        Generator of the simulation. Defaults to a freshly seeded Generator.
+        rules (Optional[Rules], optional): House Rules. Defaults to the
+        standard Rules.
+
+    Returns:
+        Dict[str, np.ndarray]: Occupancy with shape (turns + 1, tiles) by
+        source, 'markov' and 'simulation'.
+    """
+    return {
+        'markov': MarkovChain(
+            board=board,
+            chances=chances,
+            community_chests=community_chests,
+            rules=rules
+        ).occupancy(turns),
+        'simulation': VectorizedEngine(
+            board=board,
+            chances=chances,
+            community_chests=community_chests,
+            games=games,
+            rng=rng,
+            players=players,
+            rules=rules
+        ).occupancy(turns)
+    }
+
+
+def total_variation(occupancy: Dict[str, np.ndarray]) -> np.ndarray:
+    """Return total variation distance between both sources by turn.
+
+    Args:
+        occupancy (Dict[str, np.ndarray]): Occupancy by source.
+
+    Returns:
+        np.ndarray: Distance after every turn.
+    """
+    return np.abs(
+        occupancy['markov'] - occupancy['simulation']
+    ).sum(axis=1) / 2
+
+
+def occupancy_table(
+    occupancy: Dict[str, np.ndarray],
+    labels: List[str]
+) -> 'pd.DataFrame':
+    """Tabulate occupancy of every source.
+
+    Args:
+        occupancy (Dict[str, np.ndarray]): Occupancy by source.
+        labels (List[str]): Tile labels in Board order.
+
+    Returns:
+        pd.DataFrame: One row per source and turn, one column per Tile.
+    """
+    import pandas as pd
+
+    return pd.concat(
+        [
+            pd.DataFrame(values, columns=labels).rename_axis('turn')
+            for values in occupancy.values()
+        ],
+        keys=list(occupancy),
+        names=['source']
+    )
+
+
+def occupancy_grids(
+    occupancy: Dict[str, np.ndarray],
+    labels: List[str],
+    tiles: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Lay occupancy of every source and turn out as the Board.
+
+    Args:
+        occupancy (Dict[str, np.ndarray]): Occupancy by source.
+        labels (List[str]): Tile labels in Board order.
+        tiles (np.ndarray): Tile indices of the grid mapping.
+        rows (np.ndarray): Grid rows of the mapped Tiles.
+        columns (np.ndarray): Grid columns of the mapped Tiles.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Occupancy grids with shape (sources,
+        turns, rows, columns), NaN where there is no Tile, and label grid.
+    """
+    grids, names = board_grids(
+        np.stack(list(occupancy.values())), labels, tiles, rows, columns
+    )
+
+    return np.where(names == '', np.nan, grids), names
@@ -0,0 +1,87 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+
+class PhaseProfiler:
+
+    """Wall time, CPU time and peak memory of named phases.
+
+    Memory is traced with tracemalloc, which slows Python code down, so it
+    is only enabled on request.
+
+    Attributes:
+        phases (List[Dict[str, Any]]): Measurements of finished phases.
+        trace_memory (bool): Whether peak memory is traced.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        """Initialize the Phase Profiler Class.
+
+        Args:
+            trace_memory (bool, optional): Trace peak memory of every phase.
+            Defaults to False.
+        """
+        self.__trace_memory: bool = trace_memory
+        self.__phases: List[Dict[str, Any]] = []
+
+    @property
+    def phases(self) -> List[Dict[str, Any]]:
+        """Return measurements of finished phases.
+
+        Returns:
+            List[Dict[str, Any]]: Name, wall seconds, CPU seconds and peak
+            traced bytes (None when not traced) of every phase.
+        """
+        return self.__phases
+
+    @property
+    def trace_memory(self) -> bool:
+        """Return whether peak memory is traced.
+
+        Returns:
+            bool: Whether peak memory is traced.
+        """
+        return self.__trace_memory
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure a phase.
+
+        Args:
+            name (str): Phase name.
+
+        Yields:
+            Iterator[None]: Control to the measured code.
+        """
+        started_tracing: bool = False
+
+        if self.__trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+
+            tracemalloc.reset_peak()
+
+        wall: float = time.perf_counter()
+        cpu: float = time.process_time()
+
+        try:
+            yield
+
+        finally:
+            measurement: Dict[str, Any] = {
+                'name': name,
+                'wall_seconds': time.perf_counter() - wall,
+                'cpu_seconds': time.process_time() - cpu,
+                'peak_bytes': None
+            }
+
+            if self.__trace_memory:
+                measurement['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+
+                if started_tracing:
+                    tracemalloc.stop()
+
+            self.__phases.append(measurement)
@@ -0,0 +1,10 @@
+from enum import Enum, auto
+
+
+class PlotMode(Enum):
+
+    """Game Statistics Plot Mode."""
+
+    INTERACTIVE = auto()
+    HEADLESS = auto()
+    NONE = auto()
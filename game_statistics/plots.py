@@ -0,0 +1,259 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.figure_factory as ff
+from plotly.graph_objects import Figure
+
+from game_statistics.config import (
+    line_chart_labels,
+    number_of_visits,
+    top_10_columns
+)
+
+# Figure builder, its keyword arguments and the output HTML file path
+PlotJob = Tuple[Callable[..., Figure], Dict[str, Any], str]
+
+
+def build_line_chart(data: pd.DataFrame, rounds: int) -> Figure:
+    """Build 'Group Visit' line chart.
+
+    Args:
+        data (pd.DataFrame): Group visit totals in long form, with 'index'
+        (Round), 'variable' (Group) and 'value' columns.
+        rounds (int): Number of rounds (Crossing the GO tile).
+
+    Returns:
+        Figure: Line chart.
+    """
+    fig: Figure = px.line(
+        data,
+        x='index',
+        y='value',
+        color='variable',
+        title=f'Visit by Group - {rounds} Rounds',
+        labels=line_chart_labels,
+    )
+
+    fig.update_traces(mode='lines', hovertemplate=None)
+    fig.update_layout(hovermode='x unified')
+
+    return fig
+
+
+def build_roll_barplot(
+    roll_counts: np.ndarray,
+    subject: str,
+    rounds: int
+) -> Figure:
+    """Build 'Roll Distribution' barplot.
+
+    Args:
+        roll_counts (np.ndarray): Number of rolls indexed by rolled sum.
+        subject (str): Simulated subject shown in the title.
+        rounds (int): Number of rounds (Crossing the GO tile).
+
+    Returns:
+        Figure: Roll barplot.
+    """
+    rolls: np.ndarray = np.flatnonzero(roll_counts)
+
+    data: pd.DataFrame = pd.DataFrame(
+        {'Rolls': rolls, 'Count': roll_counts[rolls]}
+    )
+
+    fig: Figure = px.histogram(
+        data,
+        x='Rolls',
+        y='Count',
+        color='Rolls',
+        title=f'Rolls of {subject} - {rounds} Rounds',
+        text_auto=True,
+
+    )
+    fig.update_layout(
+        bargap=0.2,
+        legend_traceorder='normal',
+        yaxis_title='count'
+    )
+
+    return fig
+
+
+def build_top_10_tiles_barplot(
+    labels: List[str],
+    visits: np.ndarray,
+    subject: str,
+    rounds: int
+) -> Figure:
+    """Build 'TOP 10 Visited Tiles' barplot.
+
+    Args:
+        labels (List[str]): Labels of the most visited Tiles, most visited
+        first.
+        visits (np.ndarray): Visit counts of the same Tiles.
+        subject (str): Simulated subject shown in the title.
+        rounds (int): Number of rounds (Crossing the GO tile).
+
+    Returns:
+        Figure: Top 10 Tiles barplot.
+    """
+    data: pd.DataFrame = pd.DataFrame(
+        dict(zip(top_10_columns, [labels, visits]))
+    )
+
+    fig: Figure = px.histogram(
+        data,
+        x='Tile',
+        y=number_of_visits,
+        title=(
+            f'Top 10 Tiles Visited by {subject} - '
+            f'{rounds} Rounds'
+        ),
+        color=number_of_visits,
+        text_auto=True
+    )
+
+    fig.update_layout(bargap=0.2, yaxis_title=number_of_visits)
+
+    fig.update_traces(
+        hovertemplate=(
+            'Tile: %{x} <br>'
+            'Number of Visits: %{y}<extra></extra>'
+        )
+    )
+
+    return fig
+
+
+def build_heatmap(
+    data: np.ndarray,
+    labels: np.ndarray,
+    subject: str,
+    rounds: int
+) -> Figure:
+    """Build Monopoly Board Heatmap.
+
+    Args:
+        data (np.ndarray): Tile visit counts laid out as the Board.
+        labels (np.ndarray): Tile labels laid out as the Board.
+        subject (str): Simulated subject shown in the title.
+        rounds (int): Number of rounds (Crossing the GO tile).
+
+    Returns:
+        Figure: Board Heatmap.
+    """
+    data = data[::-1]
+
+    annotations: np.ndarray = data.copy()
+    annotations = np.where(annotations == 0, '', annotations)
+
+    fig: Figure = ff.create_annotated_heatmap(
+        data,
+        annotation_text=annotations,
+    )
+
+    fig.update(
+        data=[{
+            'customdata': labels[::-1],
+            'hovertemplate': (
+                'Tile: %{customdata}<br>'
+                'Number of Visits: %{z}<extra></extra>'
+            )
+        }]
+    )
+    fig.update_layout(
+        xaxis_visible=False,
+        xaxis_showticklabels=False,
+        yaxis_visible=False,
+        yaxis_showticklabels=False,
+        title=(
+            f'Monopoly Board Heatmap of {subject} - '
+            f'{rounds} Rounds'
+        )
+    )
+
+    return fig
+
+
+def build_occupancy_heatmap(
+    data: np.ndarray,
+    labels: np.ndarray,
+    sources: List[str],
+    subject: str
+) -> Figure:
+    """Build animated Monopoly Board Heatmap of the Tile occupancy by turn.
+
+    Args:
+        data (np.ndarray): Occupancy laid out as the Board with shape
+        (sources, turns, rows, columns), NaN where there is no Tile.
+        labels (np.ndarray): Tile labels laid out as the Board.
+        sources (List[str]): Name of every occupancy source, shown side by
+        side.
+        subject (str): Simulated subject shown in the title.
+
+    Returns:
+        Figure: Board Heatmap with a frame per turn.
+    """
+    turns: int = data.shape[1]
+
+    # Everyone starts on 'GO', which would wash out every later turn
+    later: np.ndarray = data[:, 1:] if turns > 1 else data
+
+    fig: Figure = px.imshow(
+        data.transpose(1, 0, 2, 3),
+        animation_frame=0,
+        facet_col=1,
+        text_auto='.1%',
+        range_color=(0, np.nanmax(later)),
+        labels={'animation_frame': 'Turn', 'color': 'Occupancy'}
+    )
+
+    fig.for_each_annotation(
+        lambda annotation: annotation.update(
+            text=sources[int(annotation.text.split('=')[-1])]
+        )
+    )
+    fig.update_traces(
+        customdata=labels,
+        hovertemplate=(
+            'Tile: %{customdata}<br>'
+            'Occupancy: %{z:.2%}<extra></extra>'
+        )
+    )
+    fig.update_xaxes(visible=False, showticklabels=False)
+    fig.update_yaxes(visible=False, showticklabels=False)
+    fig.update_layout(
+        title=f'Monopoly Board Occupancy of {subject} by Turn'
+    )
+
+    return fig
+
+
+def render_plot(
+    builder: Callable[..., Figure],
+    arguments: Dict[str, Any],
+    path: str,
+    show: bool = False
+) -> str:
+    """Build Figure and save it as HTML.
+
+    Args:
+        builder (Callable[..., Figure]): Figure builder.
+        arguments (Dict[str, Any]): Keyword arguments of the builder.
+        path (str): Output HTML file path.
+        show (bool, optional): Open the Figure in the browser. Defaults to
+        False.
+
+    Returns:
+        str: Output HTML file path.
+    """
+    fig: Figure = builder(**arguments)
+
+    if show:
+        fig.show()
+
+    fig.write_html(path)
+
+    return path
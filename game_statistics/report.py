@@ -0,0 +1,114 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def load_tile_grid(file: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Load Tile to Board grid mapping once per file.
+
+    Args:
+        file (str): Tile mapping file with 'tile_index', 'position_y' and
+        'position_x' columns separated by ';'.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Tile indices, grid rows
+        and grid columns.
+    """
+    mapping: np.ndarray = np.loadtxt(
+        file, delimiter=';', skiprows=1, dtype=np.int64, ndmin=2
+    )
+
+    # Read only, the arrays are shared by every caller
+    mapping.flags.writeable = False
+
+    return mapping[:, 0], mapping[:, 1], mapping[:, 2]
+
+
+def rank_tiles(visits: np.ndarray) -> np.ndarray:
+    """Return Tile indices from the most to the least visited.
+
+    Ties are ordered from the highest Tile index down.
+
+    Args:
+        visits (np.ndarray): Tile visit counts.
+
+    Returns:
+        np.ndarray: Tile indices.
+    """
+    return np.argsort(visits, kind='stable')[::-1]
+
+
+def top_tiles(visits: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the k most visited Tiles in rank_tiles order.
+
+    Args:
+        visits (np.ndarray): Tile visit counts.
+        k (int): Number of Tiles.
+
+    Returns:
+        np.ndarray: Tile indices.
+    """
+    k = min(k, len(visits))
+
+    # Unique keys, so ties at the cut are broken like rank_tiles
+    keys: np.ndarray = (
+        visits.astype(np.int64) * len(visits) + np.arange(len(visits))
+    )
+    top: np.ndarray = np.argpartition(keys, len(keys) - k)[len(keys) - k:]
+
+    return top[np.argsort(keys[top])[::-1]]
+
+
+def board_grids(
+    visits: np.ndarray,
+    labels: List[str],
+    tiles: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Lay Tile visit counts and labels out as the Board.
+
+    Args:
+        visits (np.ndarray): Tile visit counts, or any Tile values with the
+        Tiles along the last axis.
+        labels (List[str]): Tile labels in Board order.
+        tiles (np.ndarray): Tile indices of the grid mapping.
+        rows (np.ndarray): Grid rows of the mapped Tiles.
+        columns (np.ndarray): Grid columns of the mapped Tiles.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Visit count grids with the leading
+        axes of visits and label grid, cells without a Tile hold 0 and ''.
+    """
+    shape: Tuple[int, int] = (int(rows.max()) + 1, int(columns.max()) + 1)
+
+    counts: np.ndarray = np.zeros(visits.shape[:-1] + shape, visits.dtype)
+    counts[..., rows, columns] = visits[..., tiles]
+
+    names: np.ndarray = np.full(shape, '', dtype=object)
+    names[rows, columns] = np.array(labels, dtype=object)[tiles]
+
+    return counts, names
+
+
+def format_statistics(
+    visits: np.ndarray,
+    labels: List[str],
+    order: np.ndarray
+) -> str:
+    """Format Tile visit counts as the Game Statistics table.
+
+    Args:
+        visits (np.ndarray): Tile visit counts.
+        labels (List[str]): Tile labels in Board order.
+        order (np.ndarray): Tile indices in table order.
+
+    Returns:
+        str: Table with a header line and one line per Tile.
+    """
+    return f"{'Name':<20} {'Number':<8}\n" + ''.join(
+        f'{labels[index]:<20} {count:<8}\n'
+        for index, count in zip(order.tolist(), visits[order].tolist())
+    )
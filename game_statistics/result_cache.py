@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from monopoly.scenario.scenario_bundle import file_digest
+
+# Changed whenever the layout of cached Results changes
+CACHE_VERSION: int = 2
+
+
+class ResultCache:
+
+    """Content addressed cache of Simulation Results.
+
+    Every entry is a '.npz' file named after the SHA-256 hash of the input
+    data files and the Simulation parameters. Entries are written to a
+    temporary file and atomically renamed, so concurrent Workers never read
+    a partially written entry. Reading an entry refreshes its modification
+    time, and the least recently used entries are removed once the cache
+    grows past its size limit. Entries larger than the limit are not stored.
+
+    Attributes:
+        directory (str): Cache directory.
+        max_bytes (int): Size limit of all entries in bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """Initialize the Result Cache Class.
+
+        Args:
+            directory (str): Cache directory, created if missing.
+            max_bytes (int): Size limit of all entries in bytes.
+        """
+        self.__directory: str = directory
+        self.__max_bytes: int = max_bytes
+
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """Return Cache directory.
+
+        Returns:
+            str: Cache directory.
+        """
+        return self.__directory
+
+    @property
+    def max_bytes(self) -> int:
+        """Return size limit of all entries in bytes.
+
+        Returns:
+            int: Size limit in bytes.
+        """
+        return self.__max_bytes
+
+    @staticmethod
+    def key(files: List[str], parameters: Dict[str, Any]) -> str:
+        """Hash input data files and Simulation parameters.
+
+        Args:
+            files (List[str]): Input data file paths.
+            parameters (Dict[str, Any]): JSON serializable Simulation
+            parameters.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        digest = hashlib.sha256()
+
+        for file in files:
+            digest.update(bytes.fromhex(file_digest(file)))
+
+        digest.update(
+            json.dumps(
+                {'version': CACHE_VERSION, **parameters}, sort_keys=True
+            ).encode()
+        )
+
+        return digest.hexdigest()
+
+    def __path(self, key: str) -> str:
+        """Return entry file path.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            str: Entry file path.
+        """
+        return os.path.join(self.__directory, f'{key}.npz')
+
+    def load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Load entry and mark it as recently used.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: Stored arrays, None when the
+            entry is missing or unreadable.
+        """
+        path: str = self.__path(key)
+
+        try:
+            with np.load(path) as entry:
+                arrays: Dict[str, np.ndarray] = {
+                    name: entry[name] for name in entry.files
+                }
+
+            os.utime(path)
+
+        # Missing, evicted by another Worker or corrupted
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+
+        return arrays
+
+    def store(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        """Store entry atomically and evict least recently used entries.
+
+        Args:
+            key (str): Entry key.
+            arrays (Dict[str, np.ndarray]): Arrays to store.
+        """
+        # An entry larger than the whole cache would be evicted at once
+        if sum(array.nbytes for array in arrays.values()) > self.__max_bytes:
+            return
+
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self.__directory, suffix='.tmp'
+        )
+
+        try:
+            with os.fdopen(descriptor, 'wb') as fp:
+                np.savez(fp, **arrays)
+                size: int = fp.tell()
+
+            if size > self.__max_bytes:
+                os.remove(temporary)
+                return
+
+            os.replace(temporary, self.__path(key))
+
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+        self.__evict()
+
+    def __evict(self) -> None:
+        """Remove least recently used entries beyond the size limit."""
+        entries: List[os.DirEntry] = [
+            entry for entry in os.scandir(self.__directory)
+            if entry.name.endswith('.npz')
+        ]
+        sizes: Dict[str, int] = {}
+        used: Dict[str, float] = {}
+
+        for entry in entries:
+            try:
+                stat: os.stat_result = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            sizes[entry.path] = stat.st_size
+            used[entry.path] = stat.st_mtime
+
+        total: int = sum(sizes.values())
+
+        for path in sorted(used, key=used.__getitem__):
+            if total <= self.__max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            total -= sizes[path]
@@ -0,0 +1,458 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from monopoly.analysis.convergence_monitor import CONFIDENCE_Z
+from monopoly.analysis.markov_chain import MarkovChain
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+from monopoly.dice.dice import Dice
+from monopoly.engine.engine_type import EngineType
+from monopoly.engine.vectorized_engine import VectorizedEngine
+from monopoly.history.round_history import RoundHistory
+from monopoly.player.player import Player
+from monopoly.rules.rules import Rules
+
+# pandas is imported when the comparison table is built, not in Workers
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Grid parameters naming data files, every other parameter is a Rule
+DATA_PARAMETERS: List[str] = [
+    'board_data', 'chances_data', 'community_chests_data'
+]
+
+
+@lru_cache(maxsize=None)
+def load_board(file: str) -> Board:
+    """Parse Board Data File once per process.
+
+    Args:
+        file (str): Board tiles data file path.
+
+    Returns:
+        Board: Monopoly Board, shared by every variant and never modified.
+    """
+    return Board(file=file)
+
+
+@lru_cache(maxsize=None)
+def load_deck_arrays(file: str) -> Dict[str, np.ndarray]:
+    """Parse Deck Data File once per process.
+
+    Args:
+        file (str): Cards data file path.
+
+    Returns:
+        Dict[str, np.ndarray]: Deck arrays, every variant builds its own
+        shuffled Deck from them.
+    """
+    return Deck(file=file).to_arrays()
+
+
+def default_parameters() -> Dict[str, Any]:
+    """Return parameters of the standard game.
+
+    Returns:
+        Dict[str, Any]: Data files from the working directory and the
+        standard Rules.
+    """
+    data_directory: str = os.path.join(os.getcwd(), 'monopoly', 'data')
+
+    return {
+        'board_data': os.path.join(data_directory, 'board_data.txt'),
+        'chances_data': os.path.join(data_directory, 'chances_data.txt'),
+        'community_chests_data': os.path.join(
+            data_directory, 'community_chest_data.txt'
+        ),
+        **Rules().to_dict()
+    }
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Expand parameter grid into every combination.
+
+    Args:
+        grid (Dict[str, List[Any]]): Values of every swept parameter,
+        missing parameters keep their default value.
+
+    Raises:
+        ValueError: Unknown parameter.
+
+    Returns:
+        List[Dict[str, Any]]: Parameters of every variant.
+    """
+    defaults: Dict[str, Any] = default_parameters()
+    unknown: List[str] = [name for name in grid if name not in defaults]
+
+    if unknown:
+        raise ValueError(f'Unknown sweep parameters: {unknown}')
+
+    return [
+        {**defaults, **dict(zip(grid, values))}
+        for values in itertools.product(*grid.values())
+    ]
+
+
+def simulate_variant(
+    variant: Dict[str, Any],
+    engine: EngineType,
+    rounds: int,
+    games: int,
+    seed_sequence: np.random.SeedSequence
+) -> Tuple[List[str], np.ndarray]:
+    """Simulate single variant of the sweep.
+
+    Args:
+        variant (Dict[str, Any]): Data files and Rules of the variant.
+        engine (EngineType): Simulation Engine.
+        rounds (int): Number of rounds (Crossing the GO tile).
+        games (int): Number of Games simulated by the Vectorized Engine.
+        seed_sequence (np.random.SeedSequence): Seed of the variant.
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Tile labels and landing
+        probabilities in Board order.
+    """
+    dice_seed, chances_seed, community_chests_seed = seed_sequence.spawn(3)
+
+    # Dice and every Deck draw from separate streams
+    chances_rng: np.random.Generator = np.random.default_rng(chances_seed)
+    community_chests_rng: np.random.Generator = np.random.default_rng(
+        community_chests_seed
+    )
+
+    board: Board = load_board(variant['board_data'])
+    chances: Deck = Deck.from_arrays(
+        load_deck_arrays(variant['chances_data']), rng=chances_rng
+    )
+    community_chests: Deck = Deck.from_arrays(
+        load_deck_arrays(variant['community_chests_data']),
+        rng=community_chests_rng
+    )
+    rules: Rules = Rules(
+        **{
+            name: value for name, value in variant.items()
+            if name not in DATA_PARAMETERS
+        }
+    )
+    labels: List[str] = [tile.label for tile in board.tiles]
+
+    match engine:
+
+        case EngineType.PLAYER:
+            player: Player = Player(
+                dice=Dice(rng=np.random.default_rng(dice_seed)),
+                rules=rules
+            )
+            visits: np.ndarray = np.zeros(len(board.tiles), dtype=np.int64)
+            round_history: RoundHistory = RoundHistory(
+                columns=len(board.tiles)
+            )
+
+            while player.crossed_go_tile < rounds:
+                player.execute_round(
+                    board=board,
+                    chances=chances,
+                    community_chests=community_chests,
+                    visits=visits,
+                    round_history=round_history
+                )
+
+        case EngineType.VECTORIZED:
+            vectorized_engine: VectorizedEngine = VectorizedEngine(
+                board=board,
+                chances=chances,
+                community_chests=community_chests,
+                games=games,
+                rng=np.random.default_rng(dice_seed),
+                rules=rules,
+                deck_rngs=[chances_rng, community_chests_rng]
+            )
+
+            vectorized_engine.run(rounds=rounds)
+            visits = vectorized_engine.visits
+
+        # Exact, rounds and games do not matter
+        case EngineType.MARKOV:
+            return labels, MarkovChain(
+                board=board,
+                chances=chances,
+                community_chests=community_chests,
+                rules=rules
+            ).landing_probabilities
+
+    return labels, visits / visits.sum()
+
+
+class Sweep:
+
+    """Parameter Sweep over House Rules and data file variants.
+
+    Every combination of the grid is a variant simulated in a Process Pool
+    as independent Replicates, each with Random Number streams spawned from
+    a single seed. Workers parse every data file once and reuse the parsed
+    Board and Decks for all their variants.
+
+    In paired mode every variant replays the same streams (common random
+    numbers): Replicate r of every variant rolls the same dice and shuffles
+    its Decks from the same separate sub-streams. The noise shared between
+    variants then cancels out of their differences.
+
+    Attributes:
+        variants (List[Dict[str, Any]]): Parameters of every variant.
+        workers (int): Number of Worker processes.
+        replicates (int): Number of Replicates of every variant.
+        paired (bool): Whether every variant replays the same streams.
+    """
+
+    def __init__(
+        self,
+        grid: Dict[str, List[Any]],
+        engine: EngineType = EngineType.VECTORIZED,
+        rounds: int = 1000,
+        games: int = 100,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        replicates: int = 1,
+        paired: bool = False
+    ) -> None:
+        """Initialize the Sweep Class.
+
+        Args:
+            grid (Dict[str, List[Any]]): Values of every swept parameter,
+            the data file paths and the Rules.
+            engine (EngineType, optional): Simulation Engine. Defaults to
+            EngineType.VECTORIZED.
+            rounds (int, optional): Number of rounds (Crossing the GO tile)
+            of every Replicate. Defaults to 1000.
+            games (int, optional): Number of Games of every Replicate
+            simulated by the Vectorized Engine. Defaults to 100.
+            workers (Optional[int], optional): Number of Worker processes.
+            Defaults to the number of CPUs.
+            seed (Optional[int], optional): Seed of the whole sweep.
+            Defaults to fresh entropy.
+            replicates (int, optional): Number of Replicates of every
+            variant, at least 2 for confidence intervals. Defaults to 1.
+            paired (bool, optional): Replay the same streams in every
+            variant. Defaults to False.
+        """
+        self.__variants: List[Dict[str, Any]] = expand_grid(grid)
+        self.__engine: EngineType = engine
+        self.__rounds: int = rounds
+        self.__games: int = games
+        self.__workers: int = workers if workers else os.cpu_count() or 1
+        self.__replicates: int = replicates
+        self.__paired: bool = paired
+        self.__seed_sequence: np.random.SeedSequence = (
+            np.random.SeedSequence(seed)
+        )
+
+        # Tile labels and Replicate landing probabilities of every variant
+        self.__labels: List[List[str]] = []
+        self.__probabilities: List[np.ndarray] = []
+
+    @property
+    def variants(self) -> List[Dict[str, Any]]:
+        """Return parameters of every variant.
+
+        Returns:
+            List[Dict[str, Any]]: Parameters of every variant.
+        """
+        return self.__variants
+
+    @property
+    def workers(self) -> int:
+        """Return number of Worker processes.
+
+        Returns:
+            int: Number of Worker processes.
+        """
+        return self.__workers
+
+    @property
+    def replicates(self) -> int:
+        """Return number of Replicates of every variant.
+
+        Returns:
+            int: Number of Replicates.
+        """
+        return self.__replicates
+
+    @property
+    def paired(self) -> bool:
+        """Return whether every variant replays the same streams.
+
+        Returns:
+            bool: Whether common random numbers are used.
+        """
+        return self.__paired
+
+    def __seeds(self) -> List[np.random.SeedSequence]:
+        """Spawn seed of every Replicate of every variant.
+
+        Returns:
+            List[np.random.SeedSequence]: Seeds, variant by variant.
+        """
+        count: int = len(self.__variants)
+
+        # Common random numbers, Replicate r shares its seed across variants.
+        # Spawning children changes a seed, so every variant gets a copy.
+        if self.__paired:
+            seeds: List[np.random.SeedSequence] = (
+                self.__seed_sequence.spawn(self.__replicates)
+            )
+
+            return [
+                np.random.SeedSequence(
+                    seed.entropy, spawn_key=seed.spawn_key
+                )
+                for _ in range(count)
+                for seed in seeds
+            ]
+
+        return self.__seed_sequence.spawn(count * self.__replicates)
+
+    def run(self) -> 'pd.DataFrame':
+        """Simulate every variant and compare their landing probabilities.
+
+        Returns:
+            pd.DataFrame: One row per variant with its parameters followed by
+            the mean landing probability of every Tile label.
+        """
+        import pandas as pd
+
+        count: int = len(self.__variants) * self.__replicates
+        arguments: List[List[Any]] = [
+            [
+                variant for variant in self.__variants
+                for _ in range(self.__replicates)
+            ],
+            [self.__engine] * count,
+            [self.__rounds] * count,
+            [self.__games] * count,
+            self.__seeds()
+        ]
+
+        if self.__workers == 1:
+            results: List[Tuple[List[str], np.ndarray]] = list(
+                map(simulate_variant, *arguments)
+            )
+
+        # Batches keep the scheduling overhead low for cheap variants
+        else:
+            with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+                results = list(
+                    executor.map(
+                        simulate_variant,
+                        *arguments,
+                        chunksize=max(1, count // (self.__workers * 4))
+                    )
+                )
+
+        self.__labels = [
+            results[start][0]
+            for start in range(0, count, self.__replicates)
+        ]
+        self.__probabilities = [
+            np.stack(
+                [
+                    probabilities for _, probabilities in
+                    results[start:start + self.__replicates]
+                ]
+            )
+            for start in range(0, count, self.__replicates)
+        ]
+
+        return pd.DataFrame(
+            [
+                {
+                    **variant,
+                    **dict(zip(labels, probabilities.mean(axis=0).tolist()))
+                }
+                for variant, labels, probabilities in zip(
+                    self.__variants, self.__labels, self.__probabilities
+                )
+            ]
+        )
+
+    def differences(self, baseline: int = 0) -> 'pd.DataFrame':
+        """Compare landing probabilities of every variant to a baseline.
+
+        In paired mode the confidence interval comes from the Replicate by
+        Replicate differences, otherwise from the variances of both
+        variants. Both use the Normal approximation.
+
+        Args:
+            baseline (int, optional): Index of the baseline variant.
+            Defaults to 0.
+
+        Raises:
+            ValueError: Sweep not run, fewer than 2 Replicates or a variant
+            with other Tiles than the baseline.
+
+        Returns:
+            pd.DataFrame: One row per variant and Tile with the variant
+            parameters, the mean difference to the baseline and its 95%
+            confidence half-width.
+        """
+        import pandas as pd
+
+        if not self.__probabilities:
+            raise ValueError('Sweep has to be run before comparing variants')
+
+        if self.__replicates < 2:
+            raise ValueError(
+                f'Confidence intervals need at least 2 Replicates: '
+                f'{self.__replicates}'
+            )
+
+        reference: np.ndarray = self.__probabilities[baseline]
+        rows: List[Dict[str, Any]] = []
+
+        for index, (variant, labels, probabilities) in enumerate(
+            zip(self.__variants, self.__labels, self.__probabilities)
+        ):
+            if index == baseline:
+                continue
+
+            if labels != self.__labels[baseline]:
+                raise ValueError(
+                    f'Variant {index} has other Tiles than the baseline'
+                )
+
+            if self.__paired:
+                variance: np.ndarray = (
+                    (probabilities - reference).var(axis=0, ddof=1)
+                )
+            else:
+                variance = (
+                    probabilities.var(axis=0, ddof=1)
+                    + reference.var(axis=0, ddof=1)
+                )
+
+            difference: np.ndarray = (
+                probabilities.mean(axis=0) - reference.mean(axis=0)
+            )
+            half_width: np.ndarray = CONFIDENCE_Z * np.sqrt(
+                variance / self.__replicates
+            )
+
+            rows.extend(
+                {
+                    'variant': index,
+                    **variant,
+                    'tile': label,
+                    'difference': tile_difference,
+                    'half_width': tile_half_width
+                }
+                for label, tile_difference, tile_half_width in zip(
+                    labels, difference.tolist(), half_width.tolist()
+                )
+            )
+
+        return pd.DataFrame(rows)
@@ -1,42 +1,200 @@
+import argparse
 import os
 import platform
-import sys
 from datetime import datetime
-from typing import Tuple
-
-from termcolor import colored
+from typing import Optional
 
+from game_statistics.config import (
+    cache_size,
+    check_interval,
+    line_chart_points
+)
+from game_statistics.downsampling import MIN_POINTS
 from game_statistics.game_statistics import GameStatistics
+from game_statistics.plot_mode import PlotMode
+from game_statistics.result_cache import ResultCache
+from monopoly.analysis.convergence_criterion import ConvergenceCriterion
+from monopoly.engine.engine_type import EngineType
+from monopoly.events.sinks.event_sink import EventSink
+from monopoly.events.sinks.file_event_sink import FileEventSink
+from monopoly.events.verbosity import Verbosity
 
 
-def get_rounds_and_timestamp() -> Tuple[int, str]:
-    """Return number of rounds and current timestamp.
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
 
     Returns:
-        Tuple[int, str]: Number of Rounds and Current Timestamp.
+        argparse.Namespace: Parsed command line arguments.
     """
     usage: str = ''
 
     platform_os: str = platform.system()
 
     match platform_os:
-        case 'Windows': usage = '.\Monopoly_Simulation.ps1 [Number of Rounds]'
-        case _: usage = './Monopoly_Simulation [Number of Rounds]'
+        case 'Windows': usage = '.\\Monopoly_Simulation.ps1'
+        case _: usage = './Monopoly_Simulation'
+
+    parser = argparse.ArgumentParser(
+        prog=usage,
+        description='Simulate the movement of a Player in Monopoly.'
+    )
+
+    parser.add_argument(
+        'rounds',
+        type=int,
+        help='Number of Rounds (Crossing the GO tile).'
+    )
+    parser.add_argument(
+        '--verbosity',
+        choices=[verbosity.name.lower() for verbosity in Verbosity],
+        default=Verbosity.SUMMARY.name.lower(),
+        help='Simulation output verbosity.'
+    )
+    parser.add_argument(
+        '--trace-file',
+        default=None,
+        help='Write trace events to this file instead of the terminal.'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=[engine.name.lower() for engine in EngineType],
+        default=EngineType.PLAYER.name.lower(),
+        help='Simulation engine.'
+    )
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=1000,
+        help='Number of games simulated at once by the vectorized engine.'
+    )
+    parser.add_argument(
+        '--players',
+        type=int,
+        default=1,
+        help='Number of players sharing the decks of every vectorized game.'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed making the whole run reproducible.'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes running independent replicates.'
+    )
+    parser.add_argument(
+        '--history-file',
+        default=None,
+        help='Stream the round history to this .npy file instead of memory.'
+    )
+    parser.add_argument(
+        '--plots',
+        choices=[plot_mode.name.lower() for plot_mode in PlotMode],
+        default=PlotMode.INTERACTIVE.name.lower(),
+        help='Show plots, only save them (headless) or skip them.'
+    )
+    parser.add_argument(
+        '--line-chart-points',
+        type=int,
+        default=line_chart_points,
+        help='Maximum number of points per line chart series.'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Save time and peak memory of every phase next to the output.'
+    )
+    parser.add_argument(
+        '--profile-run',
+        action='store_true',
+        help='Save cProfile statistics of the simulation next to the output.'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=None,
+        help='Stop once landing probabilities converged, rounds is the limit.'
+    )
+    parser.add_argument(
+        '--criterion',
+        choices=[criterion.name.lower() for criterion in ConvergenceCriterion],
+        default=ConvergenceCriterion.TOTAL_VARIATION.name.lower(),
+        help='Total variation change or largest confidence half-width.'
+    )
+    parser.add_argument(
+        '--check-interval',
+        type=int,
+        default=check_interval,
+        help='Number of rounds between convergence checks.'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Load seeded results from the result cache or store them there.'
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=cache_size // 2 ** 20,
+        help='Size limit of the result cache in MiB.'
+    )
+    parser.add_argument(
+        '--bundle',
+        default=None,
+        help='Load the board and decks from this compiled scenario bundle.'
+    )
+
+    arguments: argparse.Namespace = parser.parse_args()
 
-    try:
-        rounds: int = int(sys.argv[1])
-    except ValueError:
-        print(colored(f'Invalid argument! Usage: {usage}', 'red'))
-        quit()
+    if arguments.line_chart_points < MIN_POINTS:
+        parser.error(
+            f'--line-chart-points must be at least {MIN_POINTS}, the first, '
+            'last and one inner round'
+        )
 
-    timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    if arguments.tolerance is not None and (
+        arguments.workers > 1
+        or arguments.engine == EngineType.MARKOV.name.lower()
+    ):
+        parser.error(
+            '--tolerance needs a single worker and the player or vectorized '
+            'engine'
+        )
 
-    return rounds, timestamp
+    return arguments
+
+
+def get_timestamp() -> str:
+    """Return current timestamp.
+
+    Returns:
+        str: Current Timestamp.
+    """
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
 
 if __name__ == '__main__':
 
-    rounds, timestamp = get_rounds_and_timestamp()
+    arguments: argparse.Namespace = parse_arguments()
+
+    rounds: int = arguments.rounds
+    timestamp: str = get_timestamp()
+
+    event_sink: Optional[EventSink] = None
+
+    if arguments.trace_file is not None:
+        event_sink = FileEventSink(file=arguments.trace_file)
+
+    cache: Optional[ResultCache] = None
+
+    if arguments.cache:
+        cache = ResultCache(
+            directory=os.path.join(os.getcwd(), 'output', 'cache'),
+            max_bytes=arguments.cache_size * 2 ** 20
+        )
 
     game_statistics = GameStatistics(
         board_data=os.path.join(
@@ -63,7 +221,24 @@ if __name__ == '__main__':
             f'output_{rounds}_rounds_{timestamp}.txt',
         ),
         timestamp=timestamp,
-        rounds=rounds
+        rounds=rounds,
+        verbosity=Verbosity[arguments.verbosity.upper()],
+        event_sink=event_sink,
+        engine=EngineType[arguments.engine.upper()],
+        games=arguments.games,
+        players=arguments.players,
+        seed=arguments.seed,
+        workers=arguments.workers,
+        history_file=arguments.history_file,
+        plot_mode=PlotMode[arguments.plots.upper()],
+        line_chart_points=arguments.line_chart_points,
+        profile=arguments.profile,
+        profile_run=arguments.profile_run,
+        tolerance=arguments.tolerance,
+        criterion=ConvergenceCriterion[arguments.criterion.upper()],
+        check_interval=arguments.check_interval,
+        cache=cache,
+        bundle=arguments.bundle
     )
 
     game_statistics()
@@ -0,0 +1,9 @@
+from enum import Enum, auto
+
+
+class ConvergenceCriterion(Enum):
+
+    """Landing Probability Convergence Criterion."""
+
+    TOTAL_VARIATION = auto()
+    HALF_WIDTH = auto()
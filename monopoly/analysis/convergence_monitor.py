@@ -0,0 +1,209 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from monopoly.analysis.convergence_criterion import ConvergenceCriterion
+
+# Two-sided 95% Normal quantile of the confidence half-width
+CONFIDENCE_Z: float = 1.96
+
+# Number of batches before a confidence half-width is trusted
+MIN_BATCHES: int = 10
+
+
+class ConvergenceMonitor:
+
+    """Monopoly Landing Probability Convergence Monitor.
+
+    The monitor is fed cumulative Tile visit counts at checkpoints. With the
+    total variation criterion the precision is the total variation distance
+    between the landing probabilities of consecutive checkpoints. With the
+    half-width criterion every checkpoint closes a batch, and the precision
+    is the largest per Tile confidence half-width of the batch means. Both
+    only keep running sums, so a checkpoint costs a few vector operations.
+
+    Attributes:
+        tolerance (float): Precision below which the estimates converged.
+        criterion (ConvergenceCriterion): Convergence Criterion.
+        checkpoints (int): Number of checkpoints seen.
+        rounds (int): Number of rounds at the latest checkpoint.
+        precision (Optional[float]): Precision at the latest checkpoint,
+        None until it can be computed.
+        converged (bool): Whether the precision fell below the tolerance.
+        summary (Dict[str, Any]): Criterion, tolerance and achieved
+        precision.
+    """
+
+    def __init__(
+        self,
+        tolerance: float,
+        criterion: ConvergenceCriterion = ConvergenceCriterion.TOTAL_VARIATION
+    ) -> None:
+        """Initialize the Convergence Monitor Class.
+
+        Args:
+            tolerance (float): Precision below which the estimates converged.
+            criterion (ConvergenceCriterion, optional): Convergence
+            Criterion. Defaults to ConvergenceCriterion.TOTAL_VARIATION.
+        """
+        self.__tolerance: float = tolerance
+        self.__criterion: ConvergenceCriterion = criterion
+
+        # Checkpoint Related Attributes
+        self.__checkpoints: int = 0
+        self.__rounds: int = 0
+        self.__precision: Optional[float] = None
+        self.__visits: Optional[np.ndarray] = None
+
+        # Running sums of batch landing probabilities
+        self.__batch_sum: Optional[np.ndarray] = None
+        self.__batch_squares: Optional[np.ndarray] = None
+
+    @property
+    def tolerance(self) -> float:
+        """Return precision below which the estimates converged.
+
+        Returns:
+            float: Tolerance.
+        """
+        return self.__tolerance
+
+    @property
+    def criterion(self) -> ConvergenceCriterion:
+        """Return Convergence Criterion.
+
+        Returns:
+            ConvergenceCriterion: Convergence Criterion.
+        """
+        return self.__criterion
+
+    @property
+    def checkpoints(self) -> int:
+        """Return number of checkpoints seen.
+
+        Returns:
+            int: Number of checkpoints seen.
+        """
+        return self.__checkpoints
+
+    @property
+    def rounds(self) -> int:
+        """Return number of rounds at the latest checkpoint.
+
+        Returns:
+            int: Number of rounds at the latest checkpoint.
+        """
+        return self.__rounds
+
+    @property
+    def precision(self) -> Optional[float]:
+        """Return precision at the latest checkpoint.
+
+        Returns:
+            Optional[float]: Precision, None until it can be computed.
+        """
+        return self.__precision
+
+    @property
+    def converged(self) -> bool:
+        """Return whether the precision fell below the tolerance.
+
+        Returns:
+            bool: Whether the estimates converged.
+        """
+        return (
+            self.__precision is not None
+            and self.__precision < self.__tolerance
+        )
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Return criterion, tolerance and achieved precision.
+
+        Returns:
+            Dict[str, Any]: Convergence summary.
+        """
+        return {
+            'criterion': self.__criterion.name.lower(),
+            'tolerance': self.__tolerance,
+            'precision': self.__precision,
+            'converged': self.converged,
+            'rounds': self.__rounds,
+            'checkpoints': self.__checkpoints
+        }
+
+    def __total_variation(self, visits: np.ndarray) -> Optional[float]:
+        """Return total variation distance to the previous checkpoint.
+
+        Args:
+            visits (np.ndarray): Cumulative Tile visit counts.
+
+        Returns:
+            Optional[float]: Distance, None at the first checkpoint.
+        """
+        if self.__visits is None:
+            return None
+
+        return float(
+            np.abs(
+                visits / visits.sum()
+                - self.__visits / self.__visits.sum()
+            ).sum() / 2
+        )
+
+    def __half_width(self, visits: np.ndarray) -> Optional[float]:
+        """Return largest confidence half-width of batch landing probabilities.
+
+        Args:
+            visits (np.ndarray): Cumulative Tile visit counts.
+
+        Returns:
+            Optional[float]: Half-width, None before enough batches.
+        """
+        batch: np.ndarray = visits.astype(np.float64)
+
+        if self.__visits is not None:
+            batch -= self.__visits
+
+        batch /= batch.sum()
+
+        if self.__batch_sum is None:
+            self.__batch_sum = np.zeros_like(batch)
+            self.__batch_squares = np.zeros_like(batch)
+
+        self.__batch_sum += batch
+        self.__batch_squares += batch ** 2
+
+        batches: int = self.__checkpoints + 1
+
+        if batches < MIN_BATCHES:
+            return None
+
+        mean: np.ndarray = self.__batch_sum / batches
+        variance: np.ndarray = np.maximum(
+            (self.__batch_squares - batches * mean ** 2) / (batches - 1), 0
+        )
+
+        return float(CONFIDENCE_Z * np.sqrt(variance.max() / batches))
+
+    def update(self, visits: np.ndarray, rounds: int) -> bool:
+        """Record checkpoint and check convergence.
+
+        Args:
+            visits (np.ndarray): Cumulative Tile visit counts.
+            rounds (int): Number of rounds simulated so far.
+
+        Returns:
+            bool: Whether the estimates converged.
+        """
+        match self.__criterion:
+            case ConvergenceCriterion.TOTAL_VARIATION:
+                self.__precision = self.__total_variation(visits)
+            case ConvergenceCriterion.HALF_WIDTH:
+                self.__precision = self.__half_width(visits)
+
+        self.__visits = visits.copy()
+        self.__rounds = rounds
+        self.__checkpoints += 1
+
+        return self.converged
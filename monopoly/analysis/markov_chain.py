@@ -0,0 +1,481 @@
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+from monopoly.dice.dice import MAX_ROLL, OUTCOMES
+from monopoly.engine.card_actions import compile_deck, compile_tile_decks
+from monopoly.engine.simulation_result import SimulationResult
+from monopoly.history.round_history import RoundHistory
+from monopoly.rules.rules import Rules
+
+# Position, consecutive double rolls, Jail turns left, held Jail Card Decks
+State = Tuple[int, int, int, Tuple[int, ...]]
+
+# Probability, next State, visited Tiles, 'GO' crossings, recorded roll
+Transition = Tuple[float, State, Tuple[int, ...], int, int]
+
+
+class MarkovChain:
+
+    """Monopoly Markov Chain.
+
+    Every turn of a single Player is a step of a finite Markov Chain whose
+    State is the position, the number of consecutive double rolls, the Jail
+    turns left and the held Get Out of Jail Cards (in the order they were
+    drawn). Cards are drawn uniformly from the Cards left in their Deck,
+    which models a shuffled Deck in the long run.
+
+    Attributes:
+        states (List[State]): Reachable States.
+        transition_matrix (np.ndarray): Turn transition probabilities.
+        stationary_distribution (np.ndarray): Long run State probabilities.
+        visits_per_turn (np.ndarray): Expected Tile visits per turn.
+        crossings_per_turn (float): Expected 'GO' crossings per turn.
+        roll_counts_per_turn (np.ndarray): Expected recorded rolls per turn
+        indexed by rolled sum.
+        landing_probabilities (np.ndarray): Share of visits of every Tile.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        chances: Deck,
+        community_chests: Deck,
+        rules: Optional[Rules] = None
+    ) -> None:
+        """Initialize the Markov Chain Class.
+
+        Args:
+            board (Board): Monopoly Board.
+            chances (Deck): Chance Cards Deck.
+            community_chests (Deck): Community Chest Cards Deck.
+            rules (Optional[Rules], optional): House Rules. Defaults to the
+            standard Rules.
+        """
+        self.__board: Board = board
+        self.__rules: Rules = rules if rules is not None else Rules()
+
+        # Board Related Attributes
+        self.__board_length: int = len(board.tiles)
+        self.__jail: int = board.map['Jail']
+        self.__visiting_jail: int = board.map['Visiting Jail']
+        self.__go_to_jail: int = board.map['Go To Jail']
+        self.__tile_decks: List[int] = compile_tile_decks(board).tolist()
+        self.__decks: List[Tuple[list, ...]] = [
+            tuple(actions.tolist() for actions in compile_deck(board, deck))
+            for deck in [chances, community_chests]
+        ]
+        self.__card_outcomes_cache: Dict[
+            Tuple[int, int], List[Tuple[float, int]]
+        ] = {}
+
+        # Chain Related Attributes
+        self.__states: List[State] = []
+        self.__index: Dict[State, int] = {}
+        self.__transition_matrix: np.ndarray = np.empty((0, 0))
+        self.__visits: np.ndarray = np.empty((0, self.__board_length))
+        self.__crossings: np.ndarray = np.empty(0)
+        self.__rolls: np.ndarray = np.empty((0, MAX_ROLL + 1))
+        self.__stationary_distribution: np.ndarray = np.empty(0)
+
+        self.__build()
+        self.__solve()
+
+    @property
+    def states(self) -> List[State]:
+        """Return reachable States.
+
+        Returns:
+            List[State]: Reachable States.
+        """
+        return self.__states
+
+    @property
+    def transition_matrix(self) -> np.ndarray:
+        """Return turn transition probabilities.
+
+        Returns:
+            np.ndarray: Transition probabilities with shape (states, states).
+        """
+        return self.__transition_matrix
+
+    @property
+    def stationary_distribution(self) -> np.ndarray:
+        """Return long run State probabilities.
+
+        Returns:
+            np.ndarray: Long run State probabilities.
+        """
+        return self.__stationary_distribution
+
+    @property
+    def visits_per_turn(self) -> np.ndarray:
+        """Return expected Tile visits per turn.
+
+        Returns:
+            np.ndarray: Expected Tile visits per turn in Board order.
+        """
+        return self.__stationary_distribution @ self.__visits
+
+    @property
+    def crossings_per_turn(self) -> float:
+        """Return expected 'GO' crossings per turn.
+
+        Returns:
+            float: Expected 'GO' crossings per turn.
+        """
+        return float(self.__stationary_distribution @ self.__crossings)
+
+    @property
+    def roll_counts_per_turn(self) -> np.ndarray:
+        """Return expected recorded rolls per turn.
+
+        Returns:
+            np.ndarray: Expected recorded rolls indexed by rolled sum.
+        """
+        return self.__stationary_distribution @ self.__rolls
+
+    @property
+    def landing_probabilities(self) -> np.ndarray:
+        """Return share of visits of every Tile.
+
+        Returns:
+            np.ndarray: Share of visits in Board order.
+        """
+        visits: np.ndarray = self.visits_per_turn
+
+        return visits / visits.sum()
+
+    def __card_outcomes(
+        self,
+        deck_index: int,
+        held: Tuple[int, ...]
+    ) -> List[Tuple[float, int]]:
+        """List Card draw outcomes of Deck.
+
+        Args:
+            deck_index (int): Deck index.
+            held (Tuple[int, ...]): Decks of held Get Out of Jail Cards.
+
+        Returns:
+            List[Tuple[float, int]]: Probability and index of drawn Card,
+            every Get Out of Jail Card is represented by the first one.
+        """
+        held_cards: int = held.count(deck_index)
+        key: Tuple[int, int] = (deck_index, held_cards)
+
+        if key in self.__card_outcomes_cache:
+            return self.__card_outcomes_cache[key]
+
+        jail_cards: List[bool] = self.__decks[deck_index][1]
+        drawable: int = len(jail_cards) - held_cards
+
+        outcomes: List[Tuple[float, int]] = [
+            (1 / drawable, card)
+            for card, jail_card in enumerate(jail_cards)
+            if not jail_card
+        ]
+
+        if sum(jail_cards) > held_cards:
+            outcomes.append(
+                (
+                    (sum(jail_cards) - held_cards) / drawable,
+                    jail_cards.index(True)
+                )
+            )
+
+        self.__card_outcomes_cache[key] = outcomes
+
+        return outcomes
+
+    def __land(
+        self,
+        probability: float,
+        position: int,
+        doubles: int,
+        held: Tuple[int, ...],
+        visits: Tuple[int, ...],
+        crossings: int,
+        roll: int
+    ) -> List[Transition]:
+        """Resolve landing on Tile during a regular round.
+
+        Args:
+            probability (float): Probability of landing.
+            position (int): Landing position.
+            doubles (int): Consecutive double rolls.
+            held (Tuple[int, ...]): Decks of held Get Out of Jail Cards.
+            visits (Tuple[int, ...]): Tiles visited so far.
+            crossings (int): 'GO' crossings so far.
+            roll (int): Recorded roll.
+
+        Returns:
+            List[Transition]: Transitions after landing.
+        """
+        deck_index: int = self.__tile_decks[position]
+
+        if deck_index < 0:
+            return [
+                (
+                    probability,
+                    (position, doubles, self.__rules.jail_time, held),
+                    visits,
+                    crossings,
+                    roll
+                )
+            ]
+
+        travel, jail_cards, destinations, passes_go = self.__decks[deck_index]
+        transitions: List[Transition] = []
+
+        for card_probability, card in self.__card_outcomes(deck_index, held):
+            new_position: int = position
+            new_held: Tuple[int, ...] = held
+            new_visits: Tuple[int, ...] = visits
+            new_crossings: int = crossings
+
+            if jail_cards[card]:
+                new_held = held + (deck_index,)
+
+            elif travel[card]:
+                new_crossings += passes_go[card][position]
+                new_position = destinations[card][position]
+
+                # 'Go To Jail' Tile
+                if new_position == self.__go_to_jail:
+                    new_visits += (new_position,)
+                    new_position = self.__jail
+
+                new_visits += (new_position,)
+
+            transitions.append(
+                (
+                    probability * card_probability,
+                    (
+                        new_position,
+                        doubles,
+                        self.__rules.jail_time,
+                        new_held
+                    ),
+                    new_visits,
+                    new_crossings,
+                    roll
+                )
+            )
+
+        return transitions
+
+    def __transitions(self, state: State) -> List[Transition]:
+        """List every Transition from State.
+
+        Args:
+            state (State): Current State.
+
+        Returns:
+            List[Transition]: Transitions of a single turn.
+        """
+        position, doubles, jail_time, held = state
+        doubles_limit: int = self.__rules.doubles_limit
+        transitions: List[Transition] = []
+
+        for (roll, double), count in Counter(OUTCOMES).items():
+            probability: float = count / len(OUTCOMES)
+
+            # Consecutive double rolls above the limit behave the same
+            if double:
+                new_doubles: int = min(doubles + 1, doubles_limit + 1)
+
+            # Limit of double rolls followed by a regular roll
+            elif doubles == doubles_limit:
+                transitions.append(
+                    (probability, (self.__jail, 0, jail_time, held), (), 0, 0)
+                )
+                continue
+
+            else:
+                new_doubles = 0
+
+            # In Jail
+            if position == self.__jail:
+                new_held: Tuple[int, ...] = held
+
+                # Use 'Get Out of Jail' Card
+                if held:
+                    new_held = held[:-1]
+
+                # Try 3x to get out of Jail
+                elif jail_time > 0 and new_doubles < 1:
+                    transitions.append(
+                        (
+                            probability,
+                            (position, new_doubles, jail_time - 1, held),
+                            (),
+                            0,
+                            roll
+                        )
+                    )
+                    continue
+
+                transitions.append(
+                    (
+                        probability,
+                        (
+                            position + roll,
+                            new_doubles,
+                            self.__rules.jail_time,
+                            new_held
+                        ),
+                        (position + roll,),
+                        0,
+                        roll
+                    )
+                )
+                continue
+
+            # Not in Jail
+            new_position: int = position + roll
+            crossings: int = int(new_position >= self.__board_length)
+            new_position %= self.__board_length
+
+            # 'Just Visiting Jail' Tile, otherwise the Player stays in Jail
+            if new_position == self.__jail and self.__rules.just_visiting:
+                new_position = self.__visiting_jail
+
+            visits: Tuple[int, ...] = ()
+
+            # 'Go To Jail' Tile
+            if new_position == self.__go_to_jail:
+                visits = (new_position,)
+                new_position = self.__jail
+
+            transitions.extend(
+                self.__land(
+                    probability,
+                    new_position,
+                    new_doubles,
+                    held,
+                    visits + (new_position,),
+                    crossings,
+                    roll
+                )
+            )
+
+        return transitions
+
+    def __build(self) -> None:
+        """Build Transition Matrix of every reachable State."""
+        initial: State = (0, 0, self.__rules.jail_time, ())
+        self.__index[initial] = 0
+        self.__states.append(initial)
+
+        queue: Deque[State] = deque([initial])
+        entries: List[Tuple[int, int, float]] = []
+        visits: List[Tuple[int, int, float]] = []
+        crossings: List[Tuple[int, float]] = []
+        rolls: List[Tuple[int, int, float]] = []
+
+        while queue:
+            state: State = queue.popleft()
+            source: int = self.__index[state]
+
+            for probability, next_state, visited, crossed, roll in (
+                self.__transitions(state)
+            ):
+                if next_state not in self.__index:
+                    self.__index[next_state] = len(self.__states)
+                    self.__states.append(next_state)
+                    queue.append(next_state)
+
+                entries.append((source, self.__index[next_state], probability))
+                visits.extend((source, tile, probability) for tile in visited)
+                crossings.append((source, crossed * probability))
+
+                if roll:
+                    rolls.append((source, roll, probability))
+
+        states: int = len(self.__states)
+
+        self.__transition_matrix = np.zeros((states, states))
+        self.__visits = np.zeros((states, self.__board_length))
+        self.__crossings = np.zeros(states)
+        self.__rolls = np.zeros((states, MAX_ROLL + 1))
+
+        for matrix, data in [
+            (self.__transition_matrix, entries),
+            (self.__visits, visits),
+            (self.__rolls, rolls)
+        ]:
+            rows, columns, values = map(np.array, zip(*data))
+            np.add.at(matrix, (rows, columns), values)
+
+        rows, values = map(np.array, zip(*crossings))
+        np.add.at(self.__crossings, rows, values)
+
+    def __solve(self) -> None:
+        """Solve for the Stationary Distribution."""
+        states: int = len(self.__states)
+
+        # pi (P - I) = 0 with one equation replaced by sum(pi) = 1
+        equations: np.ndarray = self.__transition_matrix.T - np.eye(states)
+        equations[-1] = 1
+
+        constants: np.ndarray = np.zeros(states)
+        constants[-1] = 1
+
+        self.__stationary_distribution = np.linalg.solve(equations, constants)
+
+    def occupancy(self, turns: int) -> np.ndarray:
+        """Return Tile occupancy after every one of the first turns.
+
+        The distribution starting on the 'GO' Tile is propagated through
+        the Transition Matrix one turn at a time.
+
+        Args:
+            turns (int): Number of turns.
+
+        Returns:
+            np.ndarray: Probability of standing on every Tile after every
+            turn with shape (turns + 1, tiles), starting before the first.
+        """
+        positions: np.ndarray = np.array(
+            [position for position, *_ in self.__states]
+        )
+        distributions: np.ndarray = np.zeros((turns + 1, len(self.__states)))
+        distributions[0, 0] = 1
+
+        for turn in range(turns):
+            distributions[turn + 1] = (
+                distributions[turn] @ self.__transition_matrix
+            )
+
+        # Sum State probabilities by position
+        tiles: np.ndarray = np.zeros(
+            (len(self.__states), self.__board_length)
+        )
+        tiles[np.arange(len(self.__states)), positions] = 1
+
+        return distributions @ tiles
+
+    def expected_result(self, rounds: int) -> SimulationResult:
+        """Return expected Statistics of a single Player.
+
+        Args:
+            rounds (int): Number of rounds (Crossing the GO tile).
+
+        Returns:
+            SimulationResult: Expected visit and roll counts, rounded to
+            whole numbers, without Round History.
+        """
+        turns: float = rounds / self.crossings_per_turn
+
+        return SimulationResult(
+            visits=np.rint(self.visits_per_turn * turns).astype(np.int64),
+            labels=[tile.label for tile in self.__board.tiles],
+            roll_counts=np.rint(self.roll_counts_per_turn * turns).astype(
+                np.int64
+            ),
+            round_history=RoundHistory(columns=self.__board_length)
+        )
@@ -0,0 +1,278 @@
+from typing import Dict, List
+
+import numpy as np
+
+from monopoly.board.board import Board
+from monopoly.board.tiles.property import Property
+from monopoly.dice.dice import OUTCOMES
+
+# Build levels of a Property, the Monopoly level owns the whole Group
+PROPERTY_LEVELS: List[str] = [
+    'Site', 'Monopoly', '1 House', '2 Houses', '3 Houses', '4 Houses', 'Hotel'
+]
+
+# Houses bought on every Property build level, a Hotel costs 5 Houses
+PROPERTY_HOUSES: np.ndarray = np.array([0, 0, 1, 2, 3, 4, 5])
+
+# Railroad price and rent by number of Railroads owned
+RAILROAD_PRICE: int = 200
+RAILROAD_RENTS: np.ndarray = np.array([25, 50, 100, 200])
+
+# Utility price and dice roll multiplier by number of Utilities owned
+UTILITY_PRICE: int = 150
+UTILITY_MULTIPLIERS: np.ndarray = np.array([4, 10])
+
+# Expected sum of a dice roll
+MEAN_ROLL: float = float(np.mean([roll for roll, _ in OUTCOMES]))
+
+
+class PropertyEconomics:
+
+    """Expected Rent Income of Properties, Railroads and Utilities.
+
+    Expected Tile landings per opponent turn are combined with the rent of
+    every build level (or number of Railroads and Utilities owned). The
+    results are a few array operations over all levels at once, no
+    payments are simulated. Utility rents use the expected dice roll.
+    Double rents charged when sent by a Card are not modelled.
+
+    Attributes:
+        landings (np.ndarray): Expected landings per opponent turn of every
+        Tile.
+        tile_summary (Dict[str, np.ndarray]): Tile, Group, level, rent,
+        investment, income per opponent turn, return on investment and
+        break-even opponent turns of every owned Tile and level.
+        group_summary (Dict[str, np.ndarray]): The same of every Group and
+        level which requires owning the whole Group.
+    """
+
+    def __init__(self, board: Board, landings: np.ndarray) -> None:
+        """Initialize the Property Economics Class.
+
+        Args:
+            board (Board): Monopoly Board.
+            landings (np.ndarray): Expected landings per opponent turn of
+            every Tile in Board order.
+        """
+        self.__board: Board = board
+        self.__landings: np.ndarray = landings
+
+        # Level codes index the names of every kind of level
+        self.__level_names: List[str] = PROPERTY_LEVELS.copy()
+
+        self.__tiles: np.ndarray = np.empty(0, dtype=np.int64)
+        self.__levels: np.ndarray = np.empty(0, dtype=np.int64)
+        self.__rents: np.ndarray = np.empty(0)
+        self.__investments: np.ndarray = np.empty(0)
+        self.__complete: np.ndarray = np.empty(0, dtype=bool)
+
+        self.__compile_rent_tables()
+
+    @property
+    def landings(self) -> np.ndarray:
+        """Return expected landings per opponent turn.
+
+        Returns:
+            np.ndarray: Expected landings in Board order.
+        """
+        return self.__landings
+
+    @property
+    def tile_summary(self) -> Dict[str, np.ndarray]:
+        """Return economics of every owned Tile and level.
+
+        Returns:
+            Dict[str, np.ndarray]: Columns of equal length.
+        """
+        labels: np.ndarray = np.array(
+            [tile.label for tile in self.__board.tiles], dtype=object
+        )
+
+        return self.__summary(
+            labels[self.__tiles],
+            self.__board.group_ids[self.__tiles],
+            self.__levels,
+            self.__rents,
+            self.__investments,
+            self.__landings[self.__tiles] * self.__rents
+        )
+
+    @property
+    def group_summary(self) -> Dict[str, np.ndarray]:
+        """Return economics of owning every Tile of a Group.
+
+        Returns:
+            Dict[str, np.ndarray]: Columns of equal length.
+        """
+        group_ids: np.ndarray = self.__board.group_ids[
+            self.__tiles[self.__complete]
+        ]
+        levels: np.ndarray = self.__levels[self.__complete]
+
+        # Sum the Tiles sharing Group and level
+        keys, rows = np.unique(
+            group_ids * len(self.__level_names) + levels, return_inverse=True
+        )
+        group_ids, levels = np.divmod(keys, len(self.__level_names))
+
+        return self.__summary(
+            np.array(self.__board.groups, dtype=object)[group_ids],
+            group_ids,
+            levels,
+            np.bincount(rows, weights=self.__rents[self.__complete]),
+            np.bincount(rows, weights=self.__investments[self.__complete]),
+            np.bincount(
+                rows,
+                weights=(
+                    self.__landings[self.__tiles] * self.__rents
+                )[self.__complete]
+            )
+        )
+
+    def __summary(
+        self,
+        names: np.ndarray,
+        group_ids: np.ndarray,
+        levels: np.ndarray,
+        rents: np.ndarray,
+        investments: np.ndarray,
+        income: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Derive return on investment and break-even turns.
+
+        Args:
+            names (np.ndarray): Tile or Group name of every row.
+            group_ids (np.ndarray): Group index of every row.
+            levels (np.ndarray): Level code of every row.
+            rents (np.ndarray): Rent of every row.
+            investments (np.ndarray): Investment of every row.
+            income (np.ndarray): Expected income per opponent turn.
+
+        Returns:
+            Dict[str, np.ndarray]: Columns of equal length.
+        """
+        return {
+            'name': names,
+            'group': np.array(self.__board.groups, dtype=object)[group_ids],
+            'level': np.array(self.__level_names, dtype=object)[levels],
+            'rent': rents,
+            'investment': investments,
+            'income_per_turn': income,
+            'return_on_investment': income / investments,
+            'break_even_turns': np.divide(
+                investments,
+                income,
+                out=np.full(len(income), np.inf),
+                where=income > 0
+            )
+        }
+
+    def __add_levels(
+        self,
+        tiles: List[int],
+        names: List[str],
+        rents: np.ndarray,
+        investments: np.ndarray,
+        complete: np.ndarray
+    ) -> None:
+        """Append every level of given Tiles.
+
+        Args:
+            tiles (List[int]): Tile indices.
+            names (List[str]): Level names, new ones are registered.
+            rents (np.ndarray): Rents with shape (tiles, levels).
+            investments (np.ndarray): Investments with shape (tiles, levels).
+            complete (np.ndarray): Whether every level requires owning the
+            whole Group.
+        """
+        for name in names:
+            if name not in self.__level_names:
+                self.__level_names.append(name)
+
+        codes: np.ndarray = np.array(
+            [self.__level_names.index(name) for name in names]
+        )
+
+        self.__tiles = np.concatenate(
+            [self.__tiles, np.repeat(tiles, len(names))]
+        )
+        self.__levels = np.concatenate(
+            [self.__levels, np.tile(codes, len(tiles))]
+        )
+        self.__rents = np.concatenate([self.__rents, rents.ravel()])
+        self.__investments = np.concatenate(
+            [self.__investments, investments.ravel()]
+        )
+        self.__complete = np.concatenate(
+            [self.__complete, np.tile(complete, len(tiles))]
+        )
+
+    def __compile_rent_tables(self) -> None:
+        """Compile rent and investment of every owned Tile and level."""
+        properties: List[int] = [
+            index for index, tile in enumerate(self.__board.tiles)
+            if isinstance(tile, Property)
+        ]
+
+        # Prices are kept as parsed from the Board Data File
+        prices: np.ndarray = np.array(
+            [int(self.__board.tiles[index].price) for index in properties]
+        )
+        prices_per_house: np.ndarray = np.array(
+            [
+                int(self.__board.tiles[index].price_per_house)
+                for index in properties
+            ]
+        )
+        rents: np.ndarray = np.array(
+            [self.__board.tiles[index].rents for index in properties]
+        )
+
+        # Site, doubled Site rent of a Monopoly, Houses and Hotel
+        self.__add_levels(
+            tiles=properties,
+            names=PROPERTY_LEVELS,
+            rents=np.column_stack(
+                [rents[:, :1], 2 * rents[:, :1], rents[:, 1:]]
+            ),
+            investments=(
+                prices[:, np.newaxis]
+                + prices_per_house[:, np.newaxis] * PROPERTY_HOUSES
+            ),
+            complete=np.arange(len(PROPERTY_LEVELS)) > 0
+        )
+
+        # Rent grows with the number of owned Tiles of the same kind
+        for tiles, price, owned_rents, singular, plural in [
+            (
+                self.__board.railroads,
+                RAILROAD_PRICE,
+                RAILROAD_RENTS,
+                'Railroad',
+                'Railroads'
+            ),
+            (
+                self.__board.utilities,
+                UTILITY_PRICE,
+                UTILITY_MULTIPLIERS * MEAN_ROLL,
+                'Utility',
+                'Utilities'
+            )
+        ]:
+            owned: int = min(len(tiles), len(owned_rents))
+
+            if owned == 0:
+                continue
+
+            self.__add_levels(
+                tiles=tiles,
+                names=[
+                    f'{count} {singular if count == 1 else plural}'
+                    for count in range(1, owned + 1)
+                ],
+                rents=np.tile(
+                    owned_rents[:owned].astype(np.float64), (len(tiles), 1)
+                ),
+                investments=np.full((len(tiles), owned), float(price)),
+                complete=np.arange(1, owned + 1) == len(tiles)
+            )
@@ -1,4 +1,6 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
 
 from monopoly.board.tiles.property import Property
 from monopoly.board.tiles.tile import Tile
@@ -14,6 +16,13 @@ class Board:
         map (Dict[str, int]): Monopoly Board Map.
         railroads (List[int]): Railroad Locations.
         utilities (List[int]): Utility Locations.
+        destination_kinds (Dict[str, int]): Travel destination codes.
+        next_tiles (np.ndarray): New position by current position and
+        destination code.
+        passes_go (np.ndarray): Whether travelling passes the 'GO' Tile by
+        current position and destination code.
+        groups (List[str]): Sorted Tile Group names.
+        group_ids (np.ndarray): Group index of every Tile.
     """
 
     def __init__(self, file: str) -> None:
@@ -32,6 +41,23 @@ class Board:
 
         self.__initialize_board(file)
 
+        # Travel Card Lookup Tables
+        self.__destination_kinds: Dict[str, int] = {}
+        self.__next_tiles: np.ndarray = np.empty((0, 0), dtype=np.int64)
+        self.__passes_go: np.ndarray = np.empty((0, 0), dtype=bool)
+
+        self.__compile_travel_tables()
+
+        # Tile Groups, labels without the '#' numbering
+        group_labels: List[str] = [
+            tile.label.split('#')[0].strip() for tile in self.__tiles
+        ]
+
+        self.__groups: List[str] = sorted(set(group_labels))
+        self.__group_ids: np.ndarray = np.array(
+            [self.__groups.index(label) for label in group_labels]
+        )
+
     @property
     def tiles(self) -> List[Tile]:
         """Return Board Tiles.
@@ -68,6 +94,149 @@ class Board:
         """
         return self.__utilities
 
+    @property
+    def destination_kinds(self) -> Dict[str, int]:
+        """Return Travel destination codes.
+
+        Returns:
+            Dict[str, int]: Code of every Travel Card destination.
+        """
+        return self.__destination_kinds
+
+    @property
+    def next_tiles(self) -> np.ndarray:
+        """Return new position after travelling.
+
+        Returns:
+            np.ndarray: New position with shape (tiles, destination codes).
+        """
+        return self.__next_tiles
+
+    @property
+    def passes_go(self) -> np.ndarray:
+        """Return whether travelling passes the 'GO' Tile.
+
+        Returns:
+            np.ndarray: 'GO' passing flags with shape (tiles, destination
+            codes).
+        """
+        return self.__passes_go
+
+    @property
+    def groups(self) -> List[str]:
+        """Return sorted Tile Group names.
+
+        Returns:
+            List[str]: Sorted Tile Group names.
+        """
+        return self.__groups
+
+    @property
+    def group_ids(self) -> np.ndarray:
+        """Return Group index of every Tile.
+
+        Returns:
+            np.ndarray: Index into groups of every Tile in Board order.
+        """
+        return self.__group_ids
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Return Board as arrays, ready to be stored in a binary bundle.
+
+        Returns:
+            Dict[str, np.ndarray]: Tile fields, mapping, Special Tile
+            locations, Travel lookup tables and Tile Groups.
+        """
+        properties: List[Property] = [
+            tile for tile in self.__tiles if isinstance(tile, Property)
+        ]
+        rents: int = max((len(tile.rents) for tile in properties), default=0)
+
+        return {
+            'labels': np.array([tile.label for tile in self.__tiles]),
+            'names': np.array([tile.name for tile in self.__tiles]),
+            'types': np.array(
+                [tile.tile_type.value for tile in self.__tiles]
+            ),
+            'properties': np.array(
+                [isinstance(tile, Property) for tile in self.__tiles]
+            ),
+            'prices': np.array(
+                [str(tile.price) for tile in properties], dtype=str
+            ),
+            'prices_per_house': np.array(
+                [str(tile.price_per_house) for tile in properties], dtype=str
+            ),
+            'rents': np.array(
+                [tile.rents for tile in properties], dtype=np.int64
+            ).reshape(len(properties), rents),
+            'mortgages': np.array(
+                [str(tile.mortgage) for tile in properties], dtype=str
+            ),
+            'map_names': np.array(list(self.__map), dtype=str),
+            'map_indices': np.array(
+                list(self.__map.values()), dtype=np.int64
+            ),
+            'railroads': np.array(self.__railroads, dtype=np.int64),
+            'utilities': np.array(self.__utilities, dtype=np.int64),
+            'destination_kinds': np.array(
+                list(self.__destination_kinds), dtype=str
+            ),
+            'next_tiles': self.__next_tiles,
+            'passes_go': self.__passes_go,
+            'groups': np.array(self.__groups, dtype=str),
+            'group_ids': self.__group_ids
+        }
+
+    @staticmethod
+    def from_arrays(arrays: Dict[str, np.ndarray]) -> 'Board':
+        """Build Board from arrays without reading the Board Data File.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): Arrays returned by to_arrays.
+
+        Returns:
+            Board: Monopoly Board.
+        """
+        board: Board = Board.__new__(Board)
+
+        # Price, price per house, rents and mortgage of every Property
+        fields: Iterator[Tuple[str, str, List[int], str]] = zip(
+            arrays['prices'].tolist(),
+            arrays['prices_per_house'].tolist(),
+            arrays['rents'].tolist(),
+            arrays['mortgages'].tolist()
+        )
+
+        board.__tiles = [
+            Property(label, name, TileType(tile_type), *next(fields))
+            if is_property else Tile(label, name, TileType(tile_type))
+            for label, name, tile_type, is_property in zip(
+                arrays['labels'].tolist(),
+                arrays['names'].tolist(),
+                arrays['types'].tolist(),
+                arrays['properties'].tolist()
+            )
+        ]
+
+        board.__map = dict(
+            zip(arrays['map_names'].tolist(), arrays['map_indices'].tolist())
+        )
+        board.__railroads = arrays['railroads'].tolist()
+        board.__utilities = arrays['utilities'].tolist()
+        board.__destination_kinds = {
+            destination: code
+            for code, destination in enumerate(
+                arrays['destination_kinds'].tolist()
+            )
+        }
+        board.__next_tiles = arrays['next_tiles']
+        board.__passes_go = arrays['passes_go']
+        board.__groups = arrays['groups'].tolist()
+        board.__group_ids = arrays['group_ids']
+
+        return board
+
     @staticmethod
     def __read_input_data(file: str) -> List[str]:
         """Load Data from Input Data File.
@@ -171,3 +340,40 @@ class Board:
         for index, tile in enumerate(tiles):
             self.__update_mapping(index, tile)
             self.__tiles.append(self.__create_tile(tile))
+
+    def __compile_travel_tables(self) -> None:
+        """Compile Travel destinations to lookup tables."""
+        board_length: int = len(self.__tiles)
+        positions: np.ndarray = np.arange(board_length)
+
+        next_tiles: List[np.ndarray] = []
+        passes_go: List[np.ndarray] = []
+
+        # Move back 3 Tiles, never passing the 'GO' Tile
+        self.__destination_kinds['3 Spaces'] = len(next_tiles)
+        next_tiles.append((positions - 3) % board_length)
+        passes_go.append(np.zeros(board_length, dtype=bool))
+
+        # Nearest Special Tile after every position, wrapping around
+        for destination, tiles in [
+            ('Railroad', self.__railroads),
+            ('Utility', self.__utilities)
+        ]:
+            nearest: np.ndarray = np.array(tiles)[
+                np.searchsorted(tiles, positions, 'right') % len(tiles)
+            ]
+
+            self.__destination_kinds[destination] = len(next_tiles)
+            next_tiles.append(nearest)
+            passes_go.append(positions > nearest)
+
+        # Named Tiles, going to 'Jail' never passes the 'GO' Tile
+        for destination, index in self.__map.items():
+            self.__destination_kinds[destination] = len(next_tiles)
+            next_tiles.append(np.full(board_length, index))
+            passes_go.append(
+                (positions > index) & (destination != 'Jail')
+            )
+
+        self.__next_tiles = np.stack(next_tiles, axis=1)
+        self.__passes_go = np.stack(passes_go, axis=1)
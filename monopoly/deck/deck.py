@@ -1,38 +1,62 @@
-from random import shuffle
-from typing import List
+from copy import deepcopy
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from monopoly.board.board import Board
 from monopoly.deck.cards.card import Card
 from monopoly.deck.cards.card_action_types import CardActionType
 from monopoly.deck.cards.money_card import MoneyCard
 from monopoly.deck.cards.travel_card import TravelCard
 
+# Card order, cursor, number of drawable Cards and held Card flags
+DeckState = Tuple[np.ndarray, int, int, np.ndarray]
+
 
 class Deck:
 
     """Monopoly Card Deck.
 
+    Cards are never moved. The Deck keeps a permutation of Card indices and a
+    cursor to the next Card to draw. Cards before the cursor form the discard
+    pile, held Cards are kept at the end of the permutation until returned.
+
     Attributes:
-        cards (List[Card]): Cards in Deck.
+        cards (List[Card]): Every Card of the Deck in input file order.
         discard_pile (List[Card]): Discarded Cards from Deck.
+        action_codes (np.ndarray): Card Action Type value of every Card.
+        state (DeckState): Snapshot of the Deck order.
     """
 
-    __cards: List[Card] = []
-    __discard_pile: List[Card] = []
-
-    def __init__(self, file: str) -> None:
+    def __init__(
+        self,
+        file: str,
+        rng: Optional[np.random.Generator] = None
+    ) -> None:
         """Initialize the Deck Class.
 
         Args:
             file (str): Input Data File Path.
+            rng (Optional[np.random.Generator], optional): Random Number
+            Generator used for shuffling. Defaults to a freshly seeded
+            Generator.
         """
+        self.__rng: np.random.Generator = (
+            rng if rng is not None else np.random.default_rng()
+        )
+        self.__cards: List[Card] = []
         self.__set_up_deck(file)
 
+        # Travel destination codes of the last Board, -1 for other Cards
+        self.__board: Optional[Board] = None
+        self.__travel_kinds: np.ndarray = np.empty(0, dtype=np.int64)
+
     @property
     def cards(self) -> List[Card]:
-        """Return Cards in Deck.
+        """Return every Card of the Deck.
 
         Returns:
-            List[Card]: Cards in Deck.
+            List[Card]: Every Card of the Deck in input file order.
         """
         return self.__cards
 
@@ -43,7 +67,35 @@ class Deck:
         Returns:
             List[Card]: Cards in Discard Pile.
         """
-        return self.__discard_pile
+        return [
+            self.__cards[index]
+            for index in self.__order[:self.__cursor]
+            if not self.__held[index]
+        ]
+
+    @property
+    def action_codes(self) -> np.ndarray:
+        """Return Card Action Type value of every Card.
+
+        Returns:
+            np.ndarray: Card Action Type value of every Card.
+        """
+        return self.__action_codes
+
+    @property
+    def state(self) -> DeckState:
+        """Return snapshot of the Deck order.
+
+        Returns:
+            DeckState: Card order, cursor, number of drawable Cards and held
+            Card flags.
+        """
+        return (
+            self.__order.copy(),
+            self.__cursor,
+            self.__drawable,
+            self.__held.copy()
+        )
 
     @staticmethod
     def __read_input_data(file: str) -> List[str]:
@@ -95,7 +147,181 @@ class Deck:
         for item in self.__read_input_data(file):
             self.__cards.append(self.__create_card(item))
 
-        shuffle(self.__cards)
+        self.__set_up_order()
+
+    def __set_up_order(self) -> None:
+        """Set up Card Actions and shuffle the Deck order."""
+        self.__order: np.ndarray = np.arange(len(self.__cards))
+        self.__held: np.ndarray = np.zeros(len(self.__cards), dtype=bool)
+        self.__action_codes: np.ndarray = np.array(
+            [card.card_type.value for card in self.__cards]
+        )
+        self.__jail_cards: np.ndarray = (
+            self.__action_codes == CardActionType.GET_OUT_OF_JAIL.value
+        )
+        self.__cursor: int = 0
+        self.__drawable: int = len(self.__cards)
+
+        self.__rng.shuffle(self.__order)
+
+    def __reshuffle(self) -> None:
+        """Shuffle Discard Pile back into the Deck, leaving out held Cards.
+
+        Raises:
+            RuntimeError: Every Card is held, so none can be drawn.
+        """
+        if self.__held.all():
+            raise RuntimeError(
+                f'All {len(self.__cards)} Cards of the Deck are held, there '
+                'is no Card to draw'
+            )
+
+        self.__drawable = 0
+
+        # Move Cards which are not held to the front
+        for position, index in enumerate(self.__order):
+            if not self.__held[index]:
+                self.__order[position] = self.__order[self.__drawable]
+                self.__order[self.__drawable] = index
+                self.__drawable += 1
+
+        self.__rng.shuffle(self.__order[:self.__drawable])
+        self.__cursor = 0
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Return Cards as arrays, ready to be stored in a binary bundle.
+
+        Returns:
+            Dict[str, np.ndarray]: Texts, Action codes, Travel destinations
+            and Money payers, receivers and amounts of every Card.
+        """
+        amounts: List[List[int]] = [
+            card.amount if isinstance(card, MoneyCard) else []
+            for card in self.__cards
+        ]
+        width: int = max((len(amount) for amount in amounts), default=0)
+
+        return {
+            'texts': np.array([card.text for card in self.__cards], dtype=str),
+            'action_codes': self.__action_codes,
+            'destinations': np.array(
+                [
+                    card.destination if isinstance(card, TravelCard) else ''
+                    for card in self.__cards
+                ],
+                dtype=str
+            ),
+            'payers': np.array(
+                [
+                    card.payer if isinstance(card, MoneyCard) else ''
+                    for card in self.__cards
+                ],
+                dtype=str
+            ),
+            'receivers': np.array(
+                [
+                    card.receiver if isinstance(card, MoneyCard) else ''
+                    for card in self.__cards
+                ],
+                dtype=str
+            ),
+            'amounts': np.array(
+                [amount + [0] * (width - len(amount)) for amount in amounts],
+                dtype=np.int64
+            ).reshape(len(amounts), width),
+            'amount_lengths': np.array(
+                [len(amount) for amount in amounts], dtype=np.int64
+            )
+        }
+
+    @staticmethod
+    def from_arrays(
+        arrays: Dict[str, np.ndarray],
+        rng: Optional[np.random.Generator] = None
+    ) -> 'Deck':
+        """Build Deck from arrays without reading the Input Data File.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): Arrays returned by to_arrays.
+            rng (Optional[np.random.Generator], optional): Random Number
+            Generator used for shuffling. Defaults to a freshly seeded
+            Generator.
+
+        Returns:
+            Deck: Shuffled Deck.
+        """
+        deck: Deck = Deck.__new__(Deck)
+
+        deck.__rng = rng if rng is not None else np.random.default_rng()
+        deck.__cards = []
+        deck.__board = None
+        deck.__travel_kinds = np.empty(0, dtype=np.int64)
+
+        for text, code, destination, payer, receiver, amount, length in zip(
+            arrays['texts'].tolist(),
+            arrays['action_codes'].tolist(),
+            arrays['destinations'].tolist(),
+            arrays['payers'].tolist(),
+            arrays['receivers'].tolist(),
+            arrays['amounts'].tolist(),
+            arrays['amount_lengths'].tolist()
+        ):
+            match CardActionType(code):
+                case CardActionType.TRAVEL:
+                    card: Card = TravelCard(text, destination)
+                case CardActionType.MONEY:
+                    card = MoneyCard(text, payer, receiver, amount[:length])
+                case action_type:
+                    card = Card(text, action_type)
+
+            deck.__cards.append(card)
+
+        deck.__set_up_order()
+
+        return deck
+
+    def travel_kinds(self, board: Board) -> np.ndarray:
+        """Return Travel destination code of every Card.
+
+        Destinations are compiled once per Board.
+
+        Args:
+            board (Board): Monopoly Board.
+
+        Returns:
+            np.ndarray: Destination code of every Travel Card on Board, -1
+            for other Cards.
+        """
+        if self.__board is not board:
+            self.__board = board
+            self.__travel_kinds = np.array(
+                [
+                    board.destination_kinds[card.destination]
+                    if card.card_type == CardActionType.TRAVEL else -1
+                    for card in self.__cards
+                ]
+            )
+
+        return self.__travel_kinds
+
+    def draw_card_index(self) -> int:
+        """Draw Card from Deck.
+
+        Returns:
+            int: Index of drawn Card in Cards.
+        """
+        # When there are no Cards to draw
+        if self.__cursor == self.__drawable:
+            self.__reshuffle()
+
+        index: int = int(self.__order[self.__cursor])
+        self.__cursor += 1
+
+        # 'Get Out of Jail' Cards are kept by the Player
+        if self.__jail_cards[index]:
+            self.__held[index] = True
+
+        return index
 
     def draw_card(self) -> Card:
         """Draw Card from Deck.
@@ -103,23 +329,63 @@ class Deck:
         Returns:
             Card: Drawn Card.
         """
-        drawn_card: Card = self.__cards.pop(0)
+        return self.__cards[self.draw_card_index()]
 
-        if drawn_card.card_type != CardActionType.GET_OUT_OF_JAIL:
-            self.discard_card(drawn_card)
+    def discard_card_index(self, index: int) -> None:
+        """Discard held Card to Discard Pile.
 
-        # When there are no Cards to draw
-        if len(self.__cards) == 0:
-            self.__cards.extend(self.__discard_pile)
-            shuffle(self.__cards)
-            self.__discard_pile = []
-
-        return drawn_card
+        Args:
+            index (int): Index of the held Card in Cards.
+        """
+        self.__held[index] = False
 
     def discard_card(self, card: Card) -> None:
-        """Discard Card to Discard Pile.
+        """Discard held Card to Discard Pile.
+
+        Only the few held Cards are searched, by identity, so Cards with the
+        same text are told apart.
+
+        Args:
+            card (Card): Card to Discard, as returned by draw_card.
+        """
+        for index in np.flatnonzero(self.__held):
+            if self.__cards[index] is card:
+                self.discard_card_index(int(index))
+                return
+
+    def restore(self, state: DeckState) -> None:
+        """Restore Deck order from snapshot.
 
         Args:
-            card (Card): Card to Discard.
+            state (DeckState): Snapshot taken from the state property.
+        """
+        order, self.__cursor, self.__drawable, held = state
+
+        self.__order[:] = order
+        self.__held[:] = held
+
+    def copy(self, rng: Optional[np.random.Generator] = None) -> 'Deck':
+        """Copy Deck sharing its Cards.
+
+        Args:
+            rng (Optional[np.random.Generator], optional): Random Number
+            Generator of the copy. Defaults to a copy of the current
+            Generator, so both Decks shuffle alike.
+
+        Returns:
+            Deck: Independent Deck in the same order.
         """
-        self.__discard_pile.append(card)
+        deck: Deck = Deck.__new__(Deck)
+
+        deck.__rng = rng if rng is not None else deepcopy(self.__rng)
+        deck.__cards = self.__cards
+        deck.__action_codes = self.__action_codes
+        deck.__jail_cards = self.__jail_cards
+        deck.__board = self.__board
+        deck.__travel_kinds = self.__travel_kinds
+        deck.__order = self.__order.copy()
+        deck.__held = self.__held.copy()
+        deck.__cursor = self.__cursor
+        deck.__drawable = self.__drawable
+
+        return deck
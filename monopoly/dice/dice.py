@@ -0,0 +1,67 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from monopoly.dice.dice_source import DiceSource
+
+# Highest possible sum of rolled numbers
+MAX_ROLL: int = 12
+
+# (Sum, Double roll) of every (first die, second die) outcome
+OUTCOMES: List[Tuple[int, bool]] = [
+    (first + second, first == second)
+    for first in range(1, 7)
+    for second in range(1, 7)
+]
+
+
+class Dice(DiceSource):
+
+    """Pair of fair six-sided Dice.
+
+    Outcome indices are drawn in large blocks from the Generator and mapped
+    through the precomputed outcome table, a new block is only drawn once
+    the previous one is used up.
+    """
+
+    def __init__(
+        self,
+        rng: Optional[np.random.Generator] = None,
+        block_size: int = 65536
+    ) -> None:
+        """Initialize the Dice Class.
+
+        Args:
+            rng (Optional[np.random.Generator], optional): Random Number
+            Generator. Defaults to a freshly seeded Generator.
+            block_size (int, optional): Number of pre-drawn rolls.
+            Defaults to 65536.
+        """
+        self.__rng: np.random.Generator = (
+            rng if rng is not None else np.random.default_rng()
+        )
+        self.__block_size: int = block_size
+        self.__outcomes: List[int] = []
+        self.__cursor: int = 0
+
+    def __refill(self) -> None:
+        """Draw new block of outcome indices."""
+        self.__outcomes = self.__rng.integers(
+            0, len(OUTCOMES), self.__block_size
+        ).tolist()
+        self.__cursor = 0
+
+    def roll(self) -> Tuple[int, bool]:
+        """Roll two dice.
+
+        Returns:
+            Tuple[int, bool]: Sum of rolled numbers and whether it was a
+            double roll.
+        """
+        if self.__cursor == len(self.__outcomes):
+            self.__refill()
+
+        outcome: int = self.__outcomes[self.__cursor]
+        self.__cursor += 1
+
+        return OUTCOMES[outcome]
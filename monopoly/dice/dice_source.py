@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+
+class DiceSource(ABC):
+
+    """Source of Dice Rolls."""
+
+    @abstractmethod
+    def roll(self) -> Tuple[int, bool]:
+        """Roll two dice.
+
+        Returns:
+            Tuple[int, bool]: Sum of rolled numbers and whether it was a
+            double roll.
+        """
@@ -0,0 +1,31 @@
+from typing import Iterable, Iterator, Tuple
+
+from monopoly.dice.dice_source import DiceSource
+
+
+class ScriptedDice(DiceSource):
+
+    """Dice replaying predefined rolls."""
+
+    def __init__(self, rolls: Iterable[Tuple[int, int]]) -> None:
+        """Initialize the Scripted Dice Class.
+
+        Args:
+            rolls (Iterable[Tuple[int, int]]): Rolled numbers of both dice in
+            order of rolling.
+        """
+        self.__rolls: Iterator[Tuple[int, int]] = iter(rolls)
+
+    def roll(self) -> Tuple[int, bool]:
+        """Roll two dice.
+
+        Raises:
+            StopIteration: All scripted rolls were used up.
+
+        Returns:
+            Tuple[int, bool]: Sum of rolled numbers and whether it was a
+            double roll.
+        """
+        first, second = next(self.__rolls)
+
+        return first + second, first == second
@@ -0,0 +1,58 @@
+from typing import Tuple
+
+import numpy as np
+
+from monopoly.board.board import Board
+from monopoly.board.tiles.tile_type import TileType
+from monopoly.deck.cards.card_action_types import CardActionType
+from monopoly.deck.deck import Deck
+
+
+def compile_tile_decks(board: Board) -> np.ndarray:
+    """Compile Deck drawn on every Tile.
+
+    Args:
+        board (Board): Monopoly Board.
+
+    Returns:
+        np.ndarray: 0 for Chance, 1 for Community Chest and -1 when no Card
+        is drawn, for every Tile.
+    """
+    return np.array(
+        [
+            {
+                TileType.CHANCE: 0,
+                TileType.COMMUNITY_CHEST: 1
+            }.get(tile.tile_type, -1)
+            for tile in board.tiles
+        ]
+    )
+
+
+def compile_deck(board: Board, deck: Deck) -> Tuple[np.ndarray, ...]:
+    """Compile Card Actions of Deck to arrays.
+
+    Args:
+        board (Board): Monopoly Board.
+        deck (Deck): Monopoly Card Deck.
+
+    Returns:
+        Tuple[np.ndarray, ...]: Travel Card flags, Get Out of Jail Card
+        flags, new positions and 'GO' passing flags of every Card from every
+        Tile.
+    """
+    travel: np.ndarray = deck.action_codes == CardActionType.TRAVEL.value
+    jail_cards: np.ndarray = (
+        deck.action_codes == CardActionType.GET_OUT_OF_JAIL.value
+    )
+    kinds: np.ndarray = deck.travel_kinds(board)[travel]
+
+    destinations: np.ndarray = np.tile(
+        np.arange(len(board.tiles)), (len(deck.cards), 1)
+    )
+    passes_go: np.ndarray = np.zeros(destinations.shape, dtype=bool)
+
+    destinations[travel] = board.next_tiles[:, kinds].T
+    passes_go[travel] = board.passes_go[:, kinds].T
+
+    return travel, jail_cards, destinations, passes_go
@@ -0,0 +1,10 @@
+from enum import Enum, auto
+
+
+class EngineType(Enum):
+
+    """Monopoly Simulation Engine Type."""
+
+    PLAYER = auto()
+    VECTORIZED = auto()
+    MARKOV = auto()
@@ -0,0 +1,328 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+from monopoly.dice.dice import Dice
+from monopoly.engine.engine_type import EngineType
+from monopoly.engine.simulation_result import SimulationResult
+from monopoly.engine.vectorized_engine import VectorizedEngine
+from monopoly.history.disk_round_history import DiskRoundHistory
+from monopoly.history.round_history import RoundHistory
+from monopoly.player.player import Player
+from monopoly.scenario.scenario_bundle import load_scenario
+
+
+def simulate_replicate(
+    board_data: str,
+    chances_data: str,
+    community_chests_data: str,
+    engine: EngineType,
+    rounds: int,
+    games: int,
+    seed_sequence: np.random.SeedSequence,
+    players: int = 1,
+    bundle: Optional[str] = None,
+    history_file: Optional[str] = None
+) -> SimulationResult:
+    """Simulate single independent Replicate.
+
+    Args:
+        board_data (str): Board tiles data file path.
+        chances_data (str): Chance tiles data file path.
+        community_chests_data (str): Community Chest tiles data file path.
+        engine (EngineType): Simulation Engine.
+        rounds (int): Number of rounds (Crossing the GO tile).
+        games (int): Number of Games simulated by the Vectorized Engine.
+        seed_sequence (np.random.SeedSequence): Seed of the Replicate.
+        players (int, optional): Number of Players in every Game of the
+        Vectorized Engine. Defaults to 1.
+        bundle (Optional[str], optional): Scenario Bundle loaded instead of
+        the data files, which it must have been compiled from. Defaults to
+        None.
+        history_file (Optional[str], optional): '.npy' file the Round
+        History of the Replicate is streamed to instead of being kept in
+        memory. Defaults to None.
+
+    Returns:
+        SimulationResult: Replicate Result.
+    """
+    dice_seed, chances_seed, community_chests_seed = seed_sequence.spawn(3)
+
+    if bundle is not None:
+        board, chances, community_chests = load_scenario(
+            file=bundle,
+            chances_rng=np.random.default_rng(chances_seed),
+            community_chests_rng=np.random.default_rng(community_chests_seed),
+            sources=[board_data, chances_data, community_chests_data]
+        )
+    else:
+        board: Board = Board(file=board_data)
+        chances: Deck = Deck(
+            file=chances_data,
+            rng=np.random.default_rng(chances_seed)
+        )
+        community_chests: Deck = Deck(
+            file=community_chests_data,
+            rng=np.random.default_rng(community_chests_seed)
+        )
+
+    round_history: RoundHistory = (
+        DiskRoundHistory(file=history_file, columns=len(board.tiles))
+        if history_file is not None
+        else RoundHistory(columns=len(board.tiles))
+    )
+
+    match engine:
+
+        case EngineType.PLAYER:
+            player: Player = Player(
+                dice=Dice(rng=np.random.default_rng(dice_seed))
+            )
+            visits: np.ndarray = np.zeros(len(board.tiles), dtype=np.int64)
+
+            while player.crossed_go_tile < rounds:
+                player.execute_round(
+                    board=board,
+                    chances=chances,
+                    community_chests=community_chests,
+                    visits=visits,
+                    round_history=round_history
+                )
+
+            # A streamed Replicate only sends its History File Path back
+            round_history.flush()
+
+            return SimulationResult(
+                visits=visits,
+                labels=[tile.label for tile in board.tiles],
+                roll_counts=player.roll_counts,
+                round_history=round_history
+            )
+
+        case EngineType.VECTORIZED:
+            vectorized_engine: VectorizedEngine = VectorizedEngine(
+                board=board,
+                chances=chances,
+                community_chests=community_chests,
+                games=games,
+                rng=np.random.default_rng(dice_seed),
+                round_history=round_history,
+                players=players
+            )
+
+            vectorized_engine.run(rounds=rounds)
+            round_history.flush()
+
+            return vectorized_engine.result
+
+
+class ReplicateRunner:
+
+    """Monopoly Simulation split into Replicates run in a Process Pool.
+
+    Every Replicate builds its own Board, Decks and Player (or Vectorized
+    Engine) and draws from its own Random Number stream spawned from a
+    single seed, so the whole run is reproducible.
+
+    Attributes:
+        workers (int): Number of Worker processes.
+        replicates (int): Number of independent Replicates.
+    """
+
+    def __init__(
+        self,
+        board_data: str,
+        chances_data: str,
+        community_chests_data: str,
+        engine: EngineType = EngineType.PLAYER,
+        games: int = 1000,
+        players: int = 1,
+        workers: Optional[int] = None,
+        replicates: Optional[int] = None,
+        seed: Optional[int] = None,
+        bundle: Optional[str] = None
+    ) -> None:
+        """Initialize the Replicate Runner Class.
+
+        Args:
+            board_data (str): Board tiles data file path.
+            chances_data (str): Chance tiles data file path.
+            community_chests_data (str): Community Chest tiles data file path.
+            engine (EngineType, optional): Simulation Engine. Defaults to
+            EngineType.PLAYER.
+            games (int, optional): Total number of Games simulated by the
+            Vectorized Engine. Defaults to 1000.
+            players (int, optional): Number of Players in every Game of the
+            Vectorized Engine. Defaults to 1.
+            workers (Optional[int], optional): Number of Worker processes.
+            Defaults to the number of CPUs.
+            replicates (Optional[int], optional): Number of independent
+            Replicates. Defaults to the number of Workers.
+            seed (Optional[int], optional): Seed of the whole run. Defaults
+            to fresh entropy.
+            bundle (Optional[str], optional): Scenario Bundle loaded by every
+            Replicate instead of the data files. Defaults to None.
+        """
+        self.__board_data: str = board_data
+        self.__chances_data: str = chances_data
+        self.__community_chests_data: str = community_chests_data
+        self.__engine: EngineType = engine
+        self.__games: int = games
+        self.__players: int = players
+        self.__bundle: Optional[str] = bundle
+        self.__workers: int = workers if workers else os.cpu_count() or 1
+        self.__replicates: int = replicates if replicates else self.__workers
+        self.__seed_sequence: np.random.SeedSequence = (
+            np.random.SeedSequence(seed)
+        )
+
+    @property
+    def workers(self) -> int:
+        """Return number of Worker processes.
+
+        Returns:
+            int: Number of Worker processes.
+        """
+        return self.__workers
+
+    @property
+    def replicates(self) -> int:
+        """Return number of independent Replicates.
+
+        Returns:
+            int: Number of independent Replicates.
+        """
+        return self.__replicates
+
+    def __split(self, total: int) -> List[int]:
+        """Split work evenly between Replicates.
+
+        Args:
+            total (int): Amount of work.
+
+        Returns:
+            List[int]: Amount of work of every Replicate.
+        """
+        share, remainder = divmod(total, self.__replicates)
+
+        return [
+            share + (replicate < remainder)
+            for replicate in range(self.__replicates)
+        ]
+
+    def __merge(
+        self,
+        results: List[SimulationResult],
+        round_history: RoundHistory
+    ) -> SimulationResult:
+        """Merge Replicate Results.
+
+        Args:
+            results (List[SimulationResult]): Replicate Results in order.
+            round_history (RoundHistory): Empty Round History receiving the
+            merged Rounds.
+
+        Returns:
+            SimulationResult: Merged Result.
+        """
+        visits: np.ndarray = np.array([result.visits for result in results])
+
+        # Replicate Rounds are merged block by block, never all at once
+        match self.__engine:
+
+            # Replicates are consecutive segments of a single long run
+            case EngineType.PLAYER:
+                offsets: np.ndarray = np.cumsum(visits, axis=0) - visits
+
+                for result, offset in zip(results, offsets):
+                    for rows in result.round_history.iter_chunks():
+                        round_history.extend(rows + offset)
+
+            # Replicates are disjoint groups of Games playing every Round
+            case EngineType.VECTORIZED:
+                for blocks in zip(
+                    *[result.round_history.iter_chunks() for result in results]
+                ):
+                    round_history.extend(sum(blocks))
+
+        return SimulationResult(
+            visits=visits.sum(axis=0),
+            labels=results[0].labels,
+            roll_counts=sum(result.roll_counts for result in results),
+            round_history=round_history,
+            player_visits=sum(result.player_visits for result in results)
+        )
+
+    def run(
+        self,
+        rounds: int,
+        round_history: Optional[RoundHistory] = None
+    ) -> SimulationResult:
+        """Run every Replicate and merge their Results.
+
+        Args:
+            rounds (int): Total number of rounds (Crossing the GO tile).
+            round_history (Optional[RoundHistory], optional): Empty Round
+            History receiving the merged Rounds. Defaults to a new in-memory
+            Round History. Replicates of a Disk Round History are streamed
+            to their own files next to it, removed once merged.
+
+        Returns:
+            SimulationResult: Merged Result.
+        """
+        match self.__engine:
+            case EngineType.PLAYER:
+                replicate_rounds: List[int] = self.__split(rounds)
+                replicate_games: List[int] = [1] * self.__replicates
+            case EngineType.VECTORIZED:
+                replicate_rounds = [rounds] * self.__replicates
+                replicate_games = self.__split(self.__games)
+
+        work: List[Tuple[int, int, np.random.SeedSequence]] = [
+            (rounds, games, seed_sequence)
+            for rounds, games, seed_sequence in zip(
+                replicate_rounds,
+                replicate_games,
+                self.__seed_sequence.spawn(self.__replicates)
+            )
+            if rounds > 0 and games > 0
+        ]
+
+        history_files: List[Optional[str]] = [None] * len(work)
+
+        if isinstance(round_history, DiskRoundHistory):
+            stem: str = os.path.splitext(round_history.file)[0]
+            history_files = [
+                f'{stem}_replicate_{replicate}.npy'
+                for replicate in range(len(work))
+            ]
+
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            results: List[SimulationResult] = list(
+                executor.map(
+                    simulate_replicate,
+                    [self.__board_data] * len(work),
+                    [self.__chances_data] * len(work),
+                    [self.__community_chests_data] * len(work),
+                    [self.__engine] * len(work),
+                    *zip(*work),
+                    [self.__players] * len(work),
+                    [self.__bundle] * len(work),
+                    history_files
+                )
+            )
+
+        if round_history is None:
+            round_history = RoundHistory(columns=len(results[0].labels))
+
+        merged: SimulationResult = self.__merge(results, round_history)
+
+        for history_file in history_files:
+            if history_file is not None:
+                os.remove(history_file)
+
+        return merged
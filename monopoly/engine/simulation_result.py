@@ -0,0 +1,107 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from monopoly.history.round_history import RoundHistory
+
+
+class SimulationResult:
+
+    """Monopoly Simulation Result.
+
+    Attributes:
+        visits (np.ndarray): Tile visit counts indexed by Tile position.
+        labels (List[str]): Tile labels in Board order.
+        stats (Dict[str, int]): Tile visit counts by Tile label.
+        roll_counts (np.ndarray): Number of rolls indexed by rolled sum.
+        round_history (RoundHistory): Round Visit History.
+        player_visits (np.ndarray): Tile visit counts of every seat with
+        shape (players, tiles).
+    """
+
+    def __init__(
+        self,
+        visits: np.ndarray,
+        labels: List[str],
+        roll_counts: np.ndarray,
+        round_history: RoundHistory,
+        player_visits: Optional[np.ndarray] = None
+    ) -> None:
+        """Initialize the Simulation Result Class.
+
+        Args:
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
+            labels (List[str]): Tile labels in Board order.
+            roll_counts (np.ndarray): Number of rolls indexed by rolled sum.
+            round_history (RoundHistory): Round Visit History.
+            player_visits (Optional[np.ndarray], optional): Tile visit
+            counts of every seat. Defaults to visits of a single Player.
+        """
+        self.__visits: np.ndarray = visits
+        self.__labels: List[str] = labels
+        self.__stats: Optional[Dict[str, int]] = None
+        self.__roll_counts: np.ndarray = roll_counts
+        self.__round_history: RoundHistory = round_history
+        self.__player_visits: np.ndarray = (
+            player_visits if player_visits is not None
+            else visits[np.newaxis]
+        )
+
+    @property
+    def visits(self) -> np.ndarray:
+        """Return Tile visit counts indexed by Tile position.
+
+        Returns:
+            np.ndarray: Tile visit counts indexed by Tile position.
+        """
+        return self.__visits
+
+    @property
+    def labels(self) -> List[str]:
+        """Return Tile labels in Board order.
+
+        Returns:
+            List[str]: Tile labels in Board order.
+        """
+        return self.__labels
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return Tile visit counts by Tile label.
+
+        The dictionary is only built on first access.
+
+        Returns:
+            Dict[str, int]: Tile visit counts by Tile label.
+        """
+        if self.__stats is None:
+            self.__stats = dict(zip(self.__labels, self.__visits.tolist()))
+
+        return self.__stats
+
+    @property
+    def roll_counts(self) -> np.ndarray:
+        """Return number of rolls indexed by rolled sum.
+
+        Returns:
+            np.ndarray: Number of rolls indexed by rolled sum.
+        """
+        return self.__roll_counts
+
+    @property
+    def round_history(self) -> RoundHistory:
+        """Return Round Visit History.
+
+        Returns:
+            RoundHistory: Round Visit History.
+        """
+        return self.__round_history
+
+    @property
+    def player_visits(self) -> np.ndarray:
+        """Return Tile visit counts of every seat.
+
+        Returns:
+            np.ndarray: Tile visit counts with shape (players, tiles).
+        """
+        return self.__player_visits
@@ -0,0 +1,626 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+from monopoly.engine.card_actions import compile_deck, compile_tile_decks
+from monopoly.engine.simulation_result import SimulationResult
+from monopoly.history.round_history import RoundHistory
+from monopoly.rules.rules import Rules
+
+# Sum and Double flag of every (first die, second die) outcome
+ROLL_SUMS: np.ndarray = np.add.outer(np.arange(1, 7), np.arange(1, 7)).ravel()
+ROLL_DOUBLES: np.ndarray = np.eye(6, dtype=bool).ravel()
+
+# Marks a Get Out of Jail Card which is not held by the Player
+NOT_HELD: int = -1
+
+
+class VectorizedEngine:
+
+    """Lockstep Monopoly Simulation of many independent Games.
+
+    Every Player follows the same rules as a single Player, but the state of
+    all Players of all Games is kept in NumPy arrays and advanced one turn
+    at a time with masked array updates. Players of a Game take their turns
+    in seat order and draw from the shared Decks of their Game, so Cards
+    held by one Player are missing from the Decks of the others.
+
+    Within a turn Get Out of Jail Cards are returned before any Card is
+    drawn, which only matters when the Deck is reshuffled on that turn.
+
+    Attributes:
+        games (int): Number of simulated Games.
+        players (int): Number of Players in every Game.
+        rules (Rules): House Rules of every Game.
+        turns (int): Number of simulated turns of every Player.
+        visits (np.ndarray): Tile visit counts of all Games.
+        player_visits (np.ndarray): Tile visit counts of every seat.
+        roll_counts (np.ndarray): Rolled sum counts of all Games.
+        player_roll_counts (np.ndarray): Rolled sum counts of every seat.
+        round_history (RoundHistory): Visit counts of all Games snapshotted
+        when every Player finished a Round.
+        result (SimulationResult): Simulation Result of all Games.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        chances: Deck,
+        community_chests: Deck,
+        games: int = 1000,
+        rng: Optional[np.random.Generator] = None,
+        round_history: Optional[RoundHistory] = None,
+        players: int = 1,
+        rules: Optional[Rules] = None,
+        deck_rngs: Optional[List[np.random.Generator]] = None
+    ) -> None:
+        """Initialize the Vectorized Engine Class.
+
+        Args:
+            board (Board): Monopoly Board.
+            chances (Deck): Chance Cards Deck.
+            community_chests (Deck): Community Chest Cards Deck.
+            games (int, optional): Number of simulated Games.
+            Defaults to 1000.
+            rng (Optional[np.random.Generator], optional): Random Number
+            Generator. Defaults to a freshly seeded Generator.
+            round_history (Optional[RoundHistory], optional): Round History
+            recording all Games. Defaults to a new in-memory Round History.
+            players (int, optional): Number of Players sharing the Decks of
+            every Game. Defaults to 1.
+            rules (Optional[Rules], optional): House Rules. Defaults to the
+            standard Rules.
+            deck_rngs (Optional[List[np.random.Generator]], optional):
+            Random Number Generator shuffling every Deck, so reshuffles do
+            not shift the dice rolls. Defaults to the dice Generator.
+        """
+        self.__board: Board = board
+        self.__rules: Rules = rules if rules is not None else Rules()
+        self.__games: int = games
+        self.__players: int = players
+        self.__rng: np.random.Generator = (
+            rng if rng is not None else np.random.default_rng()
+        )
+        self.__deck_rngs: List[np.random.Generator] = (
+            deck_rngs if deck_rngs is not None else [self.__rng] * 2
+        )
+
+        # Board Related Attributes
+        self.__board_length: int = len(board.tiles)
+        self.__jail: int = board.map['Jail']
+        self.__visiting_jail: int = board.map['Visiting Jail']
+        self.__go_to_jail: int = board.map['Go To Jail']
+
+        # Deck drawn on every Tile, -1 when no Card is drawn
+        self.__tile_decks: np.ndarray = compile_tile_decks(board)
+
+        # Compiled Card Actions of every Deck
+        self.__decks: List[Tuple[np.ndarray, ...]] = [
+            compile_deck(board, chances),
+            compile_deck(board, community_chests)
+        ]
+
+        # Player State, Players of a Game are stored next to each other
+        size: int = games * players
+        self.__player_games: np.ndarray = np.arange(size) // players
+        self.__seats: np.ndarray = np.arange(size) % players
+        self.__positions: np.ndarray = np.zeros(size, dtype=np.int64)
+        self.__doubles: np.ndarray = np.zeros(size, dtype=np.int64)
+        self.__jail_time: np.ndarray = np.full(size, self.__rules.jail_time)
+        self.__crossed_go_tile: np.ndarray = np.zeros(size, dtype=np.int64)
+
+        # Deck State, Card order and draw cursor of every Game
+        self.__orders: List[np.ndarray] = []
+        self.__cursors: List[np.ndarray] = []
+        self.__lengths: List[np.ndarray] = []
+
+        # Turn on which a Get Out of Jail Card was drawn and its holder seat
+        self.__held: List[np.ndarray] = []
+        self.__holders: List[np.ndarray] = []
+        self.__holding: np.ndarray = np.zeros(size, dtype=np.int64)
+
+        for deck in self.__decks:
+            cards: int = len(deck[0])
+            self.__orders.append(np.zeros((games, cards), dtype=np.int64))
+            self.__cursors.append(np.zeros(games, dtype=np.int64))
+            self.__lengths.append(np.zeros(games, dtype=np.int64))
+            self.__held.append(np.full((games, cards), NOT_HELD))
+            self.__holders.append(np.full((games, cards), NOT_HELD))
+
+        for deck_index in range(len(self.__decks)):
+            self.__shuffle(deck_index, np.arange(games))
+
+        # Statistics Related Attributes
+        self.__turns: int = 0
+        self.__visits: np.ndarray = np.zeros(
+            (players, self.__board_length), dtype=np.int64
+        )
+        self.__roll_counts: np.ndarray = np.zeros(
+            (players, ROLL_SUMS.max() + 1), dtype=np.int64
+        )
+        self.__round_history: RoundHistory = (
+            round_history if round_history is not None
+            else RoundHistory(columns=self.__board_length)
+        )
+
+    @property
+    def games(self) -> int:
+        """Return number of simulated Games.
+
+        Returns:
+            int: Number of simulated Games.
+        """
+        return self.__games
+
+    @property
+    def players(self) -> int:
+        """Return number of Players in every Game.
+
+        Returns:
+            int: Number of Players in every Game.
+        """
+        return self.__players
+
+    @property
+    def rules(self) -> Rules:
+        """Return House Rules of every Game.
+
+        Returns:
+            Rules: House Rules.
+        """
+        return self.__rules
+
+    @property
+    def turns(self) -> int:
+        """Return number of simulated turns of every Player.
+
+        Returns:
+            int: Number of simulated turns of every Player.
+        """
+        return self.__turns
+
+    @property
+    def visits(self) -> np.ndarray:
+        """Return Tile visit counts of all Games.
+
+        Returns:
+            np.ndarray: Tile visit counts in Board order.
+        """
+        return self.__visits.sum(axis=0)
+
+    @property
+    def player_visits(self) -> np.ndarray:
+        """Return Tile visit counts of every seat over all Games.
+
+        Returns:
+            np.ndarray: Tile visit counts with shape (players, tiles).
+        """
+        return self.__visits
+
+    @property
+    def roll_counts(self) -> np.ndarray:
+        """Return Rolled sum counts of all Games.
+
+        Returns:
+            np.ndarray: Number of rolls indexed by rolled sum.
+        """
+        return self.__roll_counts.sum(axis=0)
+
+    @property
+    def player_roll_counts(self) -> np.ndarray:
+        """Return Rolled sum counts of every seat over all Games.
+
+        Returns:
+            np.ndarray: Number of rolls with shape (players, sums).
+        """
+        return self.__roll_counts
+
+    @property
+    def round_history(self) -> RoundHistory:
+        """Return Round History of all Games.
+
+        Returns:
+            RoundHistory: Round History of all Games.
+        """
+        return self.__round_history
+
+    @property
+    def result(self) -> SimulationResult:
+        """Return Simulation Result of all Games.
+
+        Returns:
+            SimulationResult: Simulation Result of all Games.
+        """
+        return SimulationResult(
+            visits=self.visits,
+            labels=[tile.label for tile in self.__board.tiles],
+            roll_counts=self.roll_counts,
+            round_history=self.__round_history,
+            player_visits=self.__visits
+        )
+
+    def __shuffle(self, deck_index: int, games: np.ndarray) -> None:
+        """Shuffle Deck of given Games, leaving out held Cards.
+
+        Args:
+            deck_index (int): Deck index.
+            games (np.ndarray): Indices of Games to shuffle.
+        """
+        held: np.ndarray = self.__held[deck_index][games] != NOT_HELD
+
+        # Held Cards are sorted behind the drawable ones
+        keys: np.ndarray = (
+            self.__deck_rngs[deck_index].random(held.shape) + held
+        )
+
+        self.__orders[deck_index][games] = np.argsort(keys, axis=1)
+        self.__cursors[deck_index][games] = 0
+        self.__lengths[deck_index][games] = held.shape[1] - held.sum(axis=1)
+
+    def __keep_jail_cards(
+        self,
+        deck_index: int,
+        players: np.ndarray,
+        games: np.ndarray,
+        cards: np.ndarray
+    ) -> None:
+        """Mark drawn Get Out of Jail Cards as held by their Players.
+
+        Args:
+            deck_index (int): Deck index.
+            players (np.ndarray): Indices of drawing Players.
+            games (np.ndarray): Game of every drawing Player.
+            cards (np.ndarray): Indices of drawn Cards.
+        """
+        holding: np.ndarray = self.__decks[deck_index][1][cards]
+
+        if not holding.any():
+            return
+
+        self.__held[deck_index][games[holding], cards[holding]] = self.__turns
+        self.__holders[deck_index][games[holding], cards[holding]] = (
+            self.__seats[players[holding]]
+        )
+
+    def __draw_cards(self, deck_index: int, players: np.ndarray) -> np.ndarray:
+        """Draw Card for given Players in seat order.
+
+        Args:
+            deck_index (int): Deck index.
+            players (np.ndarray): Sorted indices of drawing Players.
+
+        Returns:
+            np.ndarray: Indices of drawn Cards.
+        """
+        cursors: np.ndarray = self.__cursors[deck_index]
+        lengths: np.ndarray = self.__lengths[deck_index]
+
+        games: np.ndarray = self.__player_games[players]
+        repeated: np.ndarray = games[1:] == games[:-1]
+
+        # Every Game draws a single Card
+        if not repeated.any():
+            cards: np.ndarray = self.__orders[deck_index][
+                games, cursors[games]
+            ]
+            cursors[games] += 1
+
+            self.__keep_jail_cards(deck_index, players, games, cards)
+
+            # When there are no Cards to draw
+            exhausted: np.ndarray = cursors[games] >= lengths[games]
+
+            if exhausted.any():
+                self.__shuffle(deck_index, games[exhausted])
+
+            return cards
+
+        # Number of Players of the same Game drawing before each Player
+        first: np.ndarray = np.flatnonzero(np.append(True, ~repeated))
+        ranks: np.ndarray = np.arange(len(players)) - np.repeat(
+            first, np.diff(np.append(first, len(players)))
+        )
+
+        cards = np.empty(len(players), dtype=np.int64)
+        pending: np.ndarray = np.arange(len(players))
+
+        # Every pass draws until the Deck of a Game is exhausted
+        while pending.size > 0:
+            pending_games: np.ndarray = games[pending]
+            available: np.ndarray = (
+                lengths[pending_games] - cursors[pending_games]
+            )
+            now: np.ndarray = ranks[pending] < available
+
+            drawing: np.ndarray = pending[now]
+            drawing_games: np.ndarray = pending_games[now]
+            cards[drawing] = self.__orders[deck_index][
+                drawing_games, cursors[drawing_games] + ranks[drawing]
+            ]
+            cursors += np.bincount(drawing_games, minlength=self.__games)
+
+            self.__keep_jail_cards(
+                deck_index, players[drawing], drawing_games, cards[drawing]
+            )
+
+            # When there are no Cards to draw
+            exhausted = np.unique(
+                drawing_games[cursors[drawing_games] >= lengths[drawing_games]]
+            )
+
+            if exhausted.size > 0:
+                self.__shuffle(deck_index, exhausted)
+
+            pending = pending[~now]
+            ranks[pending] -= available[~now]
+
+        return cards
+
+    def __use_jail_cards(self, players: np.ndarray) -> None:
+        """Return the most recently drawn Get Out of Jail Card to its Deck.
+
+        Args:
+            players (np.ndarray): Indices of Players using a Card.
+        """
+        games: np.ndarray = self.__player_games[players]
+        seats: np.ndarray = self.__seats[players]
+
+        # Turn on which every Card was drawn, if held by the Player
+        owned: List[np.ndarray] = [held[games] for held in self.__held]
+
+        if self.__players > 1:
+            owned = [
+                np.where(holders[games] == seats[:, None], turns, NOT_HELD)
+                for turns, holders in zip(owned, self.__holders)
+            ]
+        latest: np.ndarray = np.stack([turns.max(axis=1) for turns in owned])
+        decks: np.ndarray = latest.argmax(axis=0)
+
+        for deck_index, turns in enumerate(owned):
+            using: np.ndarray = decks == deck_index
+            cards: np.ndarray = turns[using].argmax(axis=1)
+            self.__held[deck_index][games[using], cards] = NOT_HELD
+            self.__holders[deck_index][games[using], cards] = NOT_HELD
+
+        self.__holding[players] -= 1
+
+    def __visit(self, players: np.ndarray, positions: np.ndarray) -> None:
+        """Count Tile visits.
+
+        Args:
+            players (np.ndarray): Indices of visiting Players.
+            positions (np.ndarray): Visited Tile indices.
+        """
+        self.__visits += np.bincount(
+            self.__seats[players] * self.__board_length + positions,
+            minlength=self.__visits.size
+        ).reshape(self.__visits.shape)
+
+    def __arrest(self, players: np.ndarray) -> None:
+        """Count 'Go To Jail' Tile visits of arrested Players.
+
+        Args:
+            players (np.ndarray): Indices of arrested Players.
+        """
+        if players.size == 0:
+            return
+
+        self.__visits[:, self.__go_to_jail] += np.bincount(
+            self.__seats[players], minlength=self.__players
+        )
+
+    def __execute_card_actions(self, players: np.ndarray) -> None:
+        """Draw Cards and execute their Actions for given Players.
+
+        Args:
+            players (np.ndarray): Sorted indices of Players standing on a
+            Card Tile.
+        """
+        tile_decks: np.ndarray = self.__tile_decks[self.__positions[players]]
+
+        for deck_index, deck in enumerate(self.__decks):
+            drawing: np.ndarray = players[tile_decks == deck_index]
+
+            if drawing.size == 0:
+                continue
+
+            travel, jail_cards, destinations, passes_go = deck
+
+            cards: np.ndarray = self.__draw_cards(deck_index, drawing)
+            self.__holding[drawing] += jail_cards[cards]
+
+            traveling: np.ndarray = drawing[travel[cards]]
+            cards = cards[travel[cards]]
+            positions: np.ndarray = self.__positions[traveling]
+
+            self.__crossed_go_tile[traveling] += passes_go[cards, positions]
+            positions = destinations[cards, positions]
+
+            # 'Go To Jail' Tile
+            arrested: np.ndarray = positions == self.__go_to_jail
+            self.__arrest(traveling[arrested])
+            positions[arrested] = self.__jail
+
+            self.__positions[traveling] = positions
+            self.__visit(traveling, positions)
+
+    def __regular_rounds(
+        self,
+        moving: np.ndarray,
+        increments: np.ndarray
+    ) -> None:
+        """Execute Regular round of masked Players.
+
+        Args:
+            moving (np.ndarray): Mask of Players not in Jail.
+            increments (np.ndarray): Position increment of every Player.
+        """
+        positions: np.ndarray = self.__positions + increments
+
+        # Crossed 'GO' Tile
+        crossed: np.ndarray = positions >= self.__board_length
+        self.__crossed_go_tile += crossed & moving
+        positions -= crossed * self.__board_length
+
+        # 'Just Visiting Jail' Tile, otherwise the Player stays in Jail
+        if self.__rules.just_visiting:
+            positions[positions == self.__jail] = self.__visiting_jail
+
+        # 'Go To Jail' Tile
+        arrested: np.ndarray = (positions == self.__go_to_jail) & moving
+        self.__arrest(np.flatnonzero(arrested))
+        positions[arrested] = self.__jail
+
+        np.copyto(self.__positions, positions, where=moving)
+        self.__visit(np.flatnonzero(moving), positions[moving])
+
+        # Draw Card
+        drawing: np.ndarray = np.flatnonzero(
+            (self.__tile_decks[positions] >= 0) & moving
+        )
+
+        if drawing.size > 0:
+            self.__execute_card_actions(drawing)
+
+    def __in_jail_rounds(
+        self,
+        players: np.ndarray,
+        increments: np.ndarray
+    ) -> None:
+        """Execute round in Jail of given Players.
+
+        Args:
+            players (np.ndarray): Indices of Players in Jail.
+            increments (np.ndarray): Position increments.
+        """
+        # Use 'Get Out of Jail' Card
+        holding: np.ndarray = self.__holding[players] > 0
+
+        if holding.any():
+            self.__use_jail_cards(players[holding])
+
+        # Try 3x to get out of Jail
+        staying: np.ndarray = (
+            ~holding
+            & (self.__jail_time[players] > 0)
+            & (self.__doubles[players] < 1)
+        )
+        self.__jail_time[players[staying]] -= 1
+
+        # Escape Jail
+        escaping: np.ndarray = players[~staying]
+        self.__jail_time[escaping] = self.__rules.jail_time
+        self.__positions[escaping] += increments[~staying]
+        self.__visit(escaping, self.__positions[escaping])
+
+    def __step(self, active: np.ndarray) -> None:
+        """Execute one round of Monopoly of masked Players.
+
+        Args:
+            active (np.ndarray): Mask of unfinished Players.
+        """
+        # Every Player rolls, so each Player sees the same stream of rolls
+        outcomes: np.ndarray = self.__rng.integers(
+            0, len(ROLL_SUMS), len(self.__positions)
+        )
+        increments: np.ndarray = ROLL_SUMS[outcomes]
+        double: np.ndarray = ROLL_DOUBLES[outcomes] & active
+        regular: np.ndarray = ~ROLL_DOUBLES[outcomes] & active
+
+        # Double rolls, the doubles limit then a regular roll mean Jail
+        self.__doubles += double
+        arrested: np.ndarray = regular & (
+            self.__doubles == self.__rules.doubles_limit
+        )
+        self.__doubles *= ~regular
+        self.__positions[arrested] = self.__jail
+
+        moving: np.ndarray = active & ~arrested
+
+        rolls: int = self.__roll_counts.shape[1]
+        self.__roll_counts += np.bincount(
+            self.__seats[moving] * rolls + increments[moving],
+            minlength=self.__roll_counts.size
+        ).reshape(self.__roll_counts.shape)
+
+        in_jail: np.ndarray = (self.__positions == self.__jail) & moving
+
+        # Jail is resolved first, escaping Players must not move twice
+        if in_jail.any():
+            moving &= ~in_jail
+            jailed: np.ndarray = np.flatnonzero(in_jail)
+            self.__in_jail_rounds(jailed, increments[jailed])
+
+        self.__regular_rounds(moving, increments)
+
+        self.__turns += 1
+
+    def __record_rounds(self, rounds: int) -> None:
+        """Snapshot visit counts for Rounds finished by every Player.
+
+        Args:
+            rounds (int): Number of Rounds to simulate.
+        """
+        finished: int = min(int(self.__crossed_go_tile.min()), rounds)
+
+        if self.__round_history.rounds >= finished:
+            return
+
+        visits: np.ndarray = self.visits
+
+        while self.__round_history.rounds < finished:
+            self.__round_history.append(visits)
+
+    def run_turns(self, turns: int) -> None:
+        """Simulate given turns of every Player, regardless of Rounds.
+
+        Args:
+            turns (int): Number of turns.
+        """
+        active: np.ndarray = np.ones(len(self.__positions), dtype=bool)
+
+        for _ in range(turns):
+            self.__step(active)
+
+    def occupancy(self, turns: int) -> np.ndarray:
+        """Simulate given turns of every Player and record their positions.
+
+        Args:
+            turns (int): Number of turns.
+
+        Returns:
+            np.ndarray: Share of Players standing on every Tile after every
+            turn with shape (turns + 1, tiles), starting with the current
+            positions.
+        """
+        active: np.ndarray = np.ones(len(self.__positions), dtype=bool)
+        counts: np.ndarray = np.empty(
+            (turns + 1, self.__board_length), dtype=np.int64
+        )
+        counts[0] = np.bincount(
+            self.__positions, minlength=self.__board_length
+        )
+
+        for turn in range(turns):
+            self.__step(active)
+            counts[turn + 1] = np.bincount(
+                self.__positions, minlength=self.__board_length
+            )
+
+        return counts / len(self.__positions)
+
+    def run(self, rounds: int) -> None:
+        """Simulate every Player until it crossed the 'GO' Tile given times.
+
+        Args:
+            rounds (int): Number of rounds (Crossing the GO tile).
+        """
+        unfinished: np.ndarray = self.__crossed_go_tile < rounds
+
+        while unfinished.any():
+            self.__step(unfinished)
+            self.__record_rounds(rounds)
+
+            unfinished = self.__crossed_go_tile < rounds
@@ -0,0 +1,13 @@
+from enum import Enum, auto
+
+
+class EventType(Enum):
+
+    """Simulation Trace Event Type."""
+
+    MOVE = auto()
+    DOUBLE_ROLL = auto()
+    GO_TO_JAIL = auto()
+    CARD = auto()
+    IN_JAIL = auto()
+    JAIL_CARD_USED = auto()
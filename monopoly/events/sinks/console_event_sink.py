@@ -0,0 +1,60 @@
+from termcolor import colored
+
+from monopoly.board.board import Board
+from monopoly.board.tiles.tile import Tile
+from monopoly.events.event_type import EventType
+from monopoly.events.sinks.event_sink import Event, EventSink
+
+
+class ConsoleEventSink(EventSink):
+
+    """Colored Terminal Trace Event Sink."""
+
+    def __init__(self, board: Board) -> None:
+        """Initialize the Console Event Sink Class.
+
+        Args:
+            board (Board): Monopoly Board used to name Tiles.
+        """
+        self.__board: Board = board
+
+    def emit(self, event: Event) -> None:
+        """Display Trace Event.
+
+        Args:
+            event (Event): Trace Event.
+        """
+        match event[0]:
+
+            case EventType.MOVE:
+                tile: Tile = self.__board.tiles[event[1]]
+
+                print(
+                    f'Current tile: {[tile.label]} - {tile.name}, '
+                    f'Rolled: {event[2]}, Crossed GO: {event[3]}x'
+                )
+
+            case EventType.DOUBLE_ROLL:
+                print(colored(f'Double roll: {(event[1], event[2])}', 'yellow'))
+
+            case EventType.GO_TO_JAIL:
+                print(
+                    colored(
+                        f'\n--------- Going to jail for {event[1]} ---------\n',
+                        'red'
+                    )
+                )
+
+            case EventType.CARD:
+                print(
+                    colored(
+                        f'\n[{event[1]}] - {event[2]}\n',
+                        'cyan' if event[1] == 'Chance' else 'blue'
+                    )
+                )
+
+            case EventType.IN_JAIL:
+                print(colored(f'[In Jail] - Rolled: {event[1]}', 'magenta'))
+
+            case EventType.JAIL_CARD_USED:
+                print(colored('Used Get Out of Jail Card!', 'green'))
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any, Tuple
+
+Event = Tuple[Any, ...]
+
+
+class EventSink(ABC):
+
+    """Simulation Trace Event Sink.
+
+    Events are compact tuples, the first item being the EventType followed
+    by the raw event fields. Formatting is left to the Sink.
+    """
+
+    @abstractmethod
+    def emit(self, event: Event) -> None:
+        """Receive Trace Event.
+
+        Args:
+            event (Event): Trace Event.
+        """
+
+    def flush(self) -> None:
+        """Flush buffered Trace Events."""
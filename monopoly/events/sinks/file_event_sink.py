@@ -0,0 +1,64 @@
+from typing import List
+
+from monopoly.events.sinks.event_sink import Event, EventSink
+
+
+class FileEventSink(EventSink):
+
+    """Buffered File Trace Event Sink.
+
+    Every Event is written as a single tab separated line, starting with the
+    Event Type name. Events are kept in memory until the buffer is full.
+
+    Attributes:
+        file (str): Trace output file path.
+    """
+
+    def __init__(self, file: str, buffer_size: int = 65536) -> None:
+        """Initialize the File Event Sink Class.
+
+        Args:
+            file (str): Trace output file path.
+            buffer_size (int, optional): Number of buffered Events.
+            Defaults to 65536.
+        """
+        self.__file: str = file
+        self.__buffer_size: int = buffer_size
+        self.__buffer: List[Event] = []
+
+    @property
+    def file(self) -> str:
+        """Return Trace output file path.
+
+        Returns:
+            str: Trace output file path.
+        """
+        return self.__file
+
+    def emit(self, event: Event) -> None:
+        """Buffer Trace Event.
+
+        Args:
+            event (Event): Trace Event.
+        """
+        self.__buffer.append(event)
+
+        if len(self.__buffer) >= self.__buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered Trace Events to File."""
+        if not self.__buffer:
+            return
+
+        with open(self.__file, 'a') as fp:
+            fp.write(
+                ''.join(
+                    '\t'.join(
+                        [event[0].name, *map(str, event[1:])]
+                    ) + '\n'
+                    for event in self.__buffer
+                )
+            )
+
+        self.__buffer = []
@@ -0,0 +1,33 @@
+from typing import List
+
+from monopoly.events.sinks.event_sink import Event, EventSink
+
+
+class ListEventSink(EventSink):
+
+    """In-memory Trace Event Sink.
+
+    Attributes:
+        events (List[Event]): Received Trace Events.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the List Event Sink Class."""
+        self.__events: List[Event] = []
+
+    @property
+    def events(self) -> List[Event]:
+        """Return received Trace Events.
+
+        Returns:
+            List[Event]: Received Trace Events.
+        """
+        return self.__events
+
+    def emit(self, event: Event) -> None:
+        """Store Trace Event.
+
+        Args:
+            event (Event): Trace Event.
+        """
+        self.__events.append(event)
@@ -0,0 +1,10 @@
+from enum import Enum, auto
+
+
+class Verbosity(Enum):
+
+    """Simulation Output Verbosity."""
+
+    SILENT = auto()
+    SUMMARY = auto()
+    TRACE = auto()
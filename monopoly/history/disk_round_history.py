@@ -0,0 +1,190 @@
+import os
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+import numpy as np
+
+from monopoly.history.round_history import RoundHistory
+
+# Fixed '.npy' header size, so the shape can be rewritten in place
+HEADER_SIZE: int = 128
+
+# Leading bytes of a version 1.0 '.npy' file
+NPY_MAGIC: bytes = b'\x93NUMPY\x01\x00'
+
+
+class DiskRoundHistory(RoundHistory):
+
+    """Monopoly Round Visit History streamed to disk.
+
+    Recorded Rounds are collected in a bounded in-memory buffer and appended
+    to a '.npy' file whenever the buffer is full, so memory use does not grow
+    with the number of Rounds. The file is read back through a memory map.
+    Group totals are streamed the same way to a '_groups.npy' sibling file.
+
+    Attributes:
+        file (str): History File Path.
+        columns (int): Number of tracked Tiles.
+        rounds (int): Number of recorded Rounds.
+        group_history (Optional[RoundHistory]): Group visit totals of every
+        recorded Round.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        columns: int,
+        buffer_size: int = 65536,
+        group_ids: Optional[np.ndarray] = None
+    ) -> None:
+        """Initialize the Disk Round History Class.
+
+        Args:
+            file (str): History File Path, overwritten if it exists.
+            columns (int): Number of tracked Tiles.
+            buffer_size (int, optional): Number of Rounds kept in memory
+            before they are written to disk. Defaults to 65536.
+            group_ids (Optional[np.ndarray], optional): Group index of every
+            Tile. Defaults to None, when no Group totals are accumulated.
+        """
+        super().__init__(
+            columns=columns,
+            chunk_size=buffer_size,
+            group_ids=group_ids,
+            group_history=(
+                DiskRoundHistory(
+                    file=f'{os.path.splitext(file)[0]}_groups.npy',
+                    columns=int(group_ids.max()) + 1,
+                    buffer_size=buffer_size
+                )
+                if group_ids is not None else None
+            )
+        )
+
+        self.__file: str = file
+        self.__buffer_size: int = buffer_size
+        self.__stored: int = 0
+
+        with open(self.__file, 'wb') as fp:
+            self.__write_header(fp)
+
+    @property
+    def file(self) -> str:
+        """Return History File Path.
+
+        Returns:
+            str: History File Path.
+        """
+        return self.__file
+
+    @property
+    def rounds(self) -> int:
+        """Return number of recorded Rounds.
+
+        Returns:
+            int: Number of recorded Rounds.
+        """
+        return self.__stored + super().rounds
+
+    def __len__(self) -> int:
+        """Return number of recorded Rounds.
+
+        Returns:
+            int: Number of recorded Rounds.
+        """
+        return self.rounds
+
+    def __write_header(self, fp: BinaryIO) -> None:
+        """Write '.npy' header describing the stored Rounds.
+
+        Args:
+            fp (BinaryIO): History File opened for writing.
+        """
+        header: bytes = repr(
+            {
+                'descr': np.dtype(np.int64).str,
+                'fortran_order': False,
+                'shape': (self.__stored, self.columns)
+            }
+        ).encode('latin1')
+
+        # Magic, version and header length precede the padded header
+        padding: int = HEADER_SIZE - len(NPY_MAGIC) - 2 - len(header) - 1
+
+        fp.seek(0)
+        fp.write(NPY_MAGIC)
+        fp.write((HEADER_SIZE - len(NPY_MAGIC) - 2).to_bytes(2, 'little'))
+        fp.write(header + b' ' * padding + b'\n')
+
+    def append(self, row: Iterable[int]) -> None:
+        """Record visit counts of a finished Round.
+
+        Args:
+            row (Iterable[int]): Visit count of every Tile in Board order.
+        """
+        super().append(row)
+
+        if super().rounds == self.__buffer_size:
+            self.flush()
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Record visit counts of many finished Rounds.
+
+        Args:
+            rows (np.ndarray): Visit counts with shape (rounds, columns).
+        """
+        start: int = 0
+
+        while start < len(rows):
+            count: int = min(
+                self.__buffer_size - super().rounds, len(rows) - start
+            )
+
+            super().extend(rows[start:start + count])
+            start += count
+
+            if super().rounds == self.__buffer_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Append buffered Rounds to the History File."""
+        if super().rounds == 0:
+            return
+
+        buffered: np.ndarray = super().to_array()
+
+        with open(self.__file, 'r+b') as fp:
+            fp.seek(0, 2)
+            fp.write(buffered.tobytes())
+
+            self.__stored += len(buffered)
+            self.__write_header(fp)
+
+        super().clear()
+
+        if self.group_history is not None:
+            self.group_history.flush()
+
+    def iter_chunks(self) -> Iterator[np.ndarray]:
+        """Iterate recorded Rounds in consecutive blocks read from disk.
+
+        Yields:
+            Iterator[np.ndarray]: Visit counts with shape (block, columns).
+        """
+        stored: np.ndarray = self.to_array()
+
+        for start in range(0, len(stored), self.__buffer_size):
+            yield np.asarray(stored[start:start + self.__buffer_size])
+
+    def to_array(self) -> np.ndarray:
+        """Return recorded Rounds as a memory mapped matrix.
+
+        Returns:
+            np.ndarray: Visit counts with shape (rounds, columns).
+        """
+        self.flush()
+
+        # Memory mapping an empty file is not possible
+        if self.__stored == 0:
+            return np.empty((0, self.columns), dtype=np.int64)
+
+        return np.load(self.__file, mmap_mode='r')
@@ -0,0 +1,171 @@
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+
+class RoundHistory:
+
+    """Monopoly Round Visit History.
+
+    Visit counts are snapshotted every time the Player crosses the 'GO' Tile.
+    Snapshots are stored in preallocated integer chunks, which are filled in
+    place, so recording a Round never copies the already recorded ones.
+    When Tile Groups are given, Group totals of every Round are accumulated
+    alongside in a separate Round History.
+
+    Attributes:
+        columns (int): Number of tracked Tiles.
+        rounds (int): Number of recorded Rounds.
+        group_history (Optional[RoundHistory]): Group visit totals of every
+        recorded Round.
+    """
+
+    def __init__(
+        self,
+        columns: int,
+        chunk_size: int = 4096,
+        group_ids: Optional[np.ndarray] = None,
+        group_history: Optional['RoundHistory'] = None
+    ) -> None:
+        """Initialize the Round History Class.
+
+        Args:
+            columns (int): Number of tracked Tiles.
+            chunk_size (int, optional): Number of Rounds per allocated chunk.
+            Defaults to 4096.
+            group_ids (Optional[np.ndarray], optional): Group index of every
+            Tile. Defaults to None, when no Group totals are accumulated.
+            group_history (Optional[RoundHistory], optional): Round History
+            receiving Group totals. Defaults to a new in-memory Round
+            History when Group indices are given.
+        """
+        self.__columns: int = columns
+        self.__chunk_size: int = chunk_size
+        self.__chunks: List[np.ndarray] = []
+        self.__rounds: int = 0
+
+        # Tile to Group membership matrix
+        self.__membership: Optional[np.ndarray] = None
+        self.__group_history: Optional[RoundHistory] = None
+
+        if group_ids is not None:
+            groups: int = int(group_ids.max()) + 1
+
+            self.__membership = np.eye(groups, dtype=np.int64)[group_ids]
+            self.__group_history = (
+                group_history if group_history is not None
+                else RoundHistory(columns=groups, chunk_size=chunk_size)
+            )
+
+    @property
+    def columns(self) -> int:
+        """Return number of tracked Tiles.
+
+        Returns:
+            int: Number of tracked Tiles.
+        """
+        return self.__columns
+
+    @property
+    def rounds(self) -> int:
+        """Return number of recorded Rounds.
+
+        Returns:
+            int: Number of recorded Rounds.
+        """
+        return self.__rounds
+
+    @property
+    def group_history(self) -> Optional['RoundHistory']:
+        """Return Group visit totals of every recorded Round.
+
+        Returns:
+            Optional[RoundHistory]: Group visit totals, None when Groups are
+            not tracked.
+        """
+        return self.__group_history
+
+    def __len__(self) -> int:
+        """Return number of recorded Rounds.
+
+        Returns:
+            int: Number of recorded Rounds.
+        """
+        return self.__rounds
+
+    def append(self, row: Iterable[int]) -> None:
+        """Record visit counts of a finished Round.
+
+        Args:
+            row (Iterable[int]): Visit count of every Tile in Board order.
+        """
+        offset: int = self.__rounds % self.__chunk_size
+
+        # Current chunk is full (or there is none yet)
+        if offset == 0:
+            self.__chunks.append(
+                np.empty((self.__chunk_size, self.__columns), dtype=np.int64)
+            )
+
+        self.__chunks[-1][offset] = row
+        self.__rounds += 1
+
+        if self.__group_history is not None:
+            self.__group_history.append(
+                self.__chunks[-1][offset] @ self.__membership
+            )
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Record visit counts of many finished Rounds.
+
+        Args:
+            rows (np.ndarray): Visit counts with shape (rounds, columns).
+        """
+        if self.__group_history is not None:
+            self.__group_history.extend(rows @ self.__membership)
+
+        start: int = 0
+
+        while start < len(rows):
+            offset: int = self.__rounds % self.__chunk_size
+
+            if offset == 0:
+                self.__chunks.append(
+                    np.empty(
+                        (self.__chunk_size, self.__columns), dtype=np.int64
+                    )
+                )
+
+            count: int = min(self.__chunk_size - offset, len(rows) - start)
+
+            self.__chunks[-1][offset:offset + count] = rows[start:start + count]
+            self.__rounds += count
+            start += count
+
+    def to_array(self) -> np.ndarray:
+        """Return recorded Rounds as a single matrix.
+
+        Returns:
+            np.ndarray: Visit counts with shape (rounds, columns).
+        """
+        if not self.__chunks:
+            return np.empty((0, self.__columns), dtype=np.int64)
+
+        return np.concatenate(self.__chunks)[:self.__rounds]
+
+    def iter_chunks(self) -> Iterator[np.ndarray]:
+        """Iterate recorded Rounds in consecutive blocks.
+
+        Yields:
+            Iterator[np.ndarray]: Visit counts with shape (block, columns).
+        """
+        for index, chunk in enumerate(self.__chunks):
+            yield chunk[:self.__rounds - index * self.__chunk_size]
+
+    def flush(self) -> None:
+        """Write buffered Rounds to storage, a no-op in memory."""
+
+    def clear(self) -> None:
+        """Forget every recorded Round, Group totals are kept."""
+        self.__chunks = []
+        self.__rounds = 0
@@ -1,16 +1,19 @@
-from typing import Dict, List, Tuple
+import warnings
+from typing import List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-from numpy.random import randint
-from termcolor import colored
 
 from monopoly.board.board import Board
-from monopoly.board.tiles.tile import Tile
 from monopoly.board.tiles.tile_type import TileType
-from monopoly.deck.cards.card import Card
 from monopoly.deck.cards.card_action_types import CardActionType
 from monopoly.deck.deck import Deck
+from monopoly.dice.dice import MAX_ROLL, Dice
+from monopoly.dice.dice_source import DiceSource
+from monopoly.events.event_type import EventType
+from monopoly.events.sinks.event_sink import EventSink
+from monopoly.events.verbosity import Verbosity
+from monopoly.history.round_history import RoundHistory
+from monopoly.rules.rules import Rules
 
 
 class Player:
@@ -20,17 +23,42 @@ class Player:
     Attributes:
         current_position (int): Players current position (Tile index).
         crossed_go_tile (int): Number of times player crossed the 'GO' Tile.
-        roll_history (List[int]): Rolled numbers during the simulation.
+        roll_counts (np.ndarray): Number of rolls indexed by rolled sum.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Player Class."""
+    def __init__(
+        self,
+        verbosity: Verbosity = Verbosity.SILENT,
+        sink: Optional[EventSink] = None,
+        dice: Optional[DiceSource] = None,
+        rules: Optional[Rules] = None
+    ) -> None:
+        """Initialize the Player Class.
+
+        Args:
+            verbosity (Verbosity, optional): Output Verbosity. Defaults to
+            Verbosity.SILENT.
+            sink (Optional[EventSink], optional): Receiver of Trace Events,
+            only used with Verbosity.TRACE. Defaults to None.
+            dice (Optional[DiceSource], optional): Source of Dice Rolls.
+            Defaults to a pair of fair Dice.
+            rules (Optional[Rules], optional): House Rules. Defaults to the
+            standard Rules.
+        """
+        self.__rules: Rules = rules if rules is not None else Rules()
         self.__current_position: int = 0
         self.__doubles: int = 0
-        self.__jail_time: int = 3
+        self.__jail_time: int = self.__rules.jail_time
         self.__crossed_go_tile: int = 0
-        self.__inventory: List[Tuple(Card, Deck)] = []
-        self.__roll_history: List[int] = []
+        self.__inventory: List[Tuple[int, Deck]] = []
+        self.__roll_counts: np.ndarray = np.zeros(MAX_ROLL + 1, dtype=np.int64)
+        self.__dice: DiceSource = dice if dice is not None else Dice()
+
+        # Trace Events are only emitted when a Sink is listening
+        self.__sink: Optional[EventSink] = sink
+        self.__trace: bool = (
+            verbosity == Verbosity.TRACE and sink is not None
+        )
 
     @property
     def current_position(self) -> int:
@@ -51,28 +79,49 @@ class Player:
         return self.__crossed_go_tile
 
     @property
-    def roll_history(self) -> int:
+    def roll_counts(self) -> np.ndarray:
+        """Return number of rolls of the Player.
+
+        Returns:
+            np.ndarray: Number of rolls indexed by rolled sum.
+        """
+        return self.__roll_counts
+
+    @property
+    def roll_history(self) -> List[int]:
         """Return players roll history.
 
+        Deprecated, only roll counts are kept, so the rolls are returned
+        sorted by rolled sum instead of in the order they were rolled. Use
+        roll_counts instead.
+
         Returns:
-            List[int]: Players roll history.
+            List[int]: Players rolls sorted by rolled sum.
         """
-        return self.__roll_history
+        warnings.warn(
+            'Player.roll_history is deprecated, use Player.roll_counts',
+            DeprecationWarning,
+            stacklevel=2
+        )
+
+        return np.repeat(
+            np.arange(len(self.__roll_counts)), self.__roll_counts
+        ).tolist()
 
-    def __add_card_to_inventory(self, card: Card, deck: Deck) -> None:
+    def __add_card_to_inventory(self, index: int, deck: Deck) -> None:
         """Add Card to Player inventory.
 
         Args:
-            card (Card): Drawn Card to Inventory.
+            index (int): Index of the drawn Card in the Cards of the Deck.
             deck (Deck): Deck from which the Card was drawn.
         """
-        self.__inventory.append((card, deck))
+        self.__inventory.append((index, deck))
 
     def __discard_card_from_inventory(self) -> None:
         """Discard Card from Inventory to Discard Pile."""
-        discard: Tuple[Card, Deck] = self.__inventory.pop()
+        index, deck = self.__inventory.pop()
 
-        discard[1].discard_card(discard[0])
+        deck.discard_card_index(index)
 
     def __roll_the_dice(self) -> int:
         """Simulate dice roll.
@@ -80,176 +129,118 @@ class Player:
         Returns:
             int: Sum of rolled numbers.
         """
-        rolled: np.ndarray = randint(1, 7, 2)
+        result, double = self.__dice.roll()
 
-        if rolled[0] == rolled[1]:
-            print(colored(f'Double roll: {(rolled[0], rolled[1])}', 'yellow'))
+        if double:
+            if self.__trace:
+                self.__sink.emit(
+                    (EventType.DOUBLE_ROLL, result // 2, result // 2)
+                )
             self.__doubles += 1
 
         else:
-            if self.__doubles == 3:
+            if self.__doubles == self.__rules.doubles_limit:
                 self.__doubles = 0
-                self.__go_to_jail('3 double rolls')
+                self.__go_to_jail(
+                    f'{self.__rules.doubles_limit} double rolls'
+                )
                 return 0
             else:
                 self.__doubles = 0
 
-        result: int = sum(rolled)
-
-        self.__roll_history.append(result)
+        self.__roll_counts[result] += 1
 
         return result
 
     def __go_to_jail(self, reason: str) -> None:
-        """Display go to Jail message with description.
+        """Send Player to Jail.
 
         Args:
             reason (str): Reason for description.
         """
-        print(
-            colored(
-                f'\n--------- Going to jail for {reason} ---------\n',
-                'red'
-            )
-        )
-        self.__current_position = 10
-
-    def __find_nearest_special_tile(self, tiles: List[int]) -> int:
-        """Find nearest Special Tile.
+        if self.__trace:
+            self.__sink.emit((EventType.GO_TO_JAIL, reason))
 
-        Args:
-            tiles (List[int]): List of Special Tile indices.
-
-        Returns:
-            int: Nearest Special Tile index.
-        """
-        # Indices of Special Tiles after players current position
-        next_special_tiles: List[int] = [
-            tile for tile in tiles if tile > self.__current_position
-        ]
-
-        nearest_special_tile: int = 0
-
-        # Found indices after current position
-        if next_special_tiles:
-            nearest_special_tile = next_special_tiles[0]
-
-        # Nearest index only in the next round
-        else:
-            nearest_special_tile = tiles[0]
-
-        return nearest_special_tile
+        self.__current_position = 10
 
     def __execute_travel_card_action(
         self,
-        drawn_card: Card,
+        kind: int,
         board: Board,
-        stats: Dict[str, int],
-        round_data: pd.DataFrame
-    ) -> pd.DataFrame:
+        visits: np.ndarray,
+        round_history: RoundHistory
+    ) -> None:
         """Execute Travel Card Action.
 
         Args:
+            kind (int): Travel destination code.
             board (Board): Monopoly Board.
-            deck (Deck): Monopoly Card Deck.
-            card_type (str): Card Type.
-            stats (Dict[str, int]): Statistics data.            
-            round_data (pd.DataFrame): Round Visit Data.
-
-        Returns:
-            pd.DataFrame: Updated Round Visit Data.
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
+            round_history (RoundHistory): Round Visit History.
         """
-        destination: str = drawn_card.destination
-
-        if destination == '3 Spaces':
-            self.__current_position -= 3
-
-            if self.__current_position == 31:
-                stats[board.tiles[self.__current_position].label] += 1
-                self.__go_to_jail('stepping on Go To Jail tile')
-
-        else:
-            new_position: int = 0
-
-            if destination in ['Utility', 'Railroad']:
-                new_position = self.__find_nearest_special_tile(
-                    board.utilities if destination == 'Utility' else board.railroads
-                )
-
-            else:
-                new_position = board.map[destination]
-
-            if self.__current_position > new_position \
-                    and destination != 'Jail':
-                round_data = pd.concat(
-                    [
-                        round_data,
-                        pd.Series(stats).rename(f'Round {self.__crossed_go_tile}')
-                    ],
-                    axis=1
-                )
-                self.__crossed_go_tile += 1
+        if board.passes_go[self.__current_position, kind]:
+            round_history.append(visits)
+            self.__crossed_go_tile += 1
 
-            self.__current_position = new_position
+        self.__current_position = int(
+            board.next_tiles[self.__current_position, kind]
+        )
 
-        stats[board.tiles[self.__current_position].label] += 1
+        # 'Go To Jail' Tile
+        if self.__current_position == 31:
+            visits[self.__current_position] += 1
+            self.__go_to_jail('stepping on Go To Jail tile')
 
-        return round_data
+        visits[self.__current_position] += 1
 
     def __execute_card_action(
         self,
         board: Board,
         deck: Deck,
         card_type: str,
-        stats: Dict[str, int],
-        round_data: pd.DataFrame
-    ) -> pd.DataFrame:
+        visits: np.ndarray,
+        round_history: RoundHistory
+    ) -> None:
         """Execute Card Action.
 
         Args:
             board (Board): Monopoly Board.
             deck (Deck): Monopoly Card Deck.
             card_type (str): Card Type.
-            stats (Dict[str, int]): Statistics data.
-            round_data (pd.DataFrame): Round Visit Data.
-
-        Returns:
-            pd.DataFrame: Updated Round Visit Data.
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
+            round_history (RoundHistory): Round Visit History.
         """
-        drawn_card: Card = deck.draw_card()
+        index: int = deck.draw_card_index()
 
-        print(
-            colored(
-                f'\n[{card_type}] - {drawn_card}\n',
-                'cyan' if card_type == 'Chance' else 'blue'
-            )
-        )
+        if self.__trace:
+            self.__sink.emit((EventType.CARD, card_type, deck.cards[index]))
 
-        if drawn_card.card_type == CardActionType.TRAVEL:
-            round_data = self.__execute_travel_card_action(
-                drawn_card=drawn_card,
+        action_code: int = deck.action_codes[index]
+
+        if action_code == CardActionType.TRAVEL.value:
+            self.__execute_travel_card_action(
+                kind=deck.travel_kinds(board)[index],
                 board=board,
-                stats=stats,
-                round_data=round_data
+                visits=visits,
+                round_history=round_history
             )
 
-        elif drawn_card.card_type == CardActionType.GET_OUT_OF_JAIL:
-            self.__add_card_to_inventory(card=drawn_card, deck=deck)
-
-        return round_data
+        elif action_code == CardActionType.GET_OUT_OF_JAIL.value:
+            self.__add_card_to_inventory(index=index, deck=deck)
 
-    def __display_move(self, increment: int, board: Board) -> None:
-        """Display basic stats of movement.
+    def __display_move(self, increment: int) -> None:
+        """Emit basic stats of movement.
 
         Args:
             increment (int): Position increment.
-            board (Board): Monopoly Board.
         """
-        tile: Tile = board.tiles[self.__current_position]
-
-        print(
-            f'Current tile: {[tile.label]} - {tile.name}, Rolled: {increment},'
-            f' Crossed GO: {self.__crossed_go_tile}x'
+        self.__sink.emit(
+            (
+                EventType.MOVE,
+                self.__current_position,
+                increment,
+                self.__crossed_go_tile
+            )
         )
 
     def __regular_round(
@@ -258,9 +249,9 @@ class Player:
             board: Board,
             chances: Deck,
             community_chests: Deck,
-            stats: Dict[str, int],
-            round_data: pd.DataFrame
-    ) -> pd.DataFrame:
+            visits: np.ndarray,
+            round_history: RoundHistory
+    ) -> None:
         """Execute Regular round.
 
         Args:
@@ -268,82 +259,77 @@ class Player:
             board (Board): Monopoly Board.
             chances (Deck): Chance Cards Deck.
             community_chests (Deck): Community Chest Cards Deck.
-            stats (Dict[str, int]): Statistics data.
-            round_data (pd.DataFrame): Round Visit Data.
-
-        Returns:
-            pd.DataFrame: Updated Round Visit Data.
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
+            round_history (RoundHistory): Round Visit History.
         """
         board_length: int = len(board.tiles)
 
         # Update stats
-        self.__display_move(increment, board)
+        if self.__trace:
+            self.__display_move(increment)
+
         self.__current_position += increment
 
         # Crossed 'GO' Tile
         if self.__current_position >= board_length:
-            round_data = pd.concat(
-                [
-                    round_data,
-                    pd.Series(stats).rename(f'Round {self.__crossed_go_tile}')
-                ],
-                axis=1
-            )
+            round_history.append(visits)
             self.__crossed_go_tile += 1
             self.__current_position %= board_length
 
-        # 'Just Visiting Jail' Tile
+        # 'Just Visiting Jail' Tile, otherwise the Player stays in Jail
         if self.__current_position == 10:
-            self.__current_position += 1
+            if self.__rules.just_visiting:
+                self.__current_position += 1
+            else:
+                self.__go_to_jail('stepping on Jail tile')
 
         # 'Go To Jail' Tile
         if self.__current_position == 31:
-            stats[board.tiles[self.__current_position].label] += 1
+            visits[self.__current_position] += 1
             self.__go_to_jail('stepping on Go To Jail tile')
 
-        stats[board.tiles[self.__current_position].label] += 1
+        visits[self.__current_position] += 1
 
         tile_type: TileType = board.tiles[self.__current_position].tile_type
 
         # Draw Card
         if tile_type in [TileType.CHANCE, TileType.COMMUNITY_CHEST]:
             if tile_type == TileType.CHANCE:
-                round_data = self.__execute_card_action(
+                self.__execute_card_action(
                     board=board, 
                     deck=chances, 
                     card_type='Chance', 
-                    stats=stats,
-                    round_data=round_data
+                    visits=visits,
+                    round_history=round_history
                 )
             elif tile_type == TileType.COMMUNITY_CHEST:
-                round_data = self.__execute_card_action(
+                self.__execute_card_action(
                     board=board,
                     deck=community_chests,
                     card_type='Community Chest',
-                    stats=stats,
-                    round_data=round_data
+                    visits=visits,
+                    round_history=round_history
                 )
 
-        return round_data
-
     def __in_jail_round(
         self,
         increment: int,
-        board: Board,
-        stats: Dict[str, int]
+        visits: np.ndarray
     ) -> None:
         """Execute round in Jail.
 
         Args:
             increment (int): Position increment.
-            board (Board): Monopoly Board.
-            stats (Dict[str, int]): Statistics data.
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
         """
-        print(colored(f'[In Jail] - Rolled: {increment}', 'magenta'))
+        if self.__trace:
+            self.__sink.emit((EventType.IN_JAIL, increment))
 
         # Use 'Get Out of Jail' Card from Inventory
         if self.__inventory:
-            print(colored('Used Get Out of Jail Card!', 'green'))
+            if self.__trace:
+                self.__sink.emit((EventType.JAIL_CARD_USED,))
+
             self.__discard_card_from_inventory()
 
         # Try 3x to get out of Jail
@@ -352,14 +338,15 @@ class Player:
                 self.__jail_time -= 1
                 return
 
-        print()
-
         # Escape Jail
-        self.__jail_time = 3
-        self.__display_move(increment, board)
+        self.__jail_time = self.__rules.jail_time
+
+        if self.__trace:
+            self.__display_move(increment)
+
         self.__current_position += increment
 
-        stats[board.tiles[self.__current_position].label] += 1
+        visits[self.__current_position] += 1
 
     def __move(
         self,
@@ -367,9 +354,9 @@ class Player:
         board: Board,
         chances: Deck,
         community_chests: Deck,
-        stats: Dict[str, int],
-        round_data: pd.DataFrame
-    ) -> pd.DataFrame:
+        visits: np.ndarray,
+        round_history: RoundHistory
+    ) -> None:
         """Move Player to new position.
 
         Args:
@@ -377,63 +364,52 @@ class Player:
             board (Board): Monopoly Board.
             chances (Deck): Chance Cards Deck.
             community_chests (Deck): Community Chest Cards Deck.
-            stats (Dict[str, int]): Statistics data.
-            round_data (pd.DataFrame): Round Visit Data.
-
-        Returns:
-            pd.DataFrame: Updated Round Visit Data.
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
+            round_history (RoundHistory): Round Visit History.
         """
         # In Jail
         if self.__current_position == 10:
             self.__in_jail_round(
                 increment=increment,
-                board=board,
-                stats=stats
+                visits=visits
             )
 
         # Not in Jail
         else:
-            round_data = self.__regular_round(
+            self.__regular_round(
                 increment=increment,
                 board=board,
                 chances=chances,
                 community_chests=community_chests,
-                stats=stats,
-                round_data=round_data
+                visits=visits,
+                round_history=round_history
             )
 
-        return round_data
-
     def execute_round(
         self,
         board: Board,
         chances: Deck,
         community_chests: Deck,
-        stats: Dict[str, int],
-        round_data: pd.DataFrame
-    ) -> pd.DataFrame:
+        visits: np.ndarray,
+        round_history: RoundHistory
+    ) -> None:
         """Execute round of Monopoly.
 
         Args:
             board (Board): Monopoly Board.
             chances (Deck): Chance Cards Deck.
             community_chests (Deck): Community Chest Cards Deck.
-            stats (Dict[str, int]): Statistics data.
-            round_data (pd.DataFrame): Round Visit Data.
-
-        Returns:
-            pd.DataFrame: Updated Round Visit Data.
+            visits (np.ndarray): Tile visit counts indexed by Tile position.
+            round_history (RoundHistory): Round Visit History.
         """
         increment: int = self.__roll_the_dice()
 
         if increment != 0:
-            round_data = self.__move(
+            self.__move(
                 increment=increment,
                 board=board,
                 chances=chances,
                 community_chests=community_chests,
-                stats=stats,
-                round_data=round_data
+                visits=visits,
+                round_history=round_history
             )
-
-        return round_data
@@ -0,0 +1,90 @@
+from typing import Any, Dict
+
+# Turns spent in Jail before the Player is released
+JAIL_TIME: int = 3
+
+# Number of consecutive double rolls sending the Player to Jail
+DOUBLES_LIMIT: int = 3
+
+
+class Rules:
+
+    """Monopoly House Rules.
+
+    Attributes:
+        jail_time (int): Turns spent in Jail before the Player is released.
+        doubles_limit (int): Number of consecutive double rolls sending the
+        Player to Jail.
+        just_visiting (bool): Whether a roll ending on the 'Jail' Tile is
+        only visiting, otherwise the Player is locked up.
+    """
+
+    def __init__(
+        self,
+        jail_time: int = JAIL_TIME,
+        doubles_limit: int = DOUBLES_LIMIT,
+        just_visiting: bool = True
+    ) -> None:
+        """Initialize the Rules Class.
+
+        Args:
+            jail_time (int, optional): Turns spent in Jail before the Player
+            is released. Defaults to JAIL_TIME.
+            doubles_limit (int, optional): Number of consecutive double rolls
+            sending the Player to Jail. Defaults to DOUBLES_LIMIT.
+            just_visiting (bool, optional): Whether a roll ending on the
+            'Jail' Tile is only visiting. Defaults to True.
+
+        Raises:
+            ValueError: Negative Jail time or a doubles limit below one.
+        """
+        if jail_time < 0:
+            raise ValueError(f'Jail time must not be negative: {jail_time}')
+
+        if doubles_limit < 1:
+            raise ValueError(
+                f'Doubles limit must be at least 1: {doubles_limit}'
+            )
+
+        self.__jail_time: int = jail_time
+        self.__doubles_limit: int = doubles_limit
+        self.__just_visiting: bool = just_visiting
+
+    @property
+    def jail_time(self) -> int:
+        """Return turns spent in Jail before the Player is released.
+
+        Returns:
+            int: Turns spent in Jail.
+        """
+        return self.__jail_time
+
+    @property
+    def doubles_limit(self) -> int:
+        """Return number of consecutive double rolls sending to Jail.
+
+        Returns:
+            int: Doubles limit.
+        """
+        return self.__doubles_limit
+
+    @property
+    def just_visiting(self) -> bool:
+        """Return whether a roll ending on the 'Jail' Tile is only visiting.
+
+        Returns:
+            bool: Whether the 'Jail' Tile is only visited.
+        """
+        return self.__just_visiting
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return Rules as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Value of every Rule by name.
+        """
+        return {
+            'jail_time': self.__jail_time,
+            'doubles_limit': self.__doubles_limit,
+            'just_visiting': self.__just_visiting
+        }
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+
+# Leading bytes of a Scenario Bundle, followed by the header length
+BUNDLE_MAGIC: bytes = b'MONOPOLY_SCENARIO\x01'
+
+# Bundle sections in order of the source data files
+SECTIONS: Tuple[str, ...] = ('board', 'chances', 'community_chests')
+
+
+def file_digest(file: str) -> str:
+    """Hash file content.
+
+    Args:
+        file (str): File path.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest.
+    """
+    with open(file, 'rb') as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+def write_arrays(
+    file: str,
+    arrays: Dict[str, np.ndarray],
+    metadata: Dict[str, object]
+) -> None:
+    """Write arrays after a JSON header describing them.
+
+    Args:
+        file (str): Output file path.
+        arrays (Dict[str, np.ndarray]): Named arrays.
+        metadata (Dict[str, object]): JSON serializable metadata.
+    """
+    layout: Dict[str, Tuple[str, Tuple[int, ...], int]] = {}
+    offset: int = 0
+
+    for name, array in arrays.items():
+        layout[name] = (array.dtype.str, array.shape, offset)
+        offset += array.nbytes
+
+    header: bytes = json.dumps(
+        {'metadata': metadata, 'arrays': layout}
+    ).encode()
+
+    with open(file, 'wb') as fp:
+        fp.write(BUNDLE_MAGIC)
+        fp.write(len(header).to_bytes(8, 'little'))
+        fp.write(header)
+
+        for array in arrays.values():
+            fp.write(np.ascontiguousarray(array).tobytes())
+
+
+def read_arrays(
+    file: str
+) -> Tuple[Dict[str, np.ndarray], Dict[str, object]]:
+    """Read arrays written by write_arrays with a single file read.
+
+    Args:
+        file (str): Input file path.
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], Dict[str, object]]: Named arrays and
+        metadata.
+
+    Raises:
+        ValueError: When the file is not a Scenario Bundle.
+    """
+    with open(file, 'rb') as fp:
+        content: bytes = fp.read()
+
+    if not content.startswith(BUNDLE_MAGIC):
+        raise ValueError(f'{file} is not a scenario bundle')
+
+    start: int = len(BUNDLE_MAGIC) + 8
+    length: int = int.from_bytes(content[len(BUNDLE_MAGIC):start], 'little')
+    header: Dict[str, dict] = json.loads(content[start:start + length])
+    payload: memoryview = memoryview(content)[start + length:]
+
+    arrays: Dict[str, np.ndarray] = {}
+
+    for name, (dtype, shape, offset) in header['arrays'].items():
+        count: int = math.prod(shape)
+        arrays[name] = np.frombuffer(
+            payload, dtype=dtype, count=count, offset=offset
+        ).reshape(shape)
+
+    return arrays, header['metadata']
+
+
+def compile_scenario(
+    board_data: str,
+    chances_data: str,
+    community_chests_data: str,
+    file: str
+) -> None:
+    """Compile Board and Decks into a single binary Scenario Bundle.
+
+    Args:
+        board_data (str): Board tiles data file path.
+        chances_data (str): Chance tiles data file path.
+        community_chests_data (str): Community Chest tiles data file path.
+        file (str): Output Scenario Bundle path.
+    """
+    sources: List[str] = [board_data, chances_data, community_chests_data]
+    arrays: Dict[str, np.ndarray] = {}
+
+    for section, section_arrays in zip(
+        SECTIONS,
+        [
+            Board(file=board_data).to_arrays(),
+            Deck(file=chances_data).to_arrays(),
+            Deck(file=community_chests_data).to_arrays()
+        ]
+    ):
+        for name, array in section_arrays.items():
+            arrays[f'{section}.{name}'] = array
+
+    write_arrays(
+        file,
+        arrays,
+        {'sources': [file_digest(source) for source in sources]}
+    )
+
+
+def load_scenario(
+    file: str,
+    chances_rng: Optional[np.random.Generator] = None,
+    community_chests_rng: Optional[np.random.Generator] = None,
+    sources: Optional[List[str]] = None
+) -> Tuple[Board, Deck, Deck]:
+    """Load Board and Decks from a Scenario Bundle.
+
+    Args:
+        file (str): Scenario Bundle path.
+        chances_rng (Optional[np.random.Generator], optional): Random
+        Number Generator of the Chance Deck. Defaults to a freshly seeded
+        Generator.
+        community_chests_rng (Optional[np.random.Generator], optional):
+        Random Number Generator of the Community Chest Deck. Defaults to a
+        freshly seeded Generator.
+        sources (Optional[List[str]], optional): Board, Chance and Community
+        Chest data file paths the Bundle must have been compiled from.
+        Defaults to None, when the Bundle is not validated.
+
+    Returns:
+        Tuple[Board, Deck, Deck]: Board, Chance Deck and Community Chest
+        Deck.
+
+    Raises:
+        ValueError: When a source data file changed since compilation.
+    """
+    arrays, metadata = read_arrays(file)
+
+    if sources is not None:
+        for source, digest in zip(sources, metadata['sources']):
+            if file_digest(source) != digest:
+                raise ValueError(
+                    f'Scenario bundle {file} is stale, {source} changed '
+                    f'since it was compiled'
+                )
+
+    sections: Dict[str, Dict[str, np.ndarray]] = {
+        section: {} for section in SECTIONS
+    }
+
+    for name, array in arrays.items():
+        section, key = name.split('.', 1)
+        sections[section][key] = array
+
+    return (
+        Board.from_arrays(sections['board']),
+        Deck.from_arrays(sections['chances'], rng=chances_rng),
+        Deck.from_arrays(sections['community_chests'], rng=community_chests_rng)
+    )
@@ -0,0 +1,50 @@
+import argparse
+import os
+
+from monopoly.scenario.scenario_bundle import compile_scenario
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    data_directory: str = os.path.join(os.getcwd(), 'monopoly', 'data')
+
+    parser = argparse.ArgumentParser(
+        description='Compile a board and its decks into a scenario bundle.'
+    )
+    parser.add_argument(
+        'bundle',
+        help='Output scenario bundle file.'
+    )
+    parser.add_argument(
+        '--board-data',
+        default=os.path.join(data_directory, 'board_data.txt'),
+        help='Board tiles data file.'
+    )
+    parser.add_argument(
+        '--chances-data',
+        default=os.path.join(data_directory, 'chances_data.txt'),
+        help='Chance cards data file.'
+    )
+    parser.add_argument(
+        '--community-chests-data',
+        default=os.path.join(data_directory, 'community_chest_data.txt'),
+        help='Community Chest cards data file.'
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+
+    arguments: argparse.Namespace = parse_arguments()
+
+    compile_scenario(
+        board_data=arguments.board_data,
+        chances_data=arguments.chances_data,
+        community_chests_data=arguments.community_chests_data,
+        file=arguments.bundle
+    )
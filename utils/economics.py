@@ -0,0 +1,143 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+from termcolor import colored
+
+from monopoly.analysis.markov_chain import MarkovChain
+from monopoly.analysis.property_economics import PropertyEconomics
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+from monopoly.engine.engine_type import EngineType
+from monopoly.engine.vectorized_engine import VectorizedEngine
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    data_directory: str = os.path.join(os.getcwd(), 'monopoly', 'data')
+
+    parser = argparse.ArgumentParser(
+        description=(
+            'Compute expected rent income, return on investment and '
+            'break-even turns of every property and group.'
+        )
+    )
+    parser.add_argument(
+        'output',
+        help='Output property table CSV file, the group table is saved next '
+        'to it.'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=[
+            engine.name.lower()
+            for engine in [EngineType.MARKOV, EngineType.VECTORIZED]
+        ],
+        default=EngineType.MARKOV.name.lower(),
+        help='Exact landing probabilities or simulated ones.'
+    )
+    parser.add_argument(
+        '--turns',
+        type=int,
+        default=1000,
+        help='Number of turns of every simulated player.'
+    )
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=1000,
+        help='Number of simulated games.'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed making the simulation reproducible.'
+    )
+    parser.add_argument(
+        '--board-data',
+        default=os.path.join(data_directory, 'board_data.txt'),
+        help='Board tiles data file.'
+    )
+    parser.add_argument(
+        '--chances-data',
+        default=os.path.join(data_directory, 'chances_data.txt'),
+        help='Chance cards data file.'
+    )
+    parser.add_argument(
+        '--community-chests-data',
+        default=os.path.join(data_directory, 'community_chest_data.txt'),
+        help='Community Chest cards data file.'
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+
+    arguments: argparse.Namespace = parse_arguments()
+
+    dice_seed, chances_seed, community_chests_seed = (
+        np.random.SeedSequence(arguments.seed).spawn(3)
+    )
+
+    board: Board = Board(file=arguments.board_data)
+    chances: Deck = Deck(
+        file=arguments.chances_data,
+        rng=np.random.default_rng(chances_seed)
+    )
+    community_chests: Deck = Deck(
+        file=arguments.community_chests_data,
+        rng=np.random.default_rng(community_chests_seed)
+    )
+
+    # Expected landings on every Tile per opponent turn
+    match EngineType[arguments.engine.upper()]:
+
+        case EngineType.MARKOV:
+            landings: np.ndarray = MarkovChain(
+                board=board,
+                chances=chances,
+                community_chests=community_chests
+            ).visits_per_turn
+
+        case EngineType.VECTORIZED:
+            engine: VectorizedEngine = VectorizedEngine(
+                board=board,
+                chances=chances,
+                community_chests=community_chests,
+                games=arguments.games,
+                rng=np.random.default_rng(dice_seed)
+            )
+
+            engine.run_turns(arguments.turns)
+            landings = engine.visits / (arguments.turns * arguments.games)
+
+    economics: PropertyEconomics = PropertyEconomics(board, landings)
+
+    pd.DataFrame(economics.tile_summary).to_csv(
+        arguments.output, sep=';', index=False
+    )
+
+    groups: pd.DataFrame = pd.DataFrame(economics.group_summary)
+    groups.to_csv(
+        f'{os.path.splitext(arguments.output)[0]}_groups.csv',
+        sep=';',
+        index=False
+    )
+
+    best: pd.Series = groups.loc[groups['return_on_investment'].idxmax()]
+
+    print(
+        colored(
+            f'Economics finished - Best Group: {best["name"]} '
+            f'({best["level"]}), '
+            f'Break-even: {best["break_even_turns"]:.1f} opponent turns',
+            'green'
+        )
+    )
@@ -0,0 +1,156 @@
+import argparse
+import os
+from typing import Dict, List
+
+import numpy as np
+from termcolor import colored
+
+from game_statistics.occupancy import (
+    occupancy_grids,
+    occupancy_table,
+    total_variation,
+    transient_occupancy
+)
+from game_statistics.plot_mode import PlotMode
+from game_statistics.plots import build_occupancy_heatmap, render_plot
+from game_statistics.report import load_tile_grid
+from monopoly.board.board import Board
+from monopoly.deck.deck import Deck
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    data_directory: str = os.path.join(os.getcwd(), 'monopoly', 'data')
+
+    parser = argparse.ArgumentParser(
+        description=(
+            'Compare where the players stand after each of the first turns, '
+            'exactly and simulated.'
+        )
+    )
+    parser.add_argument(
+        'output',
+        help='Output occupancy table CSV file, the heatmap is saved next to '
+        'it.'
+    )
+    parser.add_argument(
+        '--turns',
+        type=int,
+        default=50,
+        help='Number of turns.'
+    )
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=10000,
+        help='Number of simulated games.'
+    )
+    parser.add_argument(
+        '--players',
+        type=int,
+        default=1,
+        help='Number of players sharing the decks of every simulated game.'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed making the simulation reproducible.'
+    )
+    parser.add_argument(
+        '--plots',
+        choices=[plot_mode.name.lower() for plot_mode in PlotMode],
+        default=PlotMode.INTERACTIVE.name.lower(),
+        help='Show the heatmap, only save it (headless) or skip it.'
+    )
+    parser.add_argument(
+        '--board-data',
+        default=os.path.join(data_directory, 'board_data.txt'),
+        help='Board tiles data file.'
+    )
+    parser.add_argument(
+        '--chances-data',
+        default=os.path.join(data_directory, 'chances_data.txt'),
+        help='Chance cards data file.'
+    )
+    parser.add_argument(
+        '--community-chests-data',
+        default=os.path.join(data_directory, 'community_chest_data.txt'),
+        help='Community Chest cards data file.'
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+
+    arguments: argparse.Namespace = parse_arguments()
+
+    dice_seed, chances_seed, community_chests_seed = (
+        np.random.SeedSequence(arguments.seed).spawn(3)
+    )
+
+    board: Board = Board(file=arguments.board_data)
+    labels: List[str] = [tile.label for tile in board.tiles]
+
+    occupancy: Dict[str, np.ndarray] = transient_occupancy(
+        board=board,
+        chances=Deck(
+            file=arguments.chances_data,
+            rng=np.random.default_rng(chances_seed)
+        ),
+        community_chests=Deck(
+            file=arguments.community_chests_data,
+            rng=np.random.default_rng(community_chests_seed)
+        ),
+        turns=arguments.turns,
+        games=arguments.games,
+        players=arguments.players,
+        rng=np.random.default_rng(dice_seed)
+    )
+
+    occupancy_table(occupancy, labels).to_csv(arguments.output, sep=';')
+
+    plot_mode: PlotMode = PlotMode[arguments.plots.upper()]
+
+    if plot_mode != PlotMode.NONE:
+        data, names = occupancy_grids(
+            occupancy,
+            labels,
+            *load_tile_grid(
+                os.path.join(
+                    os.getcwd(), 'game_statistics', 'data', 'tile_mapping.csv'
+                )
+            )
+        )
+
+        render_plot(
+            build_occupancy_heatmap,
+            {
+                'data': data,
+                'labels': names,
+                'sources': ['Markov Chain', 'Simulation'],
+                'subject': (
+                    f'{arguments.games} Games of {arguments.players} Players'
+                    if arguments.players > 1
+                    else f'{arguments.games} Games'
+                )
+            },
+            f'{os.path.splitext(arguments.output)[0]}_heatmap.html',
+            show=plot_mode == PlotMode.INTERACTIVE
+        )
+
+    distances: np.ndarray = total_variation(occupancy)
+
+    print(
+        colored(
+            f'Occupancy finished - Turns: {arguments.turns}, '
+            f'Largest total variation: {distances.max():.4f} '
+            f'(Turn {distances.argmax()})',
+            'green'
+        )
+    )
@@ -0,0 +1,161 @@
+import argparse
+import os
+from typing import Any, Dict, List
+
+from termcolor import colored
+
+from game_statistics.sweep import Sweep, default_parameters
+from monopoly.engine.engine_type import EngineType
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments.
+    """
+    defaults: Dict[str, Any] = default_parameters()
+
+    parser = argparse.ArgumentParser(
+        description=(
+            'Compare landing probabilities of house rule and deck variants.'
+        )
+    )
+    parser.add_argument(
+        'output',
+        help='Output comparison table CSV file.'
+    )
+    parser.add_argument(
+        '--board-data',
+        nargs='+',
+        default=[defaults['board_data']],
+        help='Board tiles data files.'
+    )
+    parser.add_argument(
+        '--chances-data',
+        nargs='+',
+        default=[defaults['chances_data']],
+        help='Chance cards data files.'
+    )
+    parser.add_argument(
+        '--community-chests-data',
+        nargs='+',
+        default=[defaults['community_chests_data']],
+        help='Community Chest cards data files.'
+    )
+    parser.add_argument(
+        '--jail-time',
+        type=int,
+        nargs='+',
+        default=[defaults['jail_time']],
+        help='Turns spent in jail before the player is released.'
+    )
+    parser.add_argument(
+        '--doubles-limit',
+        type=int,
+        nargs='+',
+        default=[defaults['doubles_limit']],
+        help='Number of consecutive double rolls sending to jail.'
+    )
+    parser.add_argument(
+        '--just-visiting',
+        nargs='+',
+        choices=['yes', 'no'],
+        default=['yes' if defaults['just_visiting'] else 'no'],
+        help='Whether a roll ending on the jail tile is only visiting.'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=[engine.name.lower() for engine in EngineType],
+        default=EngineType.VECTORIZED.name.lower(),
+        help='Simulation engine of every variant.'
+    )
+    parser.add_argument(
+        '--rounds',
+        type=int,
+        default=1000,
+        help='Number of rounds (Crossing the GO tile) of every variant.'
+    )
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=100,
+        help='Number of games of every variant of the vectorized engine.'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes, defaults to the number of CPUs.'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed making the whole sweep reproducible.'
+    )
+    parser.add_argument(
+        '--replicates',
+        type=int,
+        default=1,
+        help='Independent replicates of every variant, 2 or more add a '
+        'table of differences to the baseline with confidence intervals.'
+    )
+    parser.add_argument(
+        '--paired',
+        action='store_true',
+        help='Replay the same dice and deck streams in every variant.'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=int,
+        default=0,
+        help='Index of the variant the others are compared to.'
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+
+    arguments: argparse.Namespace = parse_arguments()
+
+    grid: Dict[str, List[Any]] = {
+        'board_data': arguments.board_data,
+        'chances_data': arguments.chances_data,
+        'community_chests_data': arguments.community_chests_data,
+        'jail_time': arguments.jail_time,
+        'doubles_limit': arguments.doubles_limit,
+        'just_visiting': [
+            just_visiting == 'yes' for just_visiting in arguments.just_visiting
+        ]
+    }
+
+    sweep: Sweep = Sweep(
+        grid=grid,
+        engine=EngineType[arguments.engine.upper()],
+        rounds=arguments.rounds,
+        games=arguments.games,
+        workers=arguments.workers,
+        seed=arguments.seed,
+        replicates=arguments.replicates,
+        paired=arguments.paired
+    )
+
+    sweep.run().to_csv(arguments.output, sep=';', index=False)
+
+    # Differences to the baseline next to the comparison table
+    if sweep.replicates > 1:
+        sweep.differences(baseline=arguments.baseline).to_csv(
+            f'{os.path.splitext(arguments.output)[0]}_differences.csv',
+            sep=';',
+            index=False
+        )
+
+    print(
+        colored(
+            f'Sweep finished - {len(sweep.variants)} Variants, '
+            f'Workers: {sweep.workers}',
+            'green'
+        )
+    )